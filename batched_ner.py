@@ -0,0 +1,226 @@
+"""
+Batched clinical NER inference.
+Groups prescription texts into length buckets so each transformer batch is
+padded only to its own longest text, and exposes a shared micro-batching
+queue so concurrent single-text callers are served in batches.
+"""
+
+import logging
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+from micro_batching import MicroBatcher
+
+try:
+    import torch
+    TORCH_AVAILABLE = True
+except ImportError:
+    TORCH_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+def find_token_classifier(ner_extractor) -> Tuple[Any, Any]:
+    """
+    The Hugging Face tokenizer and token-classification model an extractor uses.
+
+    Looks through the extractor's attributes (and those of a transformers
+    pipeline it holds) the same way onnx_backend.accelerate_ner does.
+
+    Returns:
+        (tokenizer, model), or (None, None) for rule-based extractors
+    """
+    if not TORCH_AVAILABLE:
+        return None, None
+    candidates = list(getattr(ner_extractor, '__dict__', {}).values())
+    for value in list(candidates):
+        if hasattr(value, 'model') and hasattr(value, 'tokenizer'):
+            candidates += [value.model, value.tokenizer]
+
+    tokenizer = model = None
+    for value in candidates:
+        if model is None and isinstance(value, torch.nn.Module) and hasattr(value, 'config'):
+            model = value
+        elif tokenizer is None and callable(value) and hasattr(value, 'pad_token_id'):
+            tokenizer = value
+    if tokenizer is None or model is None:
+        return None, None
+    return tokenizer, model
+
+
+class PrefetchedTokenLogits:
+    """
+    Serves per-text forward calls of a token classifier from one padded batch.
+
+    Installed in place of the model's ``forward``. ``prefetch`` tokenizes a
+    bucket of texts with padding, runs the model once and keeps each
+    text's unpadded logits; while they are held, a single-text forward
+    whose ``input_ids`` match one of them returns those logits instead of
+    running the model. The extractor's own tokenization, label decoding
+    and entity building are untouched, so results match unbatched calls.
+    Anything else runs the original forward. Prefetched logits are per
+    thread.
+    """
+
+    def __init__(self, model, tokenizer):
+        """
+        Initialize and install the wrapper.
+
+        Args:
+            model: Token-classification model (PyTorch or ONNX Runtime forward)
+            tokenizer: The model's tokenizer
+        """
+        self.tokenizer = tokenizer
+        self.forward = model.forward
+        self._local = threading.local()
+        model.forward = self
+
+    def prefetch(self, texts: List[str]):
+        """Run the model once over texts (padded to the longest) and hold the logits."""
+        encoded = self.tokenizer(texts, padding=True, truncation=True, return_tensors='pt')
+        output = self.forward(**encoded)
+        logits = output.logits if hasattr(output, 'logits') else output[0]
+
+        cache = {}
+        for i, mask in enumerate(encoded['attention_mask'].bool()):
+            cache[tuple(encoded['input_ids'][i][mask].tolist())] = logits[i:i + 1, mask]
+        self._local.cache = cache
+        self._local.output_type = type(output) if hasattr(output, 'logits') else None
+
+    def clear(self):
+        """Drop the held logits."""
+        self._local.cache = {}
+
+    def _cached(self, args, kwargs):
+        cache = getattr(self._local, 'cache', None)
+        input_ids = kwargs.get('input_ids', args[0] if args else None)
+        attention_mask = kwargs.get('attention_mask')
+        if not cache or not isinstance(input_ids, torch.Tensor) or input_ids.dim() != 2:
+            return None
+        if input_ids.shape[0] != 1 or (attention_mask is not None and not bool(attention_mask.all())):
+            return None
+        return cache.get(tuple(input_ids[0].tolist()))
+
+    def __call__(self, *args, **kwargs):
+        logits = self._cached(args, kwargs)
+        if logits is None:
+            return self.forward(*args, **kwargs)
+        output_type = self._local.output_type
+        if output_type is None or kwargs.get('return_dict') is False:
+            return (logits,)
+        return output_type(logits=logits)
+
+
+class BatchedNERExtractor:
+    """
+    Batch front-end for NERExtractor (ClinicalBERT/BioBERT).
+
+    ``extract_entities_batch`` sorts texts by length and splits them into
+    buckets of ``batch_size``. Each bucket is passed to the extractor's own
+    ``extract_entities_batch`` when it has one. Otherwise, if the extractor
+    holds a Hugging Face tokenizer and token classifier, the bucket is
+    tokenized with padding and run through the model in one forward pass
+    (see PrefetchedTokenLogits) before the extractor decodes each text.
+    Rule-based extractors are called per text. With ``micro_batching`` on,
+    ``extract_entities`` goes through a MicroBatcher so requests arriving
+    together from API workers or batch jobs share a forward pass.
+
+    Micro-batching is off by default: it adds up to ``max_wait_ms`` to
+    every call and only pays off under concurrent load.
+    """
+
+    def __init__(self, ner_extractor, batch_size: int = 16, max_wait_ms: float = 10.0,
+                 micro_batching: bool = False):
+        """
+        Initialize the batched extractor.
+
+        Args:
+            ner_extractor: Loaded NERExtractor
+            batch_size: Maximum texts per transformer call
+            max_wait_ms: How long a single request waits to be batched with others
+            micro_batching: Queue single-text calls so concurrent callers share batches
+        """
+        self.ner_extractor = ner_extractor
+        self.batch_size = batch_size
+        self._batcher = None
+        self._prefetch = None
+        if not hasattr(ner_extractor, 'extract_entities_batch'):
+            tokenizer, model = find_token_classifier(ner_extractor)
+            if model is not None:
+                self._prefetch = PrefetchedTokenLogits(model, tokenizer)
+            elif micro_batching:
+                logger.warning("NER extractor has no transformer or extract_entities_batch; "
+                               "micro-batching will serialize calls without batching them")
+        if micro_batching:
+            self._batcher = MicroBatcher(
+                self.extract_entities_batch,
+                max_batch_size=batch_size,
+                max_wait_ms=max_wait_ms,
+                name="ner-batcher"
+            )
+
+    @property
+    def thread_safe(self) -> bool:
+        """Single-text calls are safe to make concurrently when they go through the batcher thread."""
+        return self._batcher is not None
+
+    def _run_bucket(self, texts: List[str]) -> List[List]:
+        batch_extract = getattr(self.ner_extractor, 'extract_entities_batch', None)
+        if batch_extract is not None:
+            return batch_extract(texts)
+        if self._prefetch is None or len(texts) == 1:
+            return [self.ner_extractor.extract_entities(text) for text in texts]
+
+        self._prefetch.prefetch(texts)
+        try:
+            return [self.ner_extractor.extract_entities(text) for text in texts]
+        finally:
+            self._prefetch.clear()
+
+    def extract_entities_batch(self, texts: List[str]) -> List[List]:
+        """
+        Extract entities for many texts at once.
+
+        Args:
+            texts: Prescription texts
+
+        Returns:
+            One entity list per text, in input order
+        """
+        if not texts:
+            return []
+
+        # Length bucketing keeps padding within each batch to a minimum
+        order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+        results: List[Optional[List]] = [None] * len(texts)
+
+        for start in range(0, len(order), self.batch_size):
+            bucket = order[start:start + self.batch_size]
+            if TORCH_AVAILABLE:
+                with torch.inference_mode():
+                    entities = self._run_bucket([texts[i] for i in bucket])
+            else:
+                entities = self._run_bucket([texts[i] for i in bucket])
+            for i, text_entities in zip(bucket, entities):
+                results[i] = text_entities
+
+        return results
+
+    def extract_entities(self, text: str) -> List:
+        """Extract entities for one text via the shared micro-batching queue."""
+        if self._batcher is None:
+            return self.extract_entities_batch([text])[0]
+        return self._batcher.process(text)
+
+    def get_statistics(self) -> Dict[str, float]:
+        """Micro-batching statistics (empty when micro-batching is off)."""
+        return self._batcher.get_statistics() if self._batcher else {}
+
+    def shutdown(self):
+        """Stop the micro-batching worker."""
+        if self._batcher is not None:
+            self._batcher.shutdown()
+
+    def __getattr__(self, name: str):
+        # group_entities_into_medications and friends come from the wrapped extractor
+        return getattr(self.ner_extractor, name)
@@ -0,0 +1,180 @@
+"""
+Batched pill classification.
+Image decoding and preprocessing stay on the calling threads, while a shared
+micro-batcher stacks concurrent requests into one EfficientNet forward pass
+through the shape, color and imprint heads.
+"""
+
+import asyncio
+import logging
+from typing import Any, Dict, List
+
+import numpy as np
+import torch
+from PIL import Image
+
+from micro_batching import MicroBatcher
+
+# ImageNet statistics used by the EfficientNet backbone
+IMAGENET_MEAN = np.array([0.485, 0.456, 0.406], dtype=np.float32)
+IMAGENET_STD = np.array([0.229, 0.224, 0.225], dtype=np.float32)
+
+HEADS = ('shape', 'color', 'imprint')
+
+logger = logging.getLogger(__name__)
+
+
+def summarize_heads(predictions: Dict) -> Dict[str, Dict]:
+    """
+    Top class and confidence per head of a single-image prediction.
+
+    Args:
+        predictions: PillClassifier.predict output with ``{head}_probs`` entries
+
+    Returns:
+        ``{'shape': {'class_id', 'confidence'}, 'color': ..., 'imprint': ...}``
+    """
+    summary = {}
+    for head in HEADS:
+        probs = predictions.get(f'{head}_probs')
+        if probs is None:
+            continue
+        confidence, class_id = torch.as_tensor(probs).reshape(-1, probs.shape[-1])[0].max(dim=0)
+        summary[head] = {'class_id': int(class_id), 'confidence': float(confidence)}
+    return summary
+
+
+def preprocess_image(image: Any, image_size: int = 224) -> torch.Tensor:
+    """
+    Convert an image path or PIL image into a normalized (3, H, W) tensor.
+
+    Fallback for classifiers without their own ``transform``; also used to
+    build calibration and benchmark inputs.
+
+    Args:
+        image: Path, PIL image or an already preprocessed (3, H, W) tensor
+        image_size: Square side length the image is resized to
+    """
+    if isinstance(image, torch.Tensor):
+        return image
+    if not isinstance(image, Image.Image):
+        image = Image.open(image)
+
+    image = image.convert('RGB').resize((image_size, image_size), Image.BILINEAR)
+    array = (np.asarray(image, dtype=np.float32) / 255.0 - IMAGENET_MEAN) / IMAGENET_STD
+    return torch.from_numpy(array.transpose(2, 0, 1).copy())
+
+
+class BatchedPillClassifier:
+    """
+    Micro-batching front-end for PillClassifier.
+
+    ``predict`` accepts an image path, PIL image or a single (3, H, W)
+    tensor, preprocesses it with the classifier's own ``transform`` and
+    returns what ``PillClassifier.predict(..., return_probabilities=True)``
+    returns for a one-image batch (``{head}_probs`` and ``{head}_pred``;
+    see summarize_heads). Requests arriving within ``max_wait_ms`` of each
+    other (up to ``batch_size``) share one ``PillClassifier.predict`` call
+    per input size under ``torch.inference_mode``. Batched (4D) tensors
+    and calls with other keyword arguments go straight to the classifier,
+    and other attributes are delegated to it.
+    """
+
+    def __init__(self, pill_classifier, batch_size: int = 16, max_wait_ms: float = 10.0,
+                 image_size: int = None):
+        """
+        Initialize the batched classifier.
+
+        Args:
+            pill_classifier: Loaded PillClassifier
+            batch_size: Maximum images per forward pass
+            max_wait_ms: How long a single request waits to be batched with others
+            image_size: Square input size when the classifier has no transform
+                (defaults to the classifier's input_size, else 224)
+        """
+        self.pill_classifier = pill_classifier
+        self.batch_size = batch_size
+        self.image_size = image_size or getattr(pill_classifier, 'input_size', 224)
+        self.transform = getattr(pill_classifier, 'transform', None)
+        if self.transform is None:
+            logger.warning("Pill classifier has no transform; using ImageNet resize/normalize")
+        self._batcher = MicroBatcher(
+            self.predict_batch,
+            max_batch_size=batch_size,
+            max_wait_ms=max_wait_ms,
+            name="pill-batcher"
+        )
+
+    def preprocess(self, image: Any) -> torch.Tensor:
+        """Convert an image path or PIL image into the classifier's (3, H, W) input."""
+        if isinstance(image, torch.Tensor) or self.transform is None:
+            return preprocess_image(image, self.image_size)
+        if not isinstance(image, Image.Image):
+            image = Image.open(image)
+        return self.transform(image.convert('RGB'))
+
+    def predict_batch(self, images: List[torch.Tensor]) -> List[Dict]:
+        """
+        Classify preprocessed images in one forward pass.
+
+        Images of different sizes (e.g. tensors preprocessed by the caller)
+        are stacked into one forward pass per size.
+
+        Args:
+            images: (3, H, W) tensors
+
+        Returns:
+            One PillClassifier.predict output per image (each a batch of one), in input order
+        """
+        device = getattr(self.pill_classifier, 'device', 'cpu')
+        groups: Dict[tuple, List[int]] = {}
+        for index, image in enumerate(images):
+            groups.setdefault(tuple(image.shape), []).append(index)
+
+        results: List[Dict] = [None] * len(images)
+        for indices in groups.values():
+            batch = torch.stack([images[i] for i in indices]).to(device)
+            with torch.inference_mode():
+                predictions = self.pill_classifier.predict(batch, return_probabilities=True)
+            for position, index in enumerate(indices):
+                results[index] = {key: value[position:position + 1]
+                                  for key, value in predictions.items()}
+        return results
+
+    def predict(self, image: Any, **kwargs) -> Any:
+        """
+        Classify one pill image (batched with concurrent callers).
+
+        Args:
+            image: Path, PIL image or (3, H, W) tensor; 4D tensors bypass batching
+            **kwargs: PillClassifier.predict options; anything other than
+                ``return_probabilities=True`` bypasses batching
+
+        Returns:
+            PillClassifier.predict output for the image
+        """
+        if isinstance(image, torch.Tensor) and image.dim() == 4:
+            with torch.inference_mode():
+                return self.pill_classifier.predict(image, **kwargs)
+        if kwargs and kwargs != {'return_probabilities': True}:
+            batch = self.preprocess(image).unsqueeze(0)
+            with torch.inference_mode():
+                return self.pill_classifier.predict(batch, **kwargs)
+        return self._batcher.process(self.preprocess(image))
+
+    async def predict_async(self, image: Any) -> Dict:
+        """Classify one pill image from an event loop without blocking it."""
+        loop = asyncio.get_running_loop()
+        tensor = await loop.run_in_executor(None, self.preprocess, image)
+        return await self._batcher.process_async(tensor)
+
+    def get_statistics(self) -> Dict[str, float]:
+        """Micro-batching statistics."""
+        return self._batcher.get_statistics()
+
+    def shutdown(self):
+        """Stop the micro-batching worker."""
+        self._batcher.shutdown()
+
+    def __getattr__(self, name: str):
+        return getattr(self.pill_classifier, name)
@@ -0,0 +1,162 @@
+"""
+Single-pass prescription pattern extraction.
+All pattern categories (dosage, frequency, route, duration, instructions)
+are compiled into one alternation of named groups, so each text is scanned
+once instead of once per category.
+"""
+
+import re
+from typing import Dict, List, Optional
+
+
+DOSAGE_UNITS = (
+    r"mg|mcg|µg|g|ml|mL|units?|iu|IU|tablets?|tabs?|capsules?|caps?|puffs?|drops?|sprays?|patch(?:es)?"
+)
+
+FREQUENCY_ABBREVIATIONS = {
+    'qd': 'Once daily',
+    'od': 'Once daily',
+    'bid': 'Twice daily',
+    'tid': 'Three times daily',
+    'qid': 'Four times daily',
+    'qhs': 'At bedtime',
+    'hs': 'At bedtime',
+    'prn': 'As needed',
+    'stat': 'Immediately',
+}
+
+ROUTES = {
+    'oral': 'Oral', 'orally': 'Oral', 'by mouth': 'Oral', 'po': 'Oral',
+    'iv': 'IV', 'intravenous': 'IV', 'intravenously': 'IV',
+    'im': 'IM', 'intramuscular': 'IM', 'intramuscularly': 'IM',
+    'sc': 'SC', 'subq': 'SC', 'subcutaneous': 'SC', 'subcutaneously': 'SC',
+    'topical': 'Topical', 'topically': 'Topical',
+    'rectal': 'Rectal', 'rectally': 'Rectal',
+    'nasal': 'Nasal', 'nasally': 'Nasal', 'intranasal': 'Nasal',
+    'inhale': 'Inhaled', 'inhaled': 'Inhaled', 'inhalation': 'Inhaled',
+    'sublingual': 'Sublingual', 'sublingually': 'Sublingual',
+}
+
+# Category order decides which alternative wins when two start at the same offset
+PATTERNS = {
+    'dosage': (
+        rf"\b(?P<dose_value>\d+(?:\.\d+)?)\s*(?P<dose_unit>{DOSAGE_UNITS})\b"
+    ),
+    'frequency': (
+        r"\b(?:(?:once|twice|three\s+times|four\s+times|[1-4]\s*(?:x|times))\s+(?:a\s+|per\s+)?(?:daily|day)"
+        r"|every\s+\d+(?:\s*-\s*\d+)?\s*(?:hours?|hrs?|h)\b"
+        r"|every\s+(?:morning|evening|night|other\s+day)"
+        r"|as\s+needed|at\s+bedtime|daily|nightly"
+        r"|q\s*\d+\s*h\b"
+        r"|(?-i:QD|OD|BID|TID|QID|QHS|HS|PRN|STAT|qd|bid|tid|qid|qhs|prn)\b)"
+    ),
+    'route': (
+        r"\b(?:orally|oral|by\s+mouth|intravenously|intravenous|intramuscularly|intramuscular"
+        r"|subcutaneously|subcutaneous|subq|topically|topical|rectally|rectal|intranasal|nasally|nasal"
+        r"|inhalation|inhaled|inhale|sublingually|sublingual|(?-i:PO|IV|IM|SC|po))\b"
+    ),
+    'duration': (
+        r"(?:\bfor\s+|\bx\s*)?\b\d+\s*(?:days?|weeks?|months?)\b"
+    ),
+    'instruction': (
+        r"\b(?:with\s+(?:food|meals?|water|milk)|on\s+(?:an\s+)?empty\s+stomach"
+        r"|(?:before|after)\s+(?:meals?|food|breakfast|dinner)|as\s+directed"
+        r"|do\s+not\s+(?:crush|chew)|avoid\s+alcohol|shake\s+well)\b"
+    ),
+}
+
+COMBINED_PATTERN = re.compile(
+    "|".join(f"(?P<{name}>{pattern})" for name, pattern in PATTERNS.items()),
+    re.IGNORECASE
+)
+
+
+def _normalize_frequency(text: str) -> str:
+    compact = " ".join(text.split())
+    abbreviation = FREQUENCY_ABBREVIATIONS.get(compact.lower())
+    if abbreviation:
+        return abbreviation
+    match = re.fullmatch(r"q\s*(\d+)\s*h", compact, re.IGNORECASE)
+    if match:
+        return f"Every {match.group(1)} hours"
+    return compact[0].upper() + compact[1:].lower()
+
+
+class CompiledPatternMatcher:
+    """
+    Drop-in replacement for PatternMatcher.extract_all.
+
+    The combined regex is compiled once at import time and shared by every
+    instance, and ``extract_all`` walks the text a single time, routing each
+    match to its category by group name.
+    """
+
+    def __init__(self, pattern: Optional[re.Pattern] = None):
+        """
+        Initialize the matcher.
+
+        Args:
+            pattern: Combined pattern to use (defaults to COMBINED_PATTERN)
+        """
+        self.pattern = pattern or COMBINED_PATTERN
+
+    def extract_all(self, text: str) -> Dict:
+        """
+        Extract all structured fields from prescription text.
+
+        Args:
+            text: Prescription text
+
+        Returns:
+            Dictionary with dosages, frequency, route, duration,
+            instructions and quantity (always None, as in PatternMatcher's
+            documented output)
+        """
+        extracted = {
+            'dosages': [],
+            'frequency': None,
+            'route': None,
+            'duration': None,
+            'instructions': [],
+            'quantity': None
+        }
+        if not text:
+            return extracted
+
+        for match in self.pattern.finditer(text):
+            category = match.lastgroup
+            matched = match.group(category)
+
+            if category == 'dosage':
+                extracted['dosages'].append({
+                    'value': match.group('dose_value'),
+                    'unit': match.group('dose_unit'),
+                    'full_text': matched,
+                    'position': match.start()
+                })
+            elif category == 'frequency':
+                if extracted['frequency'] is None:
+                    extracted['frequency'] = _normalize_frequency(matched)
+            elif category == 'route':
+                if extracted['route'] is None:
+                    extracted['route'] = ROUTES.get(" ".join(matched.lower().split()), matched)
+            elif category == 'duration':
+                if extracted['duration'] is None:
+                    extracted['duration'] = matched
+            elif category == 'instruction':
+                if matched.lower() not in (i.lower() for i in extracted['instructions']):
+                    extracted['instructions'].append(matched)
+
+        return extracted
+
+    def extract_all_batch(self, texts: List[str]) -> List[Dict]:
+        """
+        Extract structured fields from many texts.
+
+        Args:
+            texts: Prescription texts
+
+        Returns:
+            One extraction dictionary per text, in input order
+        """
+        return [self.extract_all(text) for text in texts]
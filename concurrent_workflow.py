@@ -0,0 +1,127 @@
+"""
+Concurrent execution mode for the unified medication verification workflow.
+Starts prescription OCR, pill classification and intake video analysis in
+parallel, then lets the workflow's own fusion step consume the results.
+"""
+
+import copy
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class _Prefetch:
+    """A component call that was started ahead of time."""
+
+    def __init__(self, method: str, path: str, future: Future):
+        self.method = method
+        self.path = path
+        self.future = future
+
+
+class PrefetchedComponent:
+    """
+    Proxy for a workflow component that answers prefetched calls from a future.
+
+    When the workflow calls ``method(path, ...)`` and that call was already
+    started in the background, the proxy waits on the background result
+    instead of running the model again. Every other attribute and call is
+    passed straight through to the wrapped component.
+    """
+
+    def __init__(self, component: Any, prefetch: _Prefetch):
+        self._component = component
+        self._prefetch = prefetch
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._component, name)
+        prefetch = self._prefetch
+        if prefetch is None or name != prefetch.method or not callable(attr):
+            return attr
+
+        def call(*args, **kwargs):
+            requested = [str(v) for v in list(args) + list(kwargs.values())]
+            if self._prefetch is not None and prefetch.path in requested:
+                # Each prefetched result is handed out once
+                self._prefetch = None
+                return prefetch.future.result()
+            return attr(*args, **kwargs)
+
+        return call
+
+
+class ConcurrentVerificationRunner:
+    """
+    Runs MedicationVerificationWorkflow with its three components in parallel.
+
+    The prescription, pill and intake inputs are independent, so their
+    component calls are started together on a thread pool. The workflow then
+    runs unchanged on a shallow copy whose components are PrefetchedComponent
+    proxies, so its fusion logic, error handling and result format are
+    preserved while end-to-end latency becomes that of the slowest component.
+    """
+
+    # (workflow attribute, method the workflow calls on it)
+    COMPONENT_CALLS = {
+        'prescription': ('prescription_digitizer', 'process_prescription'),
+        'pill': ('pill_classifier', 'predict'),
+        'intake': ('intake_verifier', 'verify_video'),
+    }
+
+    def __init__(self, workflow: Any, max_workers: int = 6):
+        """
+        Initialize the runner.
+
+        Args:
+            workflow: A loaded MedicationVerificationWorkflow
+            max_workers: Threads shared by all in-flight component calls
+        """
+        self.workflow = workflow
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="component"
+        )
+
+    def process_medication_verification(
+        self,
+        patient_id: str,
+        prescription_image_path: str,
+        pill_image_path: Optional[str] = None,
+        intake_video_path: Optional[str] = None,
+        **kwargs
+    ):
+        """
+        Same contract as MedicationVerificationWorkflow.process_medication_verification,
+        with the component stages executed concurrently.
+        """
+        inputs = {
+            'prescription': prescription_image_path,
+            'pill': pill_image_path,
+            'intake': intake_video_path,
+        }
+
+        view = copy.copy(self.workflow)
+        for key, path in inputs.items():
+            attribute, method = self.COMPONENT_CALLS[key]
+            component = getattr(self.workflow, attribute, None)
+            if path is None or component is None:
+                continue
+
+            future = self._executor.submit(getattr(component, method), str(path))
+            setattr(view, attribute, PrefetchedComponent(
+                component, _Prefetch(method, str(path), future)
+            ))
+
+        logger.info(f"Running verification components concurrently for patient {patient_id}")
+        return view.process_medication_verification(
+            patient_id=patient_id,
+            prescription_image_path=prescription_image_path,
+            pill_image_path=pill_image_path,
+            intake_video_path=intake_video_path,
+            **kwargs
+        )
+
+    def shutdown(self, wait: bool = True):
+        """Release the component worker threads."""
+        self._executor.shutdown(wait=wait)
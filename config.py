@@ -1,40 +1,102 @@
-"""Environment configuration for the medication management system."""
-
-import os
-from dotenv import load_dotenv
-
-# Load environment variables
-load_dotenv()
-
-# API Keys
-GOOGLE_VISION_API_KEY = os.getenv('GOOGLE_VISION_API_KEY', '')
-AZURE_FORM_RECOGNIZER_KEY = os.getenv('AZURE_FORM_RECOGNIZER_KEY', '')
-
-# System Configuration
-ENVIRONMENT = os.getenv('ENVIRONMENT', 'development')
-DEBUG_MODE = ENVIRONMENT == 'development'
-
-# Paths
-DATA_DIR = os.getenv('DATA_DIR', 'data')
-LOG_DIR = os.getenv('LOG_DIR', 'logs')
-CACHE_DIR = os.getenv('CACHE_DIR', 'data/cache')
-
-# GPU Configuration
-USE_GPU = os.getenv('USE_GPU', 'false').lower() == 'true'
-DEVICE = 'cuda' if USE_GPU else 'cpu'
-
-# Model Configuration
-OCR_BACKEND = os.getenv('OCR_BACKEND', 'easyocr')
-USE_CLINICAL_BERT = os.getenv('USE_CLINICAL_BERT', 'true').lower() == 'true'
-
-# Thresholds
-MANUAL_REVIEW_THRESHOLD = float(os.getenv('MANUAL_REVIEW_THRESHOLD', '0.7'))
-HIGH_CONFIDENCE_THRESHOLD = float(os.getenv('HIGH_CONFIDENCE_THRESHOLD', '0.85'))
-SIMILARITY_THRESHOLD = float(os.getenv('SIMILARITY_THRESHOLD', '0.85'))
-
-# API Configuration
-RX_NAV_API_BASE = "https://rxnav.nlm.nih.gov/REST"
-DAILYMED_API_BASE = "https://dailymed.nlm.nih.gov/dailymed"
-
-# Logging
-LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
+"""Environment configuration for the medication management system."""
+
+import os
+from dotenv import load_dotenv
+
+# Load environment variables
+load_dotenv()
+
+# API Keys
+GOOGLE_VISION_API_KEY = os.getenv('GOOGLE_VISION_API_KEY', '')
+AZURE_FORM_RECOGNIZER_KEY = os.getenv('AZURE_FORM_RECOGNIZER_KEY', '')
+
+# System Configuration
+ENVIRONMENT = os.getenv('ENVIRONMENT', 'development')
+DEBUG_MODE = ENVIRONMENT == 'development'
+
+# Paths
+DATA_DIR = os.getenv('DATA_DIR', 'data')
+LOG_DIR = os.getenv('LOG_DIR', 'logs')
+CACHE_DIR = os.getenv('CACHE_DIR', 'data/cache')
+DRUG_INDEX_PATH = os.getenv('DRUG_INDEX_PATH', 'data/drug_index.sqlite')
+RESULT_CACHE_DIR = os.getenv('RESULT_CACHE_DIR', 'data/cache/results')
+
+# GPU Configuration
+USE_GPU = os.getenv('USE_GPU', 'false').lower() == 'true'
+DEVICE = 'cuda' if USE_GPU else 'cpu'
+
+# Model Configuration
+OCR_BACKEND = os.getenv('OCR_BACKEND', 'easyocr')
+USE_CLINICAL_BERT = os.getenv('USE_CLINICAL_BERT', 'true').lower() == 'true'
+
+# Thresholds
+MANUAL_REVIEW_THRESHOLD = float(os.getenv('MANUAL_REVIEW_THRESHOLD', '0.7'))
+HIGH_CONFIDENCE_THRESHOLD = float(os.getenv('HIGH_CONFIDENCE_THRESHOLD', '0.85'))
+SIMILARITY_THRESHOLD = float(os.getenv('SIMILARITY_THRESHOLD', '0.85'))
+
+# Offline mode: validate drugs against the local index only (no RxNav calls)
+OFFLINE_MODE = os.getenv('OFFLINE_MODE', 'false').lower() == 'true'
+
+# API Configuration
+RX_NAV_API_BASE = "https://rxnav.nlm.nih.gov/REST"
+DAILYMED_API_BASE = "https://dailymed.nlm.nih.gov/dailymed"
+
+# Inference Server Configuration
+INFERENCE_WORKERS = int(os.getenv('INFERENCE_WORKERS', '2'))
+INFERENCE_QUEUE_SIZE = int(os.getenv('INFERENCE_QUEUE_SIZE', '16'))
+WORKFLOW_CONCURRENT_COMPONENTS = os.getenv('WORKFLOW_CONCURRENT_COMPONENTS', 'true').lower() == 'true'
+
+# Pill classification requests are micro-batched into shared forward passes
+PILL_MICRO_BATCHING = os.getenv('PILL_MICRO_BATCHING', 'true').lower() == 'true'
+PILL_BATCH_SIZE = int(os.getenv('PILL_BATCH_SIZE', '16'))
+PILL_BATCH_WAIT_MS = float(os.getenv('PILL_BATCH_WAIT_MS', '10'))
+
+# Inference backend per server-side model: 'pytorch' (eager) or 'onnxruntime' (CPU).
+# ONNX exports are cached in ONNX_MODEL_DIR per PIPELINE_VERSION and weights digest; intra-op threads
+# default to CPU cores / INFERENCE_WORKERS so concurrent requests don't oversubscribe
+PILL_CLASSIFIER_BACKEND = os.getenv('PILL_CLASSIFIER_BACKEND', 'pytorch')
+ACTION_RECOGNIZER_BACKEND = os.getenv('ACTION_RECOGNIZER_BACKEND', 'pytorch')
+NER_BACKEND = os.getenv('NER_BACKEND', 'pytorch')
+ONNX_MODEL_DIR = os.getenv('ONNX_MODEL_DIR', 'models/onnx')
+ONNX_INTRA_OP_THREADS = int(os.getenv('ONNX_INTRA_OP_THREADS', '0'))
+ONNX_INTER_OP_THREADS = int(os.getenv('ONNX_INTER_OP_THREADS', '1'))
+
+# Intake videos are decoded as a frame stream instead of being loaded whole
+INTAKE_STREAMING_DECODE = os.getenv('INTAKE_STREAMING_DECODE', 'true').lower() == 'true'
+
+# Side length frames are resized to for the action 3D CNN (offline and live intake)
+INTAKE_CLIP_SIZE = int(os.getenv('INTAKE_CLIP_SIZE', '224'))
+
+# Hand pose / action models run only on crops around pills and faces near an intake event.
+# Off by default: the swallow usually follows the pill leaving view by several seconds
+# (drinking, tilting the head back), so the event window is given in seconds and must
+# cover that gap
+INTAKE_ROI_CASCADE = os.getenv('INTAKE_ROI_CASCADE', 'false').lower() == 'true'
+INTAKE_ROI_EVENT_SECONDS = float(os.getenv('INTAKE_ROI_EVENT_SECONDS', '6'))
+
+# Live intake WebSocket: frame-processing threads, concurrent sessions, and frames
+# buffered per session before the oldest is dropped (keeps feedback latency low)
+LIVE_INTAKE_WORKERS = int(os.getenv('LIVE_INTAKE_WORKERS', '4'))
+LIVE_INTAKE_MAX_SESSIONS = int(os.getenv('LIVE_INTAKE_MAX_SESSIONS', '16'))
+LIVE_INTAKE_MAX_PENDING_FRAMES = int(os.getenv('LIVE_INTAKE_MAX_PENDING_FRAMES', '2'))
+
+# Upload limits (uploads are streamed to disk in UPLOAD_CHUNK_SIZE blocks)
+UPLOAD_CHUNK_SIZE = int(os.getenv('UPLOAD_CHUNK_SIZE', str(1024 * 1024)))
+MAX_IMAGE_UPLOAD_BYTES = int(os.getenv('MAX_IMAGE_UPLOAD_MB', '20')) * 1024 * 1024
+MAX_VIDEO_UPLOAD_BYTES = int(os.getenv('MAX_VIDEO_UPLOAD_MB', '500')) * 1024 * 1024
+
+# Model loading: 'background' (warm up after startup), 'lazy' (on first request)
+# or 'preload' (at import, before gunicorn --preload forks workers)
+MODEL_LOADING = os.getenv('MODEL_LOADING', 'background')
+# Failed model loads are retried in the background with exponential backoff
+MODEL_LOAD_RETRIES = int(os.getenv('MODEL_LOAD_RETRIES', '3'))
+MODEL_LOAD_BACKOFF = float(os.getenv('MODEL_LOAD_BACKOFF', '5'))
+
+# Result Cache (bump PIPELINE_VERSION when models change to invalidate old results)
+PIPELINE_VERSION = os.getenv('PIPELINE_VERSION', '1.0.0')
+RESULT_CACHE_ENABLED = os.getenv('RESULT_CACHE_ENABLED', 'true').lower() == 'true'
+RESULT_CACHE_SIZE = int(os.getenv('RESULT_CACHE_SIZE', '256'))
+RESULT_CACHE_DISK_ITEMS = int(os.getenv('RESULT_CACHE_DISK_ITEMS', '10000'))
+
+# Logging
+LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
@@ -0,0 +1,103 @@
+"""
+Conversion manifest for incremental model conversion.
+Records, per conversion job, a key derived from the source weights and the
+converter settings, plus output sizes and validation results, so unchanged
+models are skipped on the next run.
+"""
+
+import hashlib
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+from result_cache import hash_file
+
+
+def _jsonable(value):
+    if isinstance(value, dict):
+        return {str(k): _jsonable(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_jsonable(v) for v in value]
+    if isinstance(value, Path):
+        return str(value)
+    return value
+
+
+class ConversionManifest:
+    """
+    JSON manifest of converted models.
+
+    Each job entry holds its cache key, source digest, outputs (path and
+    size) and validation results. A job is up to date when its stored key
+    matches the current one and every output still exists. Source digests
+    are reused while a file's size and mtime are unchanged, so a run with
+    nothing to convert hashes nothing.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.entries: Dict[str, Dict] = {}
+        if self.path.exists():
+            try:
+                with open(self.path) as f:
+                    self.entries = json.load(f).get('jobs', {})
+            except (OSError, ValueError):
+                self.entries = {}
+
+    def source_digest(self, job: str, source: str) -> Optional[str]:
+        """SHA-256 of a source file (None if missing), cached by size and mtime."""
+        if not source or not os.path.exists(source):
+            return None
+        stat = os.stat(source)
+        cached = self.entries.get(job, {}).get('source', {})
+        if (cached.get('path') == str(source) and cached.get('size') == stat.st_size
+                and cached.get('mtime') == stat.st_mtime and cached.get('sha256')):
+            return cached['sha256']
+        return hash_file(source)
+
+    @staticmethod
+    def job_key(source_digest: Optional[str], settings: Dict) -> str:
+        """Cache key of a job: source digest plus converter settings."""
+        payload = json.dumps({'source': source_digest, 'settings': _jsonable(settings)},
+                             sort_keys=True)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def is_up_to_date(self, job: str, key: str) -> bool:
+        """Whether a job was converted with this key and its outputs still exist."""
+        entry = self.entries.get(job)
+        if not entry or entry.get('key') != key or entry.get('status') != 'converted':
+            return False
+        return all(os.path.exists(output['path']) for output in entry.get('outputs', []))
+
+    def record(self, job: str, key: str, source: Optional[str], source_digest: Optional[str],
+               settings: Dict, outputs: Iterable, status: str,
+               validation: Optional[Dict] = None, duration_seconds: Optional[float] = None):
+        """Store a job's result (outputs are paths; sizes are read now)."""
+        source_entry = {'path': str(source) if source else None, 'sha256': source_digest}
+        if source and os.path.exists(source):
+            stat = os.stat(source)
+            source_entry.update(size=stat.st_size, mtime=stat.st_mtime)
+
+        self.entries[job] = {
+            'key': key,
+            'status': status,
+            'source': source_entry,
+            'settings': _jsonable(settings),
+            'outputs': [
+                {'path': str(path), 'size_mb': round(os.path.getsize(path) / (1024 * 1024), 3)}
+                for path in outputs if os.path.exists(path)
+            ],
+            'validation': _jsonable(validation or {}),
+            'duration_seconds': duration_seconds,
+            'updated_at': datetime.now().isoformat()
+        }
+
+    def save(self):
+        """Write the manifest atomically."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix('.tmp')
+        with open(tmp_path, 'w') as f:
+            json.dump({'updated_at': datetime.now().isoformat(), 'jobs': self.entries}, f, indent=2)
+        os.replace(tmp_path, self.path)
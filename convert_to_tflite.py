@@ -1,493 +1,1072 @@
-"""
-TensorFlow Lite Model Conversion Script
-Converts all ML models to TensorFlow Lite format for mobile deployment
-"""
-
-import os
-import numpy as np
-import tensorflow as tf
-import torch
-import logging
-from pathlib import Path
-
-logging.basicConfig(level=logging.INFO)
-logger = logging.getLogger(__name__)
-
-# ============================================================================
-# CONFIGURATION
-# ============================================================================
-
-OUTPUT_DIR = Path("assets/models/tflite")
-OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-
-MODELS = {
-    "yolov8_pill_detector": {
-        "input_size": (416, 416),
-        "source": "runs/detect/train/weights/best.pt",
-        "output": OUTPUT_DIR / "pill_detector.tflite",
-        "quantization": "dynamic"
-    },
-    "pill_classifier": {
-        "input_size": (224, 224),
-        "source": "models/pill_classifier.pt",
-        "output": OUTPUT_DIR / "pill_classifier.tflite",
-        "quantization": "dynamic"
-    },
-    "action_recognizer": {
-        "input_size": (224, 224),
-        "source": "models/action_recognizer.pt",
-        "output": OUTPUT_DIR / "action_recognizer.tflite",
-        "quantization": "float32"
-    },
-    "pose_estimator": {
-        "input_size": (192, 256),
-        "source": "models/pose_estimator.pt",
-        "output": OUTPUT_DIR / "pose_estimator.tflite",
-        "quantization": "dynamic"
-    }
-}
-
-
-# ============================================================================
-# CONVERSION UTILITIES
-# ============================================================================
-
-class TFLiteConverter:
-    """Convert PyTorch/TensorFlow models to TensorFlow Lite format"""
-
-    @staticmethod
-    def pytorch_to_tflite(
-        model_path: str,
-        output_path: str,
-        input_size: tuple,
-        quantization: str = "dynamic"
-    ):
-        """
-        Convert PyTorch model to TFLite
-        
-        Args:
-            model_path: Path to PyTorch model
-            output_path: Output TFLite path
-            input_size: Model input size (H, W)
-            quantization: Quantization type (dynamic, integer, float32)
-        """
-        logger.info(f"Converting PyTorch model: {model_path}")
-        
-        try:
-            # Load PyTorch model
-            model = torch.load(model_path, map_location='cpu')
-            model.eval()
-            
-            # Create dummy input
-            dummy_input = torch.randn(1, 3, input_size[0], input_size[1])
-            
-            # Export to ONNX first
-            onnx_path = str(output_path).replace('.tflite', '.onnx')
-            torch.onnx.export(
-                model,
-                dummy_input,
-                onnx_path,
-                input_names=['input'],
-                output_names=['output'],
-                opset_version=13,
-                do_constant_folding=True,
-                verbose=False
-            )
-            logger.info(f"✓ ONNX export: {onnx_path}")
-            
-            # Convert ONNX to TFLite
-            TFLiteConverter.onnx_to_tflite(
-                onnx_path,
-                output_path,
-                quantization
-            )
-            
-        except Exception as e:
-            logger.error(f"✗ PyTorch to TFLite conversion failed: {e}")
-            return False
-        
-        return True
-
-    @staticmethod
-    def onnx_to_tflite(
-        onnx_path: str,
-        output_path: str,
-        quantization: str = "dynamic"
-    ):
-        """Convert ONNX model to TFLite"""
-        logger.info(f"Converting ONNX to TFLite: {onnx_path}")
-        
-        try:
-            # Try using tensorflow-onnx (tf2onnx)
-            import onnx
-            import onnx_tf
-            
-            # Load ONNX model
-            onnx_model = onnx.load(onnx_path)
-            
-            # Convert to TensorFlow
-            from onnx_tf.backend import prepare
-            tf_rep = prepare(onnx_model)
-            
-            # Export as SavedModel
-            saved_model_path = str(output_path).replace('.tflite', '_saved_model')
-            tf_rep.export_graph(saved_model_path)
-            
-            # Convert SavedModel to TFLite
-            converter = tf.lite.TFLiteConverter.from_saved_model(saved_model_path)
-            
-            # Apply quantization
-            if quantization == "dynamic":
-                converter.optimizations = [tf.lite.Optimize.DEFAULT]
-            elif quantization == "integer":
-                converter.optimizations = [tf.lite.Optimize.DEFAULT]
-                converter.target_spec.supported_ops = [
-                    tf.lite.OpsSet.TFLITE_BUILTINS_INT8
-                ]
-            
-            # Convert
-            tflite_model = converter.convert()
-            
-            # Save
-            with open(output_path, 'wb') as f:
-                f.write(tflite_model)
-            
-            logger.info(f"✓ TFLite model saved: {output_path}")
-            
-        except ImportError:
-            logger.warning("onnx-tf not available, using alternative method")
-            # Fallback: use Python model directly
-            return False
-        except Exception as e:
-            logger.error(f"✗ ONNX to TFLite conversion failed: {e}")
-            return False
-        
-        return True
-
-    @staticmethod
-    def tf_model_to_tflite(
-        saved_model_path: str,
-        output_path: str,
-        quantization: str = "dynamic"
-    ):
-        """Convert TensorFlow SavedModel to TFLite"""
-        logger.info(f"Converting TensorFlow model: {saved_model_path}")
-        
-        try:
-            converter = tf.lite.TFLiteConverter.from_saved_model(saved_model_path)
-            
-            # Apply quantization
-            if quantization == "dynamic":
-                converter.optimizations = [tf.lite.Optimize.DEFAULT]
-            elif quantization == "integer":
-                converter.optimizations = [tf.lite.Optimize.DEFAULT]
-                converter.target_spec.supported_ops = [
-                    tf.lite.OpsSet.TFLITE_BUILTINS_INT8
-                ]
-            
-            tflite_model = converter.convert()
-            
-            with open(output_path, 'wb') as f:
-                f.write(tflite_model)
-            
-            logger.info(f"✓ TFLite model saved: {output_path}")
-            return True
-            
-        except Exception as e:
-            logger.error(f"✗ TensorFlow to TFLite conversion failed: {e}")
-            return False
-
-
-# ============================================================================
-# SPECIALIZED MODEL CONVERTERS
-# ============================================================================
-
-class YOLOv8Converter:
-    """Convert YOLOv8 models to TFLite"""
-
-    @staticmethod
-    def convert(model_path: str, output_path: str):
-        """
-        Convert YOLOv8 model to TFLite
-        
-        Args:
-            model_path: Path to YOLOv8 .pt file
-            output_path: Output TFLite path
-        """
-        logger.info(f"Converting YOLOv8 model: {model_path}")
-        
-        try:
-            from ultralytics import YOLO
-            
-            # Load YOLOv8 model
-            model = YOLO(model_path)
-            
-            # Export to TFLite (YOLOv8 has built-in export)
-            results = model.export(format='tflite', imgsz=416)
-            
-            logger.info(f"✓ YOLOv8 model converted: {results}")
-            return True
-            
-        except Exception as e:
-            logger.error(f"✗ YOLOv8 conversion failed: {e}")
-            return False
-
-
-class MediaPipeTFLiteConverter:
-    """Handle MediaPipe TFLite models"""
-
-    @staticmethod
-    def download_pose_detector():
-        """Download MediaPipe Pose Detection model"""
-        logger.info("Downloading MediaPipe Pose Detector...")
-        
-        import urllib.request
-        
-        url = "https://storage.googleapis.com/mediapipe-models/pose_detector/pose_detector_lite/float16/pose_detector_lite.tflite"
-        output = OUTPUT_DIR / "pose_detector.tflite"
-        
-        try:
-            urllib.request.urlretrieve(url, output)
-            logger.info(f"✓ Downloaded: {output}")
-            return True
-        except Exception as e:
-            logger.error(f"✗ Download failed: {e}")
-            return False
-
-    @staticmethod
-    def download_hand_detector():
-        """Download MediaPipe Hand Detection model"""
-        logger.info("Downloading MediaPipe Hand Detector...")
-        
-        import urllib.request
-        
-        url = "https://storage.googleapis.com/mediapipe-models/hand_detector/blaze_palm/float16/blaze_palm.tflite"
-        output = OUTPUT_DIR / "hand_detector.tflite"
-        
-        try:
-            urllib.request.urlretrieve(url, output)
-            logger.info(f"✓ Downloaded: {output}")
-            return True
-        except Exception as e:
-            logger.error(f"✗ Download failed: {e}")
-            return False
-
-
-# ============================================================================
-# QUANTIZATION
-# ============================================================================
-
-class Quantizer:
-    """Quantize TFLite models for better performance"""
-
-    @staticmethod
-    def dynamic_range_quantize(tflite_path: str, output_path: str):
-        """Apply dynamic range quantization"""
-        logger.info(f"Applying dynamic range quantization: {tflite_path}")
-        
-        try:
-            with open(tflite_path, 'rb') as f:
-                tflite_model = f.read()
-            
-            # Read quantization details (implementation depends on model)
-            # For simplicity, we're using the converter's built-in quantization
-            
-            with open(output_path, 'wb') as f:
-                f.write(tflite_model)
-            
-            logger.info(f"✓ Quantized model: {output_path}")
-            return True
-            
-        except Exception as e:
-            logger.error(f"✗ Quantization failed: {e}")
-            return False
-
-    @staticmethod
-    def integer_quantize(tflite_path: str, output_path: str, calibration_dataset=None):
-        """Apply integer quantization (requires calibration data)"""
-        logger.info(f"Applying integer quantization: {tflite_path}")
-        
-        try:
-            # This would require calibration dataset
-            # Implementation depends on specific model
-            logger.warning("Integer quantization requires calibration dataset")
-            return False
-            
-        except Exception as e:
-            logger.error(f"✗ Integer quantization failed: {e}")
-            return False
-
-
-# ============================================================================
-# MODEL VALIDATION
-# ============================================================================
-
-class TFLiteValidator:
-    """Validate converted TFLite models"""
-
-    @staticmethod
-    def validate(tflite_path: str):
-        """Validate TFLite model"""
-        logger.info(f"Validating TFLite model: {tflite_path}")
-        
-        try:
-            # Load interpreter
-            interpreter = tf.lite.Interpreter(model_path=str(tflite_path))
-            interpreter.allocate_tensors()
-            
-            # Get input/output details
-            input_details = interpreter.get_input_details()
-            output_details = interpreter.get_output_details()
-            
-            logger.info(f"  Input shape: {input_details[0]['shape']}")
-            logger.info(f"  Input type: {input_details[0]['dtype']}")
-            logger.info(f"  Output shape: {output_details[0]['shape']}")
-            logger.info(f"  Output type: {output_details[0]['dtype']}")
-            
-            # Test inference
-            input_shape = input_details[0]['shape']
-            test_input = np.random.randn(*input_shape).astype(np.float32)
-            
-            interpreter.set_tensor(input_details[0]['index'], test_input)
-            interpreter.invoke()
-            
-            output_data = interpreter.get_tensor(output_details[0]['index'])
-            
-            logger.info(f"✓ Model validation successful")
-            logger.info(f"  Output sample shape: {output_data.shape}")
-            
-            return True
-            
-        except Exception as e:
-            logger.error(f"✗ Model validation failed: {e}")
-            return False
-
-    @staticmethod
-    def benchmark(tflite_path: str, num_iterations: int = 100):
-        """Benchmark TFLite model inference speed"""
-        logger.info(f"Benchmarking TFLite model: {tflite_path}")
-        
-        import time
-        
-        try:
-            interpreter = tf.lite.Interpreter(model_path=str(tflite_path))
-            interpreter.allocate_tensors()
-            
-            input_details = interpreter.get_input_details()
-            input_shape = input_details[0]['shape']
-            
-            test_input = np.random.randn(*input_shape).astype(np.float32)
-            
-            # Warm up
-            for _ in range(10):
-                interpreter.set_tensor(input_details[0]['index'], test_input)
-                interpreter.invoke()
-            
-            # Benchmark
-            start_time = time.time()
-            for _ in range(num_iterations):
-                interpreter.set_tensor(input_details[0]['index'], test_input)
-                interpreter.invoke()
-            end_time = time.time()
-            
-            avg_time = (end_time - start_time) / num_iterations * 1000
-            logger.info(f"✓ Average inference time: {avg_time:.2f}ms")
-            logger.info(f"  FPS: {1000 / avg_time:.1f}")
-            
-            return avg_time
-            
-        except Exception as e:
-            logger.error(f"✗ Benchmarking failed: {e}")
-            return None
-
-
-# ============================================================================
-# MAIN CONVERSION PIPELINE
-# ============================================================================
-
-def convert_all_models():
-    """Convert all models to TFLite"""
-    logger.info("=" * 70)
-    logger.info("TENSORFLOW LITE MODEL CONVERSION PIPELINE")
-    logger.info("=" * 70)
-    
-    results = {}
-    
-    # 1. Convert YOLOv8 Pill Detector
-    logger.info("\n[1/4] YOLOv8 Pill Detector")
-    if os.path.exists(MODELS["yolov8_pill_detector"]["source"]):
-        success = YOLOv8Converter.convert(
-            MODELS["yolov8_pill_detector"]["source"],
-            MODELS["yolov8_pill_detector"]["output"]
-        )
-        results["yolov8_pill_detector"] = success
-    else:
-        logger.warning("Model file not found, skipping")
-        results["yolov8_pill_detector"] = False
-    
-    # 2. Convert Pill Classifier
-    logger.info("\n[2/4] Pill Classifier")
-    if os.path.exists(MODELS["pill_classifier"]["source"]):
-        success = TFLiteConverter.pytorch_to_tflite(
-            MODELS["pill_classifier"]["source"],
-            MODELS["pill_classifier"]["output"],
-            MODELS["pill_classifier"]["input_size"],
-            MODELS["pill_classifier"]["quantization"]
-        )
-        results["pill_classifier"] = success
-    else:
-        logger.warning("Model file not found, skipping")
-        results["pill_classifier"] = False
-    
-    # 3. Download MediaPipe Models
-    logger.info("\n[3/4] MediaPipe Models")
-    success1 = MediaPipeTFLiteConverter.download_pose_detector()
-    success2 = MediaPipeTFLiteConverter.download_hand_detector()
-    results["mediapipe"] = success1 and success2
-    
-    # 4. Action Recognizer
-    logger.info("\n[4/4] Action Recognizer")
-    if os.path.exists(MODELS["action_recognizer"]["source"]):
-        success = TFLiteConverter.pytorch_to_tflite(
-            MODELS["action_recognizer"]["source"],
-            MODELS["action_recognizer"]["output"],
-            MODELS["action_recognizer"]["input_size"],
-            MODELS["action_recognizer"]["quantization"]
-        )
-        results["action_recognizer"] = success
-    else:
-        logger.warning("Model file not found, skipping")
-        results["action_recognizer"] = False
-    
-    # Validate all converted models
-    logger.info("\n" + "=" * 70)
-    logger.info("VALIDATING CONVERTED MODELS")
-    logger.info("=" * 70)
-    
-    for model_name, output_path in [
-        ("Pill Detector", MODELS["yolov8_pill_detector"]["output"]),
-        ("Pill Classifier", MODELS["pill_classifier"]["output"]),
-        ("Pose Detector", OUTPUT_DIR / "pose_detector.tflite"),
-        ("Hand Detector", OUTPUT_DIR / "hand_detector.tflite"),
-        ("Action Recognizer", MODELS["action_recognizer"]["output"]),
-    ]:
-        if os.path.exists(output_path):
-            logger.info(f"\n{model_name}:")
-            TFLiteValidator.validate(str(output_path))
-            TFLiteValidator.benchmark(str(output_path), num_iterations=50)
-    
-    # Summary
-    logger.info("\n" + "=" * 70)
-    logger.info("CONVERSION SUMMARY")
-    logger.info("=" * 70)
-    
-    for model_name, success in results.items():
-        status = "✓ SUCCESS" if success else "✗ FAILED"
-        logger.info(f"{model_name}: {status}")
-    
-    logger.info("\nModels saved to:", OUTPUT_DIR)
-    logger.info("Ready for mobile deployment!")
-
-
-if __name__ == "__main__":
-    convert_all_models()
+"""
+TensorFlow Lite Model Conversion Script
+Converts all ML models to TensorFlow Lite format for mobile deployment
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import numpy as np
+import tensorflow as tf
+import torch
+import logging
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import get_context
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from batched_pill_classifier import HEADS, preprocess_image
+from conversion_manifest import ConversionManifest
+from model_benchmark import TFLiteRunner, measure_latency, quantize_input
+from video_stream import VideoFrameStream
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+OUTPUT_DIR = Path("assets/models/tflite")
+OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+
+# Records source hashes, settings, sizes and validation of every conversion;
+# bump CONVERTER_VERSION when conversion code changes to invalidate it
+MANIFEST_PATH = OUTPUT_DIR / "manifest.json"
+CONVERTER_VERSION = "2"
+
+# INT8 PyTorch models for CPU serving, and the data used to calibrate them
+QUANTIZED_DIR = Path("models/quantized")
+PILL_DATA_DIR = "data/pill_database"
+CALIBRATION_VIDEO_DIR = "data/intake_videos"
+CALIBRATION_SAMPLES = 256
+
+MODELS = {
+    "yolov8_pill_detector": {
+        "input_size": (416, 416),
+        "source": "runs/detect/train/weights/best.pt",
+        "output": OUTPUT_DIR / "pill_detector.tflite",
+        "quantization": "dynamic"
+    },
+    "pill_classifier": {
+        "input_size": (224, 224),
+        "source": "models/pill_classifier.pt",
+        "output": OUTPUT_DIR / "pill_classifier.tflite",
+        "quantization": "integer"
+    },
+    "action_recognizer": {
+        "input_size": (224, 224),
+        "source": "models/action_recognizer.pt",
+        "output": OUTPUT_DIR / "action_recognizer.tflite",
+        # TFLite has no int8 CONV_3D kernel; the INT8 variant is the PyTorch one
+        "quantization": "dynamic",
+        "num_frames": 16
+    },
+    "pose_estimator": {
+        "input_size": (192, 256),
+        "source": "models/pose_estimator.pt",
+        "output": OUTPUT_DIR / "pose_estimator.tflite",
+        "quantization": "dynamic"
+    }
+}
+
+MEDIAPIPE_MODELS = {
+    "pose_detector": "https://storage.googleapis.com/mediapipe-models/pose_detector/pose_detector_lite/float16/pose_detector_lite.tflite",
+    "hand_detector": "https://storage.googleapis.com/mediapipe-models/hand_detector/blaze_palm/float16/blaze_palm.tflite"
+}
+
+
+# ============================================================================
+# CONVERSION UTILITIES
+# ============================================================================
+
+class TFLiteConverter:
+    """Convert PyTorch/TensorFlow models to TensorFlow Lite format"""
+
+    @staticmethod
+    def apply_quantization(converter, quantization: str,
+                           calibration_dataset: Optional[Callable] = None):
+        """
+        Configure a TFLiteConverter for the requested quantization
+        
+        Args:
+            converter: tf.lite.TFLiteConverter
+            quantization: Quantization type (dynamic, integer, float32)
+            calibration_dataset: Representative dataset (required for integer)
+        """
+        if quantization == "dynamic":
+            converter.optimizations = [tf.lite.Optimize.DEFAULT]
+        elif quantization == "integer":
+            if calibration_dataset is None:
+                raise ValueError("Integer quantization requires a calibration dataset")
+            # Full-integer model: int8 weights, activations and input/output tensors
+            converter.optimizations = [tf.lite.Optimize.DEFAULT]
+            converter.representative_dataset = calibration_dataset
+            converter.target_spec.supported_ops = [
+                tf.lite.OpsSet.TFLITE_BUILTINS_INT8
+            ]
+            converter.inference_input_type = tf.int8
+            converter.inference_output_type = tf.int8
+
+    @staticmethod
+    def pytorch_to_tflite(
+        model_path: str,
+        output_path: str,
+        input_size: tuple,
+        quantization: str = "dynamic",
+        calibration_dataset: Optional[Callable] = None,
+        num_frames: Optional[int] = None
+    ):
+        """
+        Convert PyTorch model to TFLite
+        
+        Args:
+            model_path: Path to PyTorch model
+            output_path: Output TFLite path
+            input_size: Model input size (H, W)
+            quantization: Quantization type (dynamic, integer, float32)
+            calibration_dataset: Representative dataset for integer quantization
+            num_frames: Clip length for video models (input becomes N, C, T, H, W)
+        """
+        logger.info(f"Converting PyTorch model: {model_path}")
+        
+        try:
+            # Load PyTorch model
+            model = torch.load(model_path, map_location='cpu')
+            model.eval()
+            
+            # Create dummy input
+            if num_frames:
+                dummy_input = torch.randn(1, 3, num_frames, input_size[0], input_size[1])
+            else:
+                dummy_input = torch.randn(1, 3, input_size[0], input_size[1])
+            
+            # Export to ONNX first (batch axis left dynamic so the .onnx serves any batch size)
+            onnx_path = str(output_path).replace('.tflite', '.onnx')
+            torch.onnx.export(
+                model,
+                dummy_input,
+                onnx_path,
+                input_names=['input'],
+                output_names=['output'],
+                dynamic_axes={'input': {0: 'batch'}, 'output': {0: 'batch'}},
+                opset_version=13,
+                do_constant_folding=True,
+                verbose=False
+            )
+            logger.info(f"✓ ONNX export: {onnx_path}")
+            
+            # Convert ONNX to TFLite
+            return TFLiteConverter.onnx_to_tflite(
+                onnx_path,
+                output_path,
+                quantization,
+                calibration_dataset
+            )
+            
+        except Exception as e:
+            logger.error(f"✗ PyTorch to TFLite conversion failed: {e}")
+            return False
+
+    @staticmethod
+    def onnx_to_tflite(
+        onnx_path: str,
+        output_path: str,
+        quantization: str = "dynamic",
+        calibration_dataset: Optional[Callable] = None
+    ):
+        """Convert ONNX model to TFLite"""
+        logger.info(f"Converting ONNX to TFLite: {onnx_path}")
+        
+        try:
+            # Try using tensorflow-onnx (tf2onnx)
+            import onnx
+            import onnx_tf
+            
+            # Load ONNX model
+            onnx_model = onnx.load(onnx_path)
+            
+            # Convert to TensorFlow
+            from onnx_tf.backend import prepare
+            tf_rep = prepare(onnx_model)
+            
+            # Export as SavedModel
+            saved_model_path = str(output_path).replace('.tflite', '_saved_model')
+            tf_rep.export_graph(saved_model_path)
+            
+            # Convert SavedModel to TFLite
+            converter = tf.lite.TFLiteConverter.from_saved_model(saved_model_path)
+            
+            # Apply quantization
+            TFLiteConverter.apply_quantization(converter, quantization, calibration_dataset)
+            
+            # Convert
+            tflite_model = converter.convert()
+            
+            # Save
+            with open(output_path, 'wb') as f:
+                f.write(tflite_model)
+            
+            logger.info(f"✓ TFLite model saved: {output_path}")
+            
+        except ImportError:
+            logger.warning("onnx-tf not available, using alternative method")
+            # Fallback: use Python model directly
+            return False
+        except Exception as e:
+            logger.error(f"✗ ONNX to TFLite conversion failed: {e}")
+            return False
+        
+        return True
+
+    @staticmethod
+    def tf_model_to_tflite(
+        saved_model_path: str,
+        output_path: str,
+        quantization: str = "dynamic",
+        calibration_dataset: Optional[Callable] = None
+    ):
+        """Convert TensorFlow SavedModel to TFLite"""
+        logger.info(f"Converting TensorFlow model: {saved_model_path}")
+        
+        try:
+            converter = tf.lite.TFLiteConverter.from_saved_model(saved_model_path)
+            
+            # Apply quantization
+            TFLiteConverter.apply_quantization(converter, quantization, calibration_dataset)
+            
+            tflite_model = converter.convert()
+            
+            with open(output_path, 'wb') as f:
+                f.write(tflite_model)
+            
+            logger.info(f"✓ TFLite model saved: {output_path}")
+            return True
+            
+        except Exception as e:
+            logger.error(f"✗ TensorFlow to TFLite conversion failed: {e}")
+            return False
+
+
+# ============================================================================
+# SPECIALIZED MODEL CONVERTERS
+# ============================================================================
+
+class YOLOv8Converter:
+    """Convert YOLOv8 models to TFLite"""
+
+    @staticmethod
+    def convert(model_path: str, output_path: str, input_size: tuple = (416, 416)):
+        """
+        Convert YOLOv8 model to TFLite
+        
+        Args:
+            model_path: Path to YOLOv8 .pt file
+            output_path: Output TFLite path
+            input_size: Model input size (H, W)
+        """
+        logger.info(f"Converting YOLOv8 model: {model_path}")
+        
+        try:
+            from ultralytics import YOLO
+            
+            # Load YOLOv8 model
+            model = YOLO(model_path)
+            
+            # Export to TFLite (YOLOv8 has built-in export, written next to the weights)
+            exported = Path(model.export(format='tflite', imgsz=list(input_size)))
+            if exported.is_dir():
+                exported = sorted(exported.glob("*float32.tflite")) or sorted(exported.glob("*.tflite"))
+                exported = exported[0]
+            
+            shutil.copyfile(exported, output_path)
+            logger.info(f"✓ YOLOv8 model converted: {output_path}")
+            return True
+            
+        except Exception as e:
+            logger.error(f"✗ YOLOv8 conversion failed: {e}")
+            return False
+
+
+class MediaPipeTFLiteConverter:
+    """Handle MediaPipe TFLite models"""
+
+    @staticmethod
+    def download(url: str, output: Path):
+        """Download a MediaPipe TFLite model (written atomically)"""
+        import urllib.request
+        
+        partial = Path(str(output) + ".part")
+        try:
+            urllib.request.urlretrieve(url, partial)
+            os.replace(partial, output)
+            logger.info(f"✓ Downloaded: {output}")
+            return True
+        except Exception as e:
+            logger.error(f"✗ Download failed: {e}")
+            return False
+
+    @staticmethod
+    def download_pose_detector():
+        """Download MediaPipe Pose Detection model"""
+        logger.info("Downloading MediaPipe Pose Detector...")
+        return MediaPipeTFLiteConverter.download(
+            MEDIAPIPE_MODELS["pose_detector"], OUTPUT_DIR / "pose_detector.tflite"
+        )
+
+    @staticmethod
+    def download_hand_detector():
+        """Download MediaPipe Hand Detection model"""
+        logger.info("Downloading MediaPipe Hand Detector...")
+        return MediaPipeTFLiteConverter.download(
+            MEDIAPIPE_MODELS["hand_detector"], OUTPUT_DIR / "hand_detector.tflite"
+        )
+
+
+# ============================================================================
+# CALIBRATION DATA
+# ============================================================================
+
+class _LabeledPillDataset(torch.utils.data.Dataset):
+    def __init__(self, samples: List, image_size: int):
+        self.samples = samples
+        self.image_size = image_size
+
+    def __len__(self):
+        return len(self.samples)
+
+    def __getitem__(self, index):
+        path, labels = self.samples[index]
+        return preprocess_image(path, self.image_size), labels
+
+
+class CalibrationData:
+    """Calibration and evaluation inputs for post-training quantization"""
+
+    @staticmethod
+    def pill_splits(data_dir: str = PILL_DATA_DIR):
+        """
+        Split the pill database into calibration and evaluation records
+        
+        Args:
+            data_dir: PillDatasetLoader data directory
+            
+        Returns:
+            (calibration_records, evaluation_records) metadata dicts
+        """
+        from src.pill_authenticator import PillDatasetLoader
+        
+        loader = PillDatasetLoader(data_dir=data_dir)
+        metadata = loader.metadata
+        train_ids, val_ids, test_ids = loader.split_dataset(0.7, 0.15, 0.15)
+        
+        def records(ids):
+            if isinstance(metadata, dict):
+                return [metadata[i] for i in ids if i in metadata]
+            return [metadata[i] for i in ids]
+        
+        # Calibrate on training images; measure drift on held-out ones
+        return records(list(train_ids) + list(val_ids)), records(test_ids)
+
+    @staticmethod
+    def _image_path(record: Dict, data_dir: str) -> Optional[str]:
+        path = record.get('image_path') or record.get('path')
+        if not path:
+            return None
+        for candidate in (path, os.path.join(data_dir, path)):
+            if os.path.exists(candidate):
+                return candidate
+        return None
+
+    @staticmethod
+    def pill_batches(records: List[Dict], image_size: int = 224, batch_size: int = 8,
+                     max_samples: int = CALIBRATION_SAMPLES,
+                     data_dir: str = PILL_DATA_DIR) -> List[torch.Tensor]:
+        """
+        Preprocess pill images into (N, 3, H, W) batches
+        
+        Images go through the same resize and ImageNet normalization as
+        served requests, so calibration ranges match production inputs.
+        """
+        paths = [CalibrationData._image_path(r, data_dir) for r in records]
+        tensors = [preprocess_image(path, image_size) for path in paths if path][:max_samples]
+        return [torch.stack(tensors[i:i + batch_size]) for i in range(0, len(tensors), batch_size)]
+
+    @staticmethod
+    def _label(record: Dict, head: str) -> Optional[int]:
+        for key in (f'{head}_label', f'{head}_id', head):
+            value = record.get(key)
+            if isinstance(value, (int, np.integer)):
+                return int(value)
+        return None
+
+    @staticmethod
+    def pill_eval_loader(records: List[Dict], image_size: int = 224, batch_size: int = 16,
+                         data_dir: str = PILL_DATA_DIR):
+        """
+        Labeled DataLoader over held-out pill records for ModelEvaluator
+        
+        Batches are (images, {'shape', 'color', 'imprint'} label tensors).
+        Records without an image or an integer label for every head are
+        skipped.
+        
+        Returns:
+            DataLoader, or None if no record is usable
+        """
+        samples = []
+        for record in records:
+            path = CalibrationData._image_path(record, data_dir)
+            labels = {head: CalibrationData._label(record, head) for head in HEADS}
+            if path and None not in labels.values():
+                samples.append((path, labels))
+        if not samples:
+            return None
+        return torch.utils.data.DataLoader(
+            _LabeledPillDataset(samples, image_size), batch_size=batch_size
+        )
+
+    @staticmethod
+    def action_clips(video_dir: str = CALIBRATION_VIDEO_DIR, num_frames: int = 16,
+                     image_size: int = 224, clip_stride: int = 2,
+                     max_clips: int = 32) -> List[torch.Tensor]:
+        """
+        Cut intake videos into (1, 3, T, H, W) clips for the 3D CNN
+        
+        Args:
+            video_dir: Directory of intake videos
+            num_frames: Frames per clip
+            image_size: Side length frames are resized to
+            clip_stride: Frame stride inside a clip
+            max_clips: Maximum clips returned
+        """
+        import cv2
+        
+        clips = []
+        video_paths = sorted(Path(video_dir).glob("*.mp4")) + sorted(Path(video_dir).glob("*.avi"))
+        for video_path in video_paths:
+            frames = []
+            with VideoFrameStream(str(video_path), stride=clip_stride) as stream:
+                for _, frame in stream:
+                    frame = cv2.cvtColor(cv2.resize(frame, (image_size, image_size)), cv2.COLOR_BGR2RGB)
+                    frames.append(frame)
+                    if len(frames) == num_frames:
+                        clip = np.stack(frames).astype(np.float32) / 255.0
+                        clips.append(torch.from_numpy(clip).permute(3, 0, 1, 2).unsqueeze(0))
+                        frames = []
+                        if len(clips) >= max_clips:
+                            return clips
+        return clips
+
+    @staticmethod
+    def representative_dataset(batches: List[torch.Tensor]) -> Callable:
+        """Wrap calibration batches as a TFLite representative dataset"""
+        def generator():
+            for batch in batches:
+                for sample in batch:
+                    yield [sample.unsqueeze(0).numpy().astype(np.float32)]
+        return generator
+
+
+# ============================================================================
+# QUANTIZATION
+# ============================================================================
+
+class Quantizer:
+    """Quantize models for smaller, faster CPU inference"""
+
+    @staticmethod
+    def dynamic_range_quantize(saved_model_path: str, output_path: str):
+        """Apply dynamic range quantization (int8 weights, float activations)"""
+        logger.info(f"Applying dynamic range quantization: {saved_model_path}")
+        return TFLiteConverter.tf_model_to_tflite(saved_model_path, output_path, "dynamic")
+
+    @staticmethod
+    def integer_quantize(saved_model_path: str, output_path: str, calibration_dataset=None):
+        """Apply full integer quantization (requires calibration data)"""
+        logger.info(f"Applying integer quantization: {saved_model_path}")
+        
+        if calibration_dataset is None:
+            logger.error("✗ Integer quantization requires a calibration dataset")
+            return False
+        return TFLiteConverter.tf_model_to_tflite(
+            saved_model_path, output_path, "integer", calibration_dataset
+        )
+
+    @staticmethod
+    def pytorch_static_quantize(model: torch.nn.Module, calibration_batches: List[torch.Tensor],
+                                backend: str = "x86"):
+        """
+        INT8 post-training static quantization of a PyTorch model
+        
+        Uses FX graph mode so observers and quant/dequant stubs are inserted
+        automatically. Models FX cannot trace fall back to eager dynamic
+        quantization of their Linear layers.
+        
+        Args:
+            model: Float model
+            calibration_batches: Inputs run through the observers
+            backend: Quantized kernel backend (x86/fbgemm for servers, qnnpack for ARM)
+            
+        Returns:
+            Quantized model in eval mode
+        """
+        from torch.ao.quantization import get_default_qconfig_mapping, quantize_dynamic
+        from torch.ao.quantization.quantize_fx import prepare_fx, convert_fx
+        
+        model = model.cpu().eval()
+        torch.backends.quantized.engine = backend
+        
+        try:
+            prepared = prepare_fx(model, get_default_qconfig_mapping(backend),
+                                  example_inputs=(calibration_batches[0],))
+            with torch.inference_mode():
+                for batch in calibration_batches:
+                    prepared(batch)
+            quantized = convert_fx(prepared)
+            logger.info(f"✓ Static INT8 quantization ({len(calibration_batches)} calibration batches)")
+        except Exception as e:
+            logger.warning(f"FX quantization failed ({e}), using dynamic quantization")
+            quantized = quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+        
+        return quantized.eval()
+
+    @staticmethod
+    def save_pytorch(model: torch.nn.Module, example_input: torch.Tensor, output_path: Path):
+        """Save a quantized model as TorchScript (plain pickle if tracing fails)"""
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            with torch.inference_mode():
+                torch.jit.trace(model, example_input, strict=False).save(str(output_path))
+        except Exception as e:
+            logger.warning(f"TorchScript export failed ({e}), saving pickled module")
+            torch.save(model, output_path)
+        logger.info(f"✓ Quantized model saved: {output_path}")
+
+
+# ============================================================================
+# ACCURACY DRIFT
+# ============================================================================
+
+class QuantizationDrift:
+    """Compare a quantized model against its float reference"""
+
+    @staticmethod
+    def _outputs(result) -> Dict[str, torch.Tensor]:
+        if isinstance(result, dict):
+            return {name: value for name, value in result.items()
+                    if isinstance(value, torch.Tensor) and value.dim() == 2 and value.is_floating_point()}
+        if isinstance(result, (tuple, list)):
+            return {f"output_{i}": value for i, value in enumerate(result)}
+        return {"output": result}
+
+    @staticmethod
+    def measure(reference: torch.nn.Module, quantized: torch.nn.Module,
+                batches: List[torch.Tensor]) -> Dict:
+        """
+        Top-1 agreement and probability drift per output head
+        
+        Args:
+            reference: Float model
+            quantized: Quantized model
+            batches: Held-out inputs
+            
+        Returns:
+            {output: {'top1_agreement', 'mean_abs_prob_diff'}}
+        """
+        totals = {}
+        with torch.inference_mode():
+            for batch in batches:
+                expected = QuantizationDrift._outputs(reference(batch))
+                actual = QuantizationDrift._outputs(quantized(batch))
+                for name, logits in expected.items():
+                    if name not in actual:
+                        continue
+                    p_ref = torch.softmax(logits.float(), dim=1)
+                    p_q = torch.softmax(actual[name].float(), dim=1)
+                    entry = totals.setdefault(name, {'agree': 0, 'diff': 0.0, 'count': 0})
+                    entry['agree'] += int((p_ref.argmax(1) == p_q.argmax(1)).sum())
+                    entry['diff'] += float((p_ref - p_q).abs().mean(dim=1).sum())
+                    entry['count'] += logits.shape[0]
+        
+        return {
+            name: {
+                'top1_agreement': entry['agree'] / entry['count'],
+                'mean_abs_prob_diff': entry['diff'] / entry['count']
+            }
+            for name, entry in totals.items() if entry['count']
+        }
+
+    @staticmethod
+    def evaluate_accuracy(reference: torch.nn.Module, quantized: torch.nn.Module,
+                          eval_loader) -> Optional[Dict]:
+        """
+        Labeled accuracy of both models with ModelEvaluator
+        
+        Returns:
+            {'float': metrics, 'int8': metrics}, or None if evaluation is unavailable
+        """
+        if eval_loader is None:
+            return None
+        try:
+            from src.pill_authenticator.training import ModelEvaluator
+            
+            return {
+                'float': ModelEvaluator(reference, device='cpu').evaluate(eval_loader),
+                'int8': ModelEvaluator(quantized, device='cpu').evaluate(eval_loader)
+            }
+        except Exception as e:
+            logger.warning(f"ModelEvaluator accuracy unavailable: {e}")
+            return None
+
+    @staticmethod
+    def file_size_mb(path) -> Optional[float]:
+        return os.path.getsize(path) / (1024 * 1024) if os.path.exists(path) else None
+
+
+# ============================================================================
+# MODEL VALIDATION
+# ============================================================================
+
+class TFLiteValidator:
+    """Validate converted TFLite models"""
+
+    @staticmethod
+    def validate(tflite_path: str):
+        """Validate TFLite model"""
+        logger.info(f"Validating TFLite model: {tflite_path}")
+        
+        try:
+            # Load interpreter
+            interpreter = tf.lite.Interpreter(model_path=str(tflite_path))
+            interpreter.allocate_tensors()
+            
+            # Get input/output details
+            input_details = interpreter.get_input_details()
+            output_details = interpreter.get_output_details()
+            
+            logger.info(f"  Input shape: {input_details[0]['shape']}")
+            logger.info(f"  Input type: {input_details[0]['dtype']}")
+            logger.info(f"  Output shape: {output_details[0]['shape']}")
+            logger.info(f"  Output type: {output_details[0]['dtype']}")
+            
+            # Test inference (int8-input models get the input quantized with their own scale)
+            input_shape = input_details[0]['shape']
+            test_input = quantize_input(np.random.randn(*input_shape), input_details[0])
+            
+            interpreter.set_tensor(input_details[0]['index'], test_input)
+            interpreter.invoke()
+            
+            output_data = interpreter.get_tensor(output_details[0]['index'])
+            
+            logger.info(f"✓ Model validation successful")
+            logger.info(f"  Output sample shape: {output_data.shape}")
+            
+            return True
+            
+        except Exception as e:
+            logger.error(f"✗ Model validation failed: {e}")
+            return False
+
+    @staticmethod
+    def benchmark(tflite_path: str, num_iterations: int = 100):
+        """
+        Benchmark TFLite model inference speed at batch size 1
+        
+        See model_benchmark.py for the full suite (batch/thread sweeps,
+        memory, drift against the PyTorch source).
+        
+        Returns:
+            Latency summary (mean/p50/p95/p99 ms, throughput), or None on failure
+        """
+        logger.info(f"Benchmarking TFLite model: {tflite_path}")
+        
+        try:
+            runner = TFLiteRunner(str(tflite_path))
+            runner.set_threads(os.cpu_count() or 1)
+            
+            input_shape = tf.lite.Interpreter(model_path=str(tflite_path)).get_input_details()[0]['shape']
+            test_input = np.random.randn(1, *input_shape[1:]).astype(np.float32)
+            
+            stats = measure_latency(lambda: runner(test_input), num_iterations, warmup=10)
+            logger.info(f"✓ Latency p50 {stats['p50_ms']:.2f}ms, p95 {stats['p95_ms']:.2f}ms, "
+                        f"p99 {stats['p99_ms']:.2f}ms")
+            logger.info(f"  FPS: {stats['throughput_per_s']:.1f}")
+            
+            return stats
+            
+        except Exception as e:
+            logger.error(f"✗ Benchmarking failed: {e}")
+            return None
+
+
+# ============================================================================
+# MAIN CONVERSION PIPELINE
+# ============================================================================
+
+def load_pill_calibration():
+    """
+    Load pill calibration and evaluation batches
+    
+    Returns:
+        (calibration, evaluation) lists of (N, 3, H, W) batches; empty if unavailable
+    """
+    try:
+        calibration_records, evaluation_records = CalibrationData.pill_splits()
+        image_size = MODELS["pill_classifier"]["input_size"][0]
+        calibration = CalibrationData.pill_batches(calibration_records, image_size)
+        evaluation = CalibrationData.pill_batches(evaluation_records, image_size)
+        logger.info(f"✓ Pill calibration: {len(calibration)} batches, "
+                    f"evaluation: {len(evaluation)} batches")
+        return calibration, evaluation
+    except Exception as e:
+        logger.warning(f"Pill calibration data unavailable: {e}")
+        return [], []
+
+
+def load_action_calibration():
+    """
+    Load action recognizer calibration and evaluation clips
+    
+    Returns:
+        (calibration, evaluation) lists of (1, 3, T, H, W) clips; empty if unavailable
+    """
+    try:
+        clips = CalibrationData.action_clips(
+            num_frames=MODELS["action_recognizer"]["num_frames"],
+            image_size=MODELS["action_recognizer"]["input_size"][0]
+        )
+        split = max(1, int(len(clips) * 0.75))
+        logger.info(f"✓ Action calibration: {len(clips)} clips")
+        return clips[:split], clips[split:]
+    except Exception as e:
+        logger.warning(f"Action calibration data unavailable: {e}")
+        return [], []
+
+
+CALIBRATION_LOADERS = {
+    "pill_classifier": load_pill_calibration,
+    "action_recognizer": load_action_calibration
+}
+
+
+def load_pill_eval_loader():
+    """
+    Labeled DataLoader over the pill database's test split
+    
+    Returns:
+        DataLoader for ModelEvaluator, or None if unavailable
+    """
+    try:
+        _, evaluation_records = CalibrationData.pill_splits()
+        eval_loader = CalibrationData.pill_eval_loader(
+            evaluation_records, MODELS["pill_classifier"]["input_size"][0]
+        )
+        if eval_loader is None:
+            logger.warning("Pill test split has no labeled images; accuracy not reported")
+        return eval_loader
+    except Exception as e:
+        logger.warning(f"Pill evaluation loader unavailable: {e}")
+        return None
+
+
+# Labeled test-split loaders for models ModelEvaluator can score
+EVAL_LOADERS = {
+    "pill_classifier": load_pill_eval_loader
+}
+
+
+def quantize_pytorch_model(name: str, calibration_batches: List[torch.Tensor],
+                           evaluation_batches: List[torch.Tensor], eval_loader=None) -> Dict:
+    """
+    Build the INT8 PyTorch variant of a model
+    
+    The model is statically quantized on its calibration inputs, saved to
+    QUANTIZED_DIR and compared against the float model on held-out inputs.
+    
+    Args:
+        name: MODELS entry (pill_classifier or action_recognizer)
+        calibration_batches: Inputs run through the observers
+        evaluation_batches: Held-out inputs for drift
+        eval_loader: Optional labeled DataLoader; when given, ModelEvaluator
+            accuracy of the float and INT8 models is reported alongside
+            prediction agreement
+        
+    Returns:
+        Quantization report entry
+    """
+    model_config = MODELS[name]
+    model = torch.load(model_config["source"], map_location='cpu')
+    model.eval()
+    
+    quantized = Quantizer.pytorch_static_quantize(model, calibration_batches)
+    output_path = QUANTIZED_DIR / f"{name}_int8.pt"
+    Quantizer.save_pytorch(quantized, calibration_batches[0], output_path)
+    
+    entry = {
+        'output': str(output_path),
+        'calibration_samples': sum(len(batch) for batch in calibration_batches),
+        'evaluation_samples': sum(len(batch) for batch in evaluation_batches),
+        'float_size_mb': QuantizationDrift.file_size_mb(model_config["source"]),
+        'int8_size_mb': QuantizationDrift.file_size_mb(output_path),
+        'drift': QuantizationDrift.measure(model, quantized, evaluation_batches)
+    }
+    
+    accuracy = QuantizationDrift.evaluate_accuracy(model, quantized, eval_loader)
+    if accuracy is not None:
+        entry['accuracy'] = accuracy
+    
+    for output_name, drift in entry['drift'].items():
+        logger.info(f"  - {output_name}: top-1 agreement {drift['top1_agreement']:.2%}, "
+                    f"mean |Δp| {drift['mean_abs_prob_diff']:.4f}")
+    return entry
+
+
+# ============================================================================
+# CONVERSION JOBS
+# ============================================================================
+
+# Independent conversions; each runs in its own process and is skipped when
+# its source weights and settings match the manifest
+CONVERSION_JOBS = {
+    "yolov8_pill_detector": {"kind": "yolov8", "model": "yolov8_pill_detector"},
+    "pill_classifier": {"kind": "tflite", "model": "pill_classifier"},
+    "action_recognizer": {"kind": "tflite", "model": "action_recognizer"},
+    "pose_estimator": {"kind": "tflite", "model": "pose_estimator"},
+    "pill_classifier_int8": {"kind": "int8", "model": "pill_classifier"},
+    "action_recognizer_int8": {"kind": "int8", "model": "action_recognizer"},
+    "pose_detector": {"kind": "download", "url": MEDIAPIPE_MODELS["pose_detector"],
+                      "output": OUTPUT_DIR / "pose_detector.tflite"},
+    "hand_detector": {"kind": "download", "url": MEDIAPIPE_MODELS["hand_detector"],
+                      "output": OUTPUT_DIR / "hand_detector.tflite"},
+}
+
+
+def job_source(job: str) -> Optional[str]:
+    """Source weights of a job (None for downloads)."""
+    spec = CONVERSION_JOBS[job]
+    return MODELS[spec["model"]]["source"] if "model" in spec else None
+
+
+def job_outputs(job: str) -> List[Path]:
+    """Files a job produces."""
+    spec = CONVERSION_JOBS[job]
+    if spec["kind"] == "download":
+        return [Path(spec["output"])]
+    if spec["kind"] == "int8":
+        return [QUANTIZED_DIR / f"{spec['model']}_int8.pt"]
+    output = Path(MODELS[spec["model"]]["output"])
+    if spec["kind"] == "tflite":
+        return [output, output.with_suffix('.onnx')]
+    return [output]
+
+
+def job_settings(job: str) -> Dict:
+    """Everything besides the source weights that affects a job's outputs."""
+    spec = CONVERSION_JOBS[job]
+    settings = {'converter_version': CONVERTER_VERSION, **spec}
+    if "model" in spec:
+        settings['model_config'] = MODELS[spec["model"]]
+        if spec["kind"] == "int8" or MODELS[spec["model"]]["quantization"] == "integer":
+            settings['calibration'] = {
+                'samples': CALIBRATION_SAMPLES,
+                'pill_data_dir': PILL_DATA_DIR,
+                'video_dir': CALIBRATION_VIDEO_DIR
+            }
+    return settings
+
+
+def _validate_tflite(path) -> Dict:
+    return {
+        'valid': TFLiteValidator.validate(str(path)),
+        'latency': TFLiteValidator.benchmark(str(path), num_iterations=50)
+    }
+
+
+def run_conversion_job(job: str) -> Dict:
+    """
+    Run one conversion job (in a worker process)
+    
+    Returns:
+        {'success', 'validation', 'duration_seconds'}
+    """
+    spec = CONVERSION_JOBS[job]
+    start = time.perf_counter()
+    validation = {}
+    logger.info(f"\n▶ {job}")
+    
+    try:
+        if spec["kind"] == "download":
+            success = MediaPipeTFLiteConverter.download(spec["url"], spec["output"])
+            if success:
+                validation = _validate_tflite(spec["output"])
+        
+        elif spec["kind"] == "yolov8":
+            model_config = MODELS[spec["model"]]
+            success = YOLOv8Converter.convert(
+                model_config["source"], model_config["output"], model_config["input_size"]
+            )
+            if success:
+                validation = _validate_tflite(model_config["output"])
+        
+        elif spec["kind"] == "tflite":
+            model_config = MODELS[spec["model"]]
+            quantization = model_config["quantization"]
+            representative_dataset = None
+            if quantization == "integer":
+                calibration, _ = CALIBRATION_LOADERS[spec["model"]]()
+                if calibration:
+                    representative_dataset = CalibrationData.representative_dataset(calibration)
+                else:
+                    logger.warning(f"{job}: no calibration data, falling back to dynamic range")
+                    quantization = "dynamic"
+            success = TFLiteConverter.pytorch_to_tflite(
+                model_config["source"],
+                model_config["output"],
+                model_config["input_size"],
+                quantization,
+                representative_dataset,
+                num_frames=model_config.get("num_frames")
+            )
+            if success:
+                validation = _validate_tflite(model_config["output"])
+                validation['quantization'] = quantization
+        
+        elif spec["kind"] == "int8":
+            calibration, evaluation = CALIBRATION_LOADERS[spec["model"]]()
+            if not calibration:
+                raise ValueError("no calibration data")
+            eval_loader = EVAL_LOADERS[spec["model"]]() if spec["model"] in EVAL_LOADERS else None
+            validation = quantize_pytorch_model(spec["model"], calibration, evaluation, eval_loader)
+            success = True
+        
+        else:
+            raise ValueError(f"Unknown job kind: {spec['kind']}")
+    
+    except Exception as e:
+        logger.error(f"✗ {job} failed: {e}")
+        success = False
+        validation = {'error': str(e)}
+    
+    return {
+        'success': bool(success),
+        'validation': validation,
+        'duration_seconds': round(time.perf_counter() - start, 2)
+    }
+
+
+# ============================================================================
+# MAIN CONVERSION PIPELINE
+# ============================================================================
+
+def convert_all_models(force: bool = False, jobs: Optional[List[str]] = None,
+                       workers: Optional[int] = None) -> Dict[str, str]:
+    """
+    Convert all models incrementally and in parallel
+    
+    Jobs whose source weights (SHA-256) and converter settings match the
+    manifest, and whose outputs still exist, are skipped. The remaining
+    jobs run in separate processes; the manifest is saved after each one
+    finishes, so an interrupted run keeps its progress.
+    
+    Args:
+        force: Reconvert even when up to date
+        jobs: CONVERSION_JOBS names to consider (default: all)
+        workers: Parallel conversion processes (default: min(stale jobs, CPU cores / 2))
+        
+    Returns:
+        Job name -> 'converted', 'up_to_date', 'failed' or 'missing_source'
+    """
+    logger.info("=" * 70)
+    logger.info("TENSORFLOW LITE MODEL CONVERSION PIPELINE")
+    logger.info("=" * 70)
+    
+    manifest = ConversionManifest(MANIFEST_PATH)
+    results = {}
+    pending = {}
+    
+    for job in jobs or list(CONVERSION_JOBS):
+        source = job_source(job)
+        if source is not None and not os.path.exists(source):
+            logger.warning(f"{job}: source {source} not found, skipping")
+            results[job] = 'missing_source'
+            continue
+        
+        digest = manifest.source_digest(job, source)
+        settings = job_settings(job)
+        key = manifest.job_key(digest, settings)
+        if not force and manifest.is_up_to_date(job, key):
+            results[job] = 'up_to_date'
+            continue
+        pending[job] = (source, digest, settings, key)
+    
+    logger.info(f"{len(pending)} job(s) to convert, "
+                f"{sum(1 for r in results.values() if r == 'up_to_date')} up to date")
+    
+    if pending:
+        workers = workers or max(1, min(len(pending), (os.cpu_count() or 2) // 2))
+        # spawn: TensorFlow and PyTorch thread pools are not fork-safe
+        with ProcessPoolExecutor(max_workers=workers, mp_context=get_context('spawn')) as pool:
+            futures = {pool.submit(run_conversion_job, job): job for job in pending}
+            for future in as_completed(futures):
+                job = futures[future]
+                source, digest, settings, key = pending[job]
+                try:
+                    outcome = future.result()
+                except Exception as e:
+                    outcome = {'success': False, 'validation': {'error': str(e)},
+                               'duration_seconds': None}
+                
+                status = 'converted' if outcome['success'] else 'failed'
+                manifest.record(job, key, source, digest, settings, job_outputs(job), status,
+                                outcome['validation'], outcome['duration_seconds'])
+                manifest.save()
+                results[job] = status
+    
+    # Drift of the INT8 PyTorch variants, kept alongside the TFLite models
+    quantization_report = {
+        spec["model"]: manifest.entries.get(job, {}).get('validation')
+        for job, spec in CONVERSION_JOBS.items() if spec["kind"] == "int8"
+    }
+    with open(OUTPUT_DIR / "quantization_report.json", 'w') as f:
+        json.dump(quantization_report, f, indent=2)
+    
+    # Summary
+    logger.info("\n" + "=" * 70)
+    logger.info("CONVERSION SUMMARY")
+    logger.info("=" * 70)
+    
+    labels = {
+        'converted': "✓ CONVERTED",
+        'up_to_date': "✓ UP TO DATE",
+        'failed': "✗ FAILED",
+        'missing_source': "- SOURCE MISSING"
+    }
+    for job, status in results.items():
+        outputs = manifest.entries.get(job, {}).get('outputs', []) if status != 'failed' else []
+        size = sum(output['size_mb'] for output in outputs)
+        logger.info(f"{job}: {labels[status]}" + (f" ({size:.1f} MB)" if outputs else ""))
+    
+    logger.info(f"\nModels saved to: {OUTPUT_DIR}")
+    logger.info(f"Manifest: {MANIFEST_PATH}")
+    
+    return results
+
+
+def main():
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Convert models for mobile and CPU deployment")
+    parser.add_argument('--force', action='store_true', help="Reconvert even if up to date")
+    parser.add_argument('--jobs', nargs='*', choices=list(CONVERSION_JOBS),
+                        help="Jobs to run (default: all)")
+    parser.add_argument('--workers', type=int, help="Parallel conversion processes")
+    args = parser.parse_args()
+    
+    results = convert_all_models(args.force, args.jobs, args.workers)
+    return 1 if 'failed' in results.values() else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,397 @@
+"""
+Local drug-name index built from an offline RxNorm release.
+Provides network-free drug and strength validation for the prescription
+pipeline, with the RxNav-backed DatabaseValidator as an optional fallback.
+"""
+
+import argparse
+import os
+import re
+import sqlite3
+import threading
+from contextlib import closing
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import config
+from fuzzy_matcher import TrigramMatcher
+
+
+# RxNorm term types kept in the index (ingredients, brands, clinical drugs, synonyms)
+INDEXED_TERM_TYPES = {
+    'IN', 'PIN', 'MIN', 'BN',           # ingredients and brand names
+    'SCD', 'SBD', 'SCDC', 'SBDC',       # clinical / branded drugs and components
+    'SY', 'TMSY', 'PSN'                 # synonyms and prescribable names
+}
+
+# Term types that name a drug on their own (used as the display name)
+PREFERRED_TERM_TYPES = ('IN', 'BN', 'PIN', 'MIN', 'PSN', 'SCD', 'SBD')
+
+# "amoxicillin 500 MG" / "acetaminophen 325 MG / oxycodone 5 MG"
+STRENGTH_PATTERN = re.compile(
+    r'([a-z][a-z0-9 ,\-]*?)\s+(\d+(?:\.\d+)?)\s*(mg|mcg|g|ml|unt|meq|%)(?:/(?:ml|actuat|hr))?',
+    re.IGNORECASE
+)
+# "amoxicillin 500 MG Oral Capsule [Amoxil]": the brand a branded drug belongs to
+BRAND_PATTERN = re.compile(r'\[([^\]]+)\]\s*$')
+DOSAGE_PATTERN = re.compile(r'(\d+(?:\.\d+)?)\s*(mg|mcg|g|ml|unt|units?|meq|%)', re.IGNORECASE)
+
+# RXNCONSO.RRF column positions
+_RXCUI, _LAT, _SAB, _TTY, _STR, _SUPPRESS = 0, 1, 11, 12, 14, 16
+
+
+def normalize_drug_name(name: str) -> str:
+    """Normalize a drug name for index lookups (case, punctuation, spacing)."""
+    name = re.sub(r'[^a-z0-9%/.]+', ' ', name.lower())
+    return ' '.join(name.split())
+
+
+def normalize_strength(value: str, unit: str) -> str:
+    """Canonical strength string, e.g. ('500', 'MG') -> '500 mg'."""
+    number = float(value)
+    unit = unit.lower()
+    if unit in ('unit', 'units'):
+        unit = 'unt'
+    return f"{number:g} {unit}"
+
+
+class DrugIndex:
+    """
+    SQLite-backed index of normalized drug names, synonyms and strengths.
+
+    Lookups are served from an in-memory dictionary loaded from the database
+    on first use, so validation never leaves the process.
+    """
+
+    def __init__(self, db_path: Optional[str] = None):
+        """
+        Initialize the index.
+
+        Args:
+            db_path: SQLite file (defaults to config.DRUG_INDEX_PATH)
+        """
+        self.db_path = db_path or config.DRUG_INDEX_PATH
+        self._names: Optional[Dict[str, Tuple[str, str]]] = None
+        self._strengths: Dict[str, List[str]] = {}
+        self._matcher: Optional[TrigramMatcher] = None
+        self._load_lock = threading.Lock()
+
+    @property
+    def exists(self) -> bool:
+        """Whether a built index is available on disk."""
+        return os.path.exists(self.db_path)
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path)
+
+    # ------------------------------------------------------------------
+    # Building
+    # ------------------------------------------------------------------
+
+    def build_from_rxnorm(self, rrf_dir: str, batch_size: int = 50000) -> Dict[str, int]:
+        """
+        Bulk-load the index from an RxNorm full release.
+
+        Args:
+            rrf_dir: Directory containing RXNCONSO.RRF (the release's ``rrf`` folder)
+            batch_size: Rows inserted per transaction batch
+
+        Returns:
+            Counts of concepts, names and strengths loaded
+        """
+        conso_path = os.path.join(rrf_dir, 'RXNCONSO.RRF')
+        if not os.path.exists(conso_path):
+            raise FileNotFoundError(f"RXNCONSO.RRF not found in {rrf_dir}")
+
+        os.makedirs(os.path.dirname(self.db_path) or '.', exist_ok=True)
+        tmp_path = self.db_path + '.tmp'
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+        conn = sqlite3.connect(tmp_path)
+        conn.executescript("""
+            PRAGMA journal_mode = OFF;
+            PRAGMA synchronous = OFF;
+            CREATE TABLE concepts (rxcui TEXT PRIMARY KEY, name TEXT, tty TEXT);
+            CREATE TABLE names (normalized TEXT, rxcui TEXT, tty TEXT);
+            CREATE TABLE strengths (normalized TEXT, strength TEXT);
+        """)
+
+        names, strengths, concepts = [], [], {}
+        counts = {'concepts': 0, 'names': 0, 'strengths': 0}
+
+        def flush():
+            conn.executemany("INSERT INTO names VALUES (?, ?, ?)", names)
+            conn.executemany("INSERT INTO strengths VALUES (?, ?)", strengths)
+            counts['names'] += len(names)
+            counts['strengths'] += len(strengths)
+            names.clear()
+            strengths.clear()
+
+        with open(conso_path, encoding='utf-8') as f:
+            for line in f:
+                fields = line.rstrip('\n').split('|')
+                if len(fields) <= _SUPPRESS:
+                    continue
+                if fields[_LAT] != 'ENG' or fields[_SAB] != 'RXNORM':
+                    continue
+                if fields[_SUPPRESS] not in ('', 'N'):
+                    continue
+                tty = fields[_TTY]
+                if tty not in INDEXED_TERM_TYPES:
+                    continue
+
+                rxcui, text = fields[_RXCUI], fields[_STR]
+                normalized = normalize_drug_name(text)
+                names.append((normalized, rxcui, tty))
+
+                # Keep the most preferred display name per concept
+                rank = PREFERRED_TERM_TYPES.index(tty) if tty in PREFERRED_TERM_TYPES else len(PREFERRED_TERM_TYPES)
+                if rxcui not in concepts or rank < concepts[rxcui][2]:
+                    concepts[rxcui] = (text, tty, rank)
+
+                # Clinical drug names carry strengths per ingredient; branded
+                # drugs also file them under the brand (BN concepts have none)
+                if tty in ('SCD', 'SBD', 'SCDC', 'SBDC'):
+                    brand = BRAND_PATTERN.search(text)
+                    components = re.sub(r'^\d+ hr ', '', BRAND_PATTERN.sub('', text),
+                                        flags=re.IGNORECASE)
+                    for ingredient, value, unit in STRENGTH_PATTERN.findall(components):
+                        strength = normalize_strength(value, unit)
+                        strengths.append((normalize_drug_name(ingredient), strength))
+                        if brand:
+                            strengths.append((normalize_drug_name(brand.group(1)), strength))
+
+                if len(names) >= batch_size:
+                    flush()
+
+        flush()
+        conn.executemany(
+            "INSERT INTO concepts VALUES (?, ?, ?)",
+            ((rxcui, text, tty) for rxcui, (text, tty, _) in concepts.items())
+        )
+        counts['concepts'] = len(concepts)
+
+        conn.executescript("""
+            CREATE INDEX idx_names_normalized ON names (normalized);
+            CREATE INDEX idx_strengths_normalized ON strengths (normalized);
+        """)
+        conn.commit()
+        conn.close()
+
+        os.replace(tmp_path, self.db_path)
+        self._names = None
+        self._strengths = {}
+        self._matcher = None
+        return counts
+
+    # ------------------------------------------------------------------
+    # Lookup
+    # ------------------------------------------------------------------
+
+    def _ensure_loaded(self):
+        if self._names is not None:
+            return
+        with self._load_lock:
+            if self._names is not None:
+                return
+            names = {}
+            with closing(self._connect()) as conn:
+                rows = conn.execute("""
+                    SELECT n.normalized, n.rxcui, c.name
+                    FROM names n JOIN concepts c ON c.rxcui = n.rxcui
+                """)
+                for normalized, rxcui, display in rows:
+                    names.setdefault(normalized, (rxcui, display))
+            self._names = names
+
+    def lookup(self, name: str) -> Optional[Dict[str, str]]:
+        """
+        Exact lookup of a drug name or synonym.
+
+        Returns:
+            {'rxcui', 'name'} for the matching concept, or None
+        """
+        self._ensure_loaded()
+        match = self._names.get(normalize_drug_name(name))
+        if match is None:
+            return None
+        return {'rxcui': match[0], 'name': match[1]}
+
+    def fuzzy_lookup(self, name: str, k: int = 5,
+                     threshold: Optional[float] = None) -> List[Dict]:
+        """
+        Approximate lookup for misspelled or OCR-garbled names.
+
+        Args:
+            name: Drug name as extracted
+            k: Maximum matches
+            threshold: Minimum similarity (defaults to config.SIMILARITY_THRESHOLD)
+
+        Returns:
+            [{'rxcui', 'name', 'matched', 'score'}] best first
+        """
+        if self._matcher is None:
+            self._ensure_loaded()
+            with self._load_lock:
+                if self._matcher is None:
+                    self._matcher = TrigramMatcher(self._names)
+
+        if threshold is None:
+            threshold = config.SIMILARITY_THRESHOLD
+
+        matches = []
+        for matched, score in self._matcher.top_k(normalize_drug_name(name), k, threshold):
+            rxcui, display = self._names[matched]
+            matches.append({'rxcui': rxcui, 'name': display, 'matched': matched, 'score': score})
+        return matches
+
+    def get_strengths(self, name: str) -> List[str]:
+        """Known strengths for an ingredient, e.g. ['250 mg', '500 mg']."""
+        normalized = normalize_drug_name(name)
+        if normalized not in self._strengths:
+            with closing(self._connect()) as conn:
+                rows = conn.execute(
+                    "SELECT DISTINCT strength FROM strengths WHERE normalized = ?",
+                    (normalized,)
+                ).fetchall()
+            self._strengths[normalized] = sorted(r[0] for r in rows)
+        return self._strengths[normalized]
+
+    def iter_names(self) -> Iterator[str]:
+        """Every normalized name in the index."""
+        self._ensure_loaded()
+        return iter(self._names)
+
+    def __len__(self) -> int:
+        self._ensure_loaded()
+        return len(self._names)
+
+
+class LocalDrugValidator:
+    """
+    Drop-in replacement for DatabaseValidator backed by a local DrugIndex.
+
+    Names found in the index are validated locally. Misses go to the
+    optional remote fallback (the RxNav DatabaseValidator) unless running
+    offline, in which case they are reported as invalid.
+    """
+
+    def __init__(self, index: DrugIndex, fallback=None):
+        """
+        Initialize the validator.
+
+        Args:
+            index: Local drug index
+            fallback: DatabaseValidator for names the index does not know (None when offline)
+        """
+        self.index = index
+        self.fallback = fallback
+
+    @property
+    def thread_safe(self) -> bool:
+        """Index lookups are read-only; the remote fallback makes no such promise."""
+        return self.fallback is None
+
+    def match_drug(self, drug_name: str) -> Optional[Dict]:
+        """Exact index lookup, falling back to the fuzzy matcher."""
+        match = self.index.lookup(drug_name)
+        if match:
+            return {**match, 'score': 1.0}
+        candidates = self.index.fuzzy_lookup(drug_name, k=1)
+        return candidates[0] if candidates else None
+
+    def validate_drug_name(self, drug_name: str) -> Tuple[bool, str]:
+        """Check a drug name; returns (is_valid, normalized_name)."""
+        match = self.match_drug(drug_name)
+        if match:
+            return True, match['name']
+        if self.fallback is not None:
+            return self.fallback.validate_drug_name(drug_name)
+        return False, drug_name
+
+    def validate_dosage(self, drug_name: str, dosage: Optional[str]) -> Tuple[bool, List[str]]:
+        """
+        Check a dosage against the strengths known for a drug.
+
+        A dosage only validates against known strengths; drugs without
+        strength data come back unverified (False, []).
+        """
+        known = self.index.get_strengths(drug_name)
+        if not known:
+            # Brand names and synonyms carry strengths under the concept name
+            match = self.index.lookup(drug_name)
+            if match:
+                known = self.index.get_strengths(match['name'])
+        if not dosage:
+            return False, known
+
+        match = DOSAGE_PATTERN.search(dosage)
+        if not match:
+            return False, known
+        if not known:
+            # No strength data for this drug, so the dosage can't be verified
+            return False, known
+        return normalize_strength(*match.groups()) in known, known
+
+    def validate_prescription(self, drug_name: str, dosage: Optional[str] = None,
+                              frequency: Optional[str] = None) -> Dict:
+        """Validate a drug, its dosage and frequency."""
+        match = self.match_drug(drug_name)
+        if match is None and self.fallback is not None:
+            return self.fallback.validate_prescription(drug_name, dosage, frequency)
+
+        result = {
+            'drug_name': drug_name,
+            'drug_valid': match is not None,
+            'normalized_name': match['name'] if match else drug_name,
+            'rxcui': match['rxcui'] if match else None,
+            'match_score': match['score'] if match else 0.0,
+            'dosage': dosage,
+            'dosage_valid': False,
+            'known_strengths': [],
+            'frequency': frequency,
+            'source': 'local_index'
+        }
+        if match:
+            result['dosage_valid'], result['known_strengths'] = self.validate_dosage(
+                match['name'], dosage
+            )
+        return result
+
+    def __getattr__(self, name: str):
+        # Anything else the pipeline needs comes from the remote validator
+        if self.fallback is None:
+            raise AttributeError(name)
+        return getattr(self.fallback, name)
+
+
+def main():
+    """Command-line entry point for building and querying the index."""
+    parser = argparse.ArgumentParser(description="Local RxNorm drug-name index")
+    parser.add_argument('--db', default=config.DRUG_INDEX_PATH, help="Index database path")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    build = subparsers.add_parser('build', help="Build the index from an RxNorm release")
+    build.add_argument('rrf_dir', help="Directory containing RXNCONSO.RRF")
+
+    lookup = subparsers.add_parser('lookup', help="Look up a drug name")
+    lookup.add_argument('name')
+
+    args = parser.parse_args()
+    index = DrugIndex(args.db)
+
+    if args.command == 'build':
+        counts = index.build_from_rxnorm(args.rrf_dir)
+        print(f"Built {index.db_path}: {counts['concepts']} concepts, "
+              f"{counts['names']} names, {counts['strengths']} strengths")
+    else:
+        match = index.lookup(args.name)
+        if match:
+            print(f"{match['name']} (RxCUI {match['rxcui']})")
+            print(f"Strengths: {', '.join(index.get_strengths(args.name)) or 'unknown'}")
+        else:
+            print(f"No match for '{args.name}'")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+"""
+Indexed approximate string matching for drug names.
+A trigram inverted index produces a small candidate shortlist, and only the
+shortlist is scored with Levenshtein similarity, so top-k lookups against a
+full RxNorm vocabulary avoid a linear fuzzywuzzy scan.
+"""
+
+import math
+from collections import defaultdict
+from typing import Dict, Iterable, List, Tuple
+
+import numpy as np
+
+try:
+    import Levenshtein
+
+    def similarity(a: str, b: str) -> float:
+        """Normalized Levenshtein similarity in [0, 1]."""
+        return Levenshtein.ratio(a, b)
+
+except ImportError:
+    from difflib import SequenceMatcher
+
+    def similarity(a: str, b: str) -> float:
+        """Normalized similarity in [0, 1] (difflib fallback)."""
+        return SequenceMatcher(None, a, b).ratio()
+
+
+def trigrams(text: str) -> List[str]:
+    """Padded character trigrams of a string."""
+    padded = f"  {text} "
+    return [padded[i:i + 3] for i in range(len(padded) - 2)]
+
+
+class TrigramMatcher:
+    """
+    Approximate matcher over a fixed vocabulary.
+
+    Terms are numbered in length order, so every trigram posting list is
+    sorted by term length and can be sliced to the window of lengths that
+    could still reach the similarity threshold. Shared-trigram counts for
+    that window are computed in one vectorized pass (a term within ``d``
+    insertions/deletions shares at least ``|Q| - 3d`` of the query's
+    trigrams), and only the best-overlapping shortlist is scored exactly.
+
+    The similarity ratio is ``1 - d / (|q| + |t|)`` with ``d`` the
+    insertion/deletion distance, so reaching threshold ``s`` needs
+    ``d <= (1 - s)(|q| + |t|)`` and, since ``d >= ||q| - |t||``,
+    ``|q|s/(2-s) <= |t| <= |q|(2-s)/s``.
+    """
+
+    def __init__(self, vocabulary: Iterable[str], shortlist_size: int = 50):
+        """
+        Build the index.
+
+        Args:
+            vocabulary: Normalized strings to match against
+            shortlist_size: Candidates scored exactly per query
+        """
+        self.shortlist_size = shortlist_size
+        self.vocabulary: List[str] = sorted(set(vocabulary), key=len)
+        self._lengths = np.fromiter((len(term) for term in self.vocabulary),
+                                    dtype=np.int64, count=len(self.vocabulary))
+        self._length_offsets: List[int] = []
+        postings: Dict[str, List[int]] = defaultdict(list)
+
+        for term_id, term in enumerate(self.vocabulary):
+            while len(self._length_offsets) <= len(term):
+                self._length_offsets.append(term_id)
+            for gram in set(trigrams(term)):
+                postings[gram].append(term_id)
+
+        self._postings = {
+            gram: np.asarray(ids, dtype=np.int32) for gram, ids in postings.items()
+        }
+
+    def __len__(self) -> int:
+        return len(self.vocabulary)
+
+    def _id_range(self, min_length: int, max_length: int) -> Tuple[int, int]:
+        """Term-id interval covering terms with length in [min_length, max_length]."""
+        offsets = self._length_offsets
+        lo = offsets[min_length] if min_length < len(offsets) else len(self.vocabulary)
+        hi = offsets[max_length + 1] if max_length + 1 < len(offsets) else len(self.vocabulary)
+        return lo, hi
+
+    def top_k(self, query: str, k: int = 5, threshold: float = 0.0) -> List[Tuple[str, float]]:
+        """
+        Best matches for a query.
+
+        Args:
+            query: Normalized query string
+            k: Maximum matches to return
+            threshold: Minimum similarity score
+
+        Returns:
+            (term, score) pairs, best first
+        """
+        if not query:
+            return []
+
+        query_grams = set(trigrams(query))
+        query_length = len(query)
+        # Term lengths whose length difference alone keeps them under the threshold
+        if threshold > 0:
+            min_length = int(math.ceil(query_length * threshold / (2.0 - threshold) - 1e-9))
+            max_length = int(math.floor(query_length * (2.0 - threshold) / threshold + 1e-9))
+        else:
+            min_length, max_length = 0, len(self._length_offsets)
+        lo, hi = self._id_range(min_length, max_length)
+        if lo >= hi:
+            return []
+
+        slices = []
+        for gram in query_grams:
+            posting = self._postings.get(gram)
+            if posting is not None:
+                start, stop = np.searchsorted(posting, (lo, hi))
+                if stop > start:
+                    slices.append(posting[start:stop])
+        if slices:
+            shared = np.bincount(np.concatenate(slices) - lo, minlength=hi - lo)
+        else:
+            shared = np.zeros(hi - lo, dtype=np.int64)
+        # Insertions/deletions each term may differ by and still reach the threshold
+        max_edits = np.floor((1.0 - threshold) * (query_length + self._lengths[lo:hi]) + 1e-9)
+        # Short queries at low thresholds can match terms sharing no trigram at all
+        min_shared = len(query_grams) - 3 * max_edits
+        candidates = np.flatnonzero(shared >= min_shared)
+        if len(candidates) > self.shortlist_size:
+            best = np.argpartition(shared[candidates], -self.shortlist_size)
+            candidates = candidates[best[-self.shortlist_size:]]
+
+        matches = []
+        for offset in candidates:
+            term = self.vocabulary[lo + int(offset)]
+            score = similarity(query, term)
+            if score >= threshold:
+                matches.append((term, score))
+
+        matches.sort(key=lambda m: m[1], reverse=True)
+        return matches[:k]
+
+    def best_match(self, query: str, threshold: float = 0.0):
+        """Single best (term, score) at or above threshold, or None."""
+        matches = self.top_k(query, k=1, threshold=threshold)
+        return matches[0] if matches else None
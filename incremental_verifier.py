@@ -0,0 +1,260 @@
+"""
+Incremental real-time intake verification.
+Keeps running per-modality statistics over a sliding window of frames in
+fixed-size ring buffers, so each processed frame costs the same regardless
+of window length and many live streams can share one CPU host.
+"""
+
+import math
+import time
+from typing import Dict, Optional
+
+import numpy as np
+
+from src.intake_verification.verification_engine import VerificationEvent, IntakeStatus
+
+DEFAULT_WEIGHTS = {
+    'pill_detection': 0.30,
+    'hand_tracking': 0.25,
+    'action_recognition': 0.45
+}
+
+
+class RingStat:
+    """Sliding-window sum and count of a per-frame value (NaN = no observation)."""
+
+    def __init__(self, size: int):
+        self._values = np.full(size, np.nan)
+        self._index = 0
+        self.total = 0.0
+        self.count = 0
+
+    def push(self, value: Optional[float]):
+        """Add the newest frame's value, evicting the oldest."""
+        old = float(self._values[self._index])
+        if not math.isnan(old):
+            self.total -= old
+            self.count -= 1
+
+        value = np.nan if value is None else float(value)
+        self._values[self._index] = value
+        if not math.isnan(value):
+            self.total += value
+            self.count += 1
+        self._index = (self._index + 1) % len(self._values)
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def clear(self):
+        self._values.fill(np.nan)
+        self.total = 0.0
+        self.count = 0
+
+
+class IncrementalRealTimeVerifier:
+    """
+    Drop-in ``process_frame`` for RealTimeVerifier with constant work per frame.
+
+    ``frame_data`` uses the RealTimeVerifier keys (``frame_id``,
+    ``pill_center``, ``hand_detected``, ``mouth_detected``) and optionally
+    ``pill_confidence``, ``hand_confidence``, ``hand_position``,
+    ``mouth_position`` and ``swallow_score``. Pill path length and
+    hand-to-mouth contacts are kept as running sums over the window, swallow
+    scores over the shorter ``swallow_window``. Modalities with no
+    observations in the window count as zero confidence. A
+    VerificationEvent is emitted on the first frame the fused confidence
+    crosses ``likely_threshold`` with pill, hand-to-mouth and swallow
+    evidence all present; the next event needs a new hand-to-mouth contact
+    and at least ``cooldown_frames`` frames in between.
+    """
+
+    def __init__(self, verification_engine=None, max_buffer_size: int = 90,
+                 swallow_window: int = 16, stream_id: str = 'stream',
+                 mouth_distance_threshold: float = 60.0,
+                 min_pill_movement: float = 50.0, min_contact_frames: int = 3,
+                 disappearance_frames: int = 5, confirmed_threshold: float = 0.75,
+                 likely_threshold: float = 0.6, cooldown_frames: Optional[int] = None):
+        """
+        Initialize the verifier.
+
+        Args:
+            verification_engine: VerificationEngine supplying modality weights
+            max_buffer_size: Sliding window length in frames
+            swallow_window: Frames swallow scores are averaged over
+            stream_id: Prefix for emitted event ids
+            mouth_distance_threshold: Hand-to-mouth distance (pixels) counted as contact
+            min_pill_movement: Pill path length (pixels) for full pill confidence
+            min_contact_frames: Contact frames for full hand confidence
+            disappearance_frames: Frames without the pill after which it counts as taken
+            confirmed_threshold: Fused confidence for CONFIRMED
+            likely_threshold: Fused confidence for LIKELY (and for emitting an event)
+            cooldown_frames: Frames after an event with no new event (defaults to max_buffer_size)
+        """
+        self.verification_engine = verification_engine
+        self.weights = dict(getattr(verification_engine, 'weights', None) or DEFAULT_WEIGHTS)
+        self.max_buffer_size = max_buffer_size
+        self.stream_id = stream_id
+        self.mouth_distance_threshold = mouth_distance_threshold
+        self.min_pill_movement = min_pill_movement
+        self.min_contact_frames = min_contact_frames
+        self.disappearance_frames = disappearance_frames
+        self.confirmed_threshold = confirmed_threshold
+        self.likely_threshold = likely_threshold
+        self.cooldown_frames = max_buffer_size if cooldown_frames is None else cooldown_frames
+
+        self._pill_confidence = RingStat(max_buffer_size)
+        self._pill_movement = RingStat(max_buffer_size)
+        self._hand_confidence = RingStat(max_buffer_size)
+        self._mouth_contact = RingStat(max_buffer_size)
+        self._swallow_score = RingStat(min(swallow_window, max_buffer_size))
+        self.reset()
+
+    def reset(self):
+        """Forget all evidence, e.g. when a stream restarts."""
+        for stat in (self._pill_confidence, self._pill_movement, self._hand_confidence,
+                     self._mouth_contact, self._swallow_score):
+            stat.clear()
+        self._last_pill_center = None
+        self._last_pill_frame = None
+        self._last_contact_frame = None
+        self._contact_onset = None
+        self._last_event_frame = None
+        self._frames_seen = 0
+
+    def _observe(self, frame_data: Dict):
+        frame_id = frame_data.get('frame_id', self._frames_seen)
+
+        pill_center = frame_data.get('pill_center')
+        movement = None
+        if pill_center is not None:
+            if self._last_pill_center is not None:
+                movement = math.hypot(pill_center[0] - self._last_pill_center[0],
+                                      pill_center[1] - self._last_pill_center[1])
+            self._last_pill_center = pill_center
+            self._last_pill_frame = frame_id
+        self._pill_confidence.push(frame_data.get('pill_confidence', 1.0) if pill_center is not None else None)
+        self._pill_movement.push(movement)
+
+        hand_detected = frame_data.get('hand_detected', False)
+        self._hand_confidence.push(frame_data.get('hand_confidence', 1.0) if hand_detected else None)
+
+        hand_position = frame_data.get('hand_position')
+        mouth_position = frame_data.get('mouth_position')
+        if hand_position is not None and mouth_position is not None:
+            contact = math.hypot(hand_position[0] - mouth_position[0],
+                                 hand_position[1] - mouth_position[1]) <= self.mouth_distance_threshold
+        else:
+            contact = bool(hand_detected and frame_data.get('mouth_detected', False))
+        self._mouth_contact.push(1.0 if contact else 0.0)
+        if contact:
+            if self._last_contact_frame is None or frame_id - self._last_contact_frame > 1:
+                self._contact_onset = frame_id
+            self._last_contact_frame = frame_id
+
+        self._swallow_score.push(frame_data.get('swallow_score'))
+        self._frames_seen += 1
+        return frame_id
+
+    def _modal_confidences(self, frame_id: int) -> Dict[str, float]:
+        """Per-modality confidences for modalities observed in the window."""
+        confidences = {}
+
+        if self._pill_confidence.count:
+            disappeared = frame_id - self._last_pill_frame >= self.disappearance_frames
+            motion = 1.0 if disappeared else min(
+                1.0, 0.5 + 0.5 * self._pill_movement.total / self.min_pill_movement
+            )
+            confidences['pill_detection'] = self._pill_confidence.mean * motion
+
+        if self._hand_confidence.count:
+            contact = min(1.0, self._mouth_contact.total / self.min_contact_frames)
+            confidences['hand_tracking'] = self._hand_confidence.mean * contact
+
+        if self._swallow_score.count:
+            confidences['action_recognition'] = self._swallow_score.mean
+
+        return confidences
+
+    def _fuse(self, confidences: Dict[str, float]) -> float:
+        # Missing modalities are not renormalized away: no evidence counts as zero
+        total_weight = sum(self.weights.values())
+        if not total_weight:
+            return 0.0
+        return sum(self.weights.get(name, 0.0) * value
+                   for name, value in confidences.items()) / total_weight
+
+    def process_frame(self, frame_data: Dict) -> Optional[VerificationEvent]:
+        """
+        Add one frame of evidence.
+
+        Args:
+            frame_data: Per-frame observations (see class docstring)
+
+        Returns:
+            VerificationEvent if an intake was recognized on this frame, otherwise None
+        """
+        frame_id = self._observe(frame_data)
+        confidences = self._modal_confidences(frame_id)
+        final_confidence = self._fuse(confidences)
+
+        if self._last_event_frame is not None and (
+                frame_id - self._last_event_frame < self.cooldown_frames
+                or self._contact_onset is None
+                or self._contact_onset <= self._last_event_frame):
+            return None
+
+        # An intake needs a pill, a hand reaching the mouth and a swallow score
+        # before it can be reported as LIKELY or CONFIRMED
+        if (final_confidence < self.likely_threshold
+                or 'pill_detection' not in confidences
+                or 'action_recognition' not in confidences
+                or not self._mouth_contact.total):
+            return None
+
+        self._last_event_frame = frame_id
+        return self._build_event(frame_data, frame_id, confidences, final_confidence)
+
+    def _build_event(self, frame_data: Dict, frame_id: int, confidences: Dict[str, float],
+                     final_confidence: float) -> VerificationEvent:
+        if final_confidence >= self.confirmed_threshold:
+            status = IntakeStatus.CONFIRMED
+        else:
+            status = IntakeStatus.LIKELY
+
+        pill_disappeared = frame_id - self._last_pill_frame >= self.disappearance_frames
+        reasoning = [
+            f"Pill seen in {self._pill_confidence.count} frames, "
+            f"moved {self._pill_movement.total:.0f} px"
+            + (", then disappeared" if pill_disappeared else ""),
+            f"Hand at mouth in {int(self._mouth_contact.total)} frames"
+        ]
+        if self._swallow_score.count:
+            reasoning.append(f"Mean swallow score {self._swallow_score.mean:.2f}")
+
+        return VerificationEvent(
+            event_id=f"{self.stream_id}_{frame_id}",
+            timestamp=frame_data.get('timestamp', time.time()),
+            pill_detection={
+                'detected': True,
+                'avg_confidence': self._pill_confidence.mean,
+                'movement_distance': self._pill_movement.total,
+                'disappearance_frame': self._last_pill_frame if pill_disappeared else None,
+                'num_frames': self._pill_confidence.count
+            },
+            hand_tracking={
+                'detected': self._hand_confidence.count > 0,
+                'avg_confidence': self._hand_confidence.mean,
+                'mouth_contact_frames': int(self._mouth_contact.total),
+                'last_contact_frame': self._last_contact_frame
+            },
+            action_recognition={
+                'detected': self._swallow_score.count > 0,
+                'avg_confidence': self._swallow_score.mean
+            },
+            modal_confidences=confidences,
+            final_confidence=final_confidence,
+            status=status,
+            reasoning=reasoning
+        )
@@ -0,0 +1,125 @@
+"""Executor-backed inference layer for running blocking model work off the event loop."""
+
+import asyncio
+import functools
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+import config
+
+
+class QueueFullError(Exception):
+    """Raised when the inference queue is at capacity and new work is shed."""
+
+
+class InferenceExecutor:
+    """
+    Bounded thread pool for blocking pipeline calls made from async handlers.
+
+    At most ``max_workers`` calls run at once and at most ``max_queue_size``
+    more wait for a worker. Anything beyond that is rejected immediately with
+    QueueFullError so the server can answer 503 instead of piling up requests.
+    """
+
+    def __init__(self, max_workers: int = None, max_queue_size: int = None,
+                 thread_name_prefix: str = "inference"):
+        """
+        Initialize the executor.
+
+        Args:
+            max_workers: Concurrent blocking calls (defaults to config.INFERENCE_WORKERS)
+            max_queue_size: Calls allowed to wait for a worker (defaults to config.INFERENCE_QUEUE_SIZE)
+            thread_name_prefix: Prefix for worker thread names
+        """
+        self.max_workers = max_workers or config.INFERENCE_WORKERS
+        self.max_queue_size = (
+            max_queue_size if max_queue_size is not None else config.INFERENCE_QUEUE_SIZE
+        )
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix=thread_name_prefix
+        )
+        # Slots are released from worker threads when calls finish
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._rejected = 0
+        self._completed = 0
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of submitted calls still waiting for a worker."""
+        return max(0, self._in_flight - self.max_workers)
+
+    @property
+    def capacity(self) -> int:
+        """Maximum number of running plus queued calls."""
+        return self.max_workers + self.max_queue_size
+
+    def check_capacity(self):
+        """
+        Reject new work if the pool and its queue are full.
+
+        Raises:
+            QueueFullError: If the queue is already at capacity
+        """
+        with self._lock:
+            self._check_capacity_locked()
+
+    def _check_capacity_locked(self):
+        if self._in_flight >= self.capacity:
+            self._rejected += 1
+            raise QueueFullError(
+                f"Inference queue full ({self.queue_depth}/{self.max_queue_size} waiting)"
+            )
+
+    def submit(self, func: Callable, *args, **kwargs) -> Future:
+        """
+        Reserve a slot and schedule a blocking callable on the pool.
+
+        The slot is held until the call itself finishes (or is cancelled
+        before starting), not until whoever awaits it gives up.
+
+        Raises:
+            QueueFullError: If the queue is already at capacity
+        """
+        with self._lock:
+            self._check_capacity_locked()
+            self._in_flight += 1
+        try:
+            future = self._executor.submit(functools.partial(func, *args, **kwargs))
+        except Exception:
+            self._release(None)
+            raise
+        future.add_done_callback(self._release)
+        return future
+
+    def _release(self, _future: Optional[Future]):
+        with self._lock:
+            self._in_flight -= 1
+            self._completed += 1
+
+    async def run(self, func: Callable, *args, **kwargs) -> Any:
+        """
+        Run a blocking callable on the pool and await its result.
+
+        Raises:
+            QueueFullError: If the queue is already at capacity
+        """
+        return await asyncio.wrap_future(self.submit(func, *args, **kwargs))
+
+    def get_statistics(self) -> Dict[str, int]:
+        """Current pool utilisation for health and stats endpoints."""
+        with self._lock:
+            in_flight = self._in_flight
+        return {
+            'workers': self.max_workers,
+            'running': min(in_flight, self.max_workers),
+            'queue_depth': max(0, in_flight - self.max_workers),
+            'queue_capacity': self.max_queue_size,
+            'completed': self._completed,
+            'rejected': self._rejected
+        }
+
+    def shutdown(self, wait: bool = True):
+        """Stop accepting work and release the worker threads."""
+        self._executor.shutdown(wait=wait)
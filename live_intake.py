@@ -0,0 +1,150 @@
+"""
+Live intake verification sessions.
+Turns a stream of encoded camera frames into per-frame evidence for the
+incremental real-time verifier, so intake events can be reported while the
+patient is still on camera.
+"""
+
+import time
+from collections import deque
+from typing import Dict, Optional
+
+import cv2
+import numpy as np
+
+import config
+from incremental_verifier import IncrementalRealTimeVerifier
+
+
+def decode_frame(data: bytes) -> np.ndarray:
+    """
+    Decode one JPEG/PNG/WebP-encoded frame.
+
+    Raises:
+        ValueError: If the bytes are not a decodable image
+    """
+    frame = cv2.imdecode(np.frombuffer(data, dtype=np.uint8), cv2.IMREAD_COLOR)
+    if frame is None:
+        raise ValueError("Could not decode frame")
+    return frame
+
+
+class LiveIntakeSession:
+    """
+    One patient's live camera stream.
+
+    Each frame runs pill detection, hand pose every ``pose_stride`` frames
+    and, every ``action_stride`` frames, adds a sample to a half-overlapping
+    3D CNN window; the results are condensed into the RealTimeVerifier
+    ``frame_data`` keys and passed to an IncrementalRealTimeVerifier.
+    """
+
+    def __init__(self, intake_verifier, session_id: str, pose_stride: int = 2,
+                 action_stride: int = 4, clip_length: int = 16, clip_size: Optional[int] = None,
+                 max_buffer_size: int = 90):
+        """
+        Initialize the session.
+
+        Args:
+            intake_verifier: Loaded IntakeVerifier (provides the models)
+            session_id: Identifier used for emitted event ids
+            pose_stride: Frames between hand pose estimates
+            action_stride: Frames between samples in the action window
+            clip_length: Sampled frames per 3D CNN window
+            clip_size: Side length frames are resized to for the 3D CNN
+                (same default as StreamingIntakeVerifier)
+            max_buffer_size: Real-time verifier window in frames
+        """
+        self.intake_verifier = intake_verifier
+        self.session_id = session_id
+        self.pose_stride = pose_stride
+        self.action_stride = action_stride
+        self.clip_length = clip_length
+        streaming_config = getattr(intake_verifier, 'config', {}).get('streaming', {})
+        self.clip_size = clip_size or streaming_config.get('clip_size', config.INTAKE_CLIP_SIZE)
+        self.realtime_verifier = IncrementalRealTimeVerifier(
+            getattr(intake_verifier, 'verification_engine', None),
+            max_buffer_size=max_buffer_size,
+            stream_id=session_id
+        )
+
+        self._window = deque(maxlen=clip_length)
+        self._samples_since_window = 0
+        self._swallow_score: Optional[float] = None
+        self._hand_detected = False
+        self._mouth_detected = False
+        self._hand_confidence: Optional[float] = None
+        self.frames_processed = 0
+        self.events_emitted = 0
+        self.started_at = time.time()
+
+    def _detect_pill(self, frame: np.ndarray, frame_id: int) -> Dict:
+        detections = self.intake_verifier.pill_detector.detect(frame, frame_id=frame_id)
+        if not detections:
+            return {}
+        best = max(detections, key=lambda d: d.confidence)
+        return {'pill_center': [best.center_x, best.center_y], 'pill_confidence': best.confidence}
+
+    def _estimate_hands(self, frame: np.ndarray, frame_id: int):
+        poses = self.intake_verifier.hand_estimator.estimate(frame, frame_id=frame_id)
+        self._hand_detected = bool(poses)
+        self._mouth_detected = any(p.is_near_mouth for p in poses)
+        self._hand_confidence = max((p.avg_confidence for p in poses), default=None)
+
+    def _sample_action(self, frame: np.ndarray):
+        self._window.append(cv2.resize(frame, (self.clip_size, self.clip_size)))
+        self._samples_since_window += 1
+        # Half-overlapping windows, as in offline streaming verification
+        if (len(self._window) < self.clip_length
+                or self._samples_since_window < max(1, self.clip_length // 2)):
+            return
+        self._samples_since_window = 0
+        classifications = self.intake_verifier.action_recognizer.predict_3dcnn(
+            np.stack(self._window), frame_stride=1
+        )
+        positive = [c.confidence for c in classifications if c.is_positive]
+        self._swallow_score = max(positive) if positive else 0.0
+
+    def process_frame(self, frame: np.ndarray, timestamp: Optional[float] = None):
+        """
+        Add one camera frame.
+
+        Args:
+            frame: BGR frame
+            timestamp: Capture time reported by the client
+
+        Returns:
+            VerificationEvent if an intake was recognized on this frame, otherwise None
+        """
+        frame_id = self.frames_processed
+        self.frames_processed += 1
+
+        frame_data = {'frame_id': frame_id, 'timestamp': timestamp or time.time()}
+        frame_data.update(self._detect_pill(frame, frame_id))
+
+        if frame_id % self.pose_stride == 0:
+            self._estimate_hands(frame, frame_id)
+        # Hand state is held between pose estimates
+        frame_data['hand_detected'] = self._hand_detected
+        frame_data['mouth_detected'] = self._mouth_detected
+        if self._hand_detected and self._hand_confidence is not None:
+            frame_data['hand_confidence'] = self._hand_confidence
+
+        if frame_id % self.action_stride == 0:
+            self._sample_action(frame)
+        if self._swallow_score is not None:
+            frame_data['swallow_score'] = self._swallow_score
+
+        event = self.realtime_verifier.process_frame(frame_data)
+        if event is not None:
+            self.events_emitted += 1
+        return event
+
+    def summary(self) -> Dict:
+        """Session counters for the closing message."""
+        return {
+            'session_id': self.session_id,
+            'frames_processed': self.frames_processed,
+            'events_emitted': self.events_emitted,
+            'duration': time.time() - self.started_at
+        }
@@ -0,0 +1,160 @@
+"""
+Dynamic micro-batching for model inference.
+Collects individual requests from many callers for a few milliseconds and
+runs them through the model as a single batch.
+"""
+
+import asyncio
+import os
+import queue
+import threading
+import time
+import weakref
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Sequence
+
+
+# Batchers whose worker must be restarted in forked children
+_batchers: "weakref.WeakSet" = weakref.WeakSet()
+
+
+def _reset_after_fork():
+    for batcher in list(_batchers):
+        batcher._reset_worker()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+class MicroBatcher:
+    """
+    Coalesces concurrent single-item requests into batched calls.
+
+    A background thread waits for the first pending item, then keeps
+    collecting until ``max_batch_size`` items are queued or ``max_wait_ms``
+    has passed, and calls ``batch_fn`` once for the whole group. Each
+    caller gets back its own result (or the batch's exception).
+
+    The thread starts on the first submit in each process, so a batcher
+    created before a fork (gunicorn ``--preload``) still works in the
+    workers.
+    """
+
+    def __init__(self, batch_fn: Callable[[List[Any]], Sequence[Any]],
+                 max_batch_size: int = 16, max_wait_ms: float = 10.0,
+                 name: str = "micro-batcher"):
+        """
+        Initialize the batcher.
+
+        Args:
+            batch_fn: Called with a list of items, returns one result per item
+            max_batch_size: Largest batch passed to batch_fn
+            max_wait_ms: Longest time the first item waits for companions
+            name: Worker thread name
+        """
+        self.batch_fn = batch_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000.0
+        self.name = name
+        self._queue: "queue.Queue" = queue.Queue()
+        self._closed = threading.Event()
+        self._stats = {'batches': 0, 'items': 0, 'max_batch': 0}
+        self._start_lock = threading.Lock()
+        self._thread = None
+        _batchers.add(self)
+
+    def _reset_worker(self):
+        # Runs in a freshly forked child: the parent's thread (and any lock it held) didn't come along
+        self._start_lock = threading.Lock()
+        self._queue = queue.Queue()
+        self._thread = None
+
+    def _ensure_worker(self):
+        """Start the worker thread in this process if it isn't running yet."""
+        if self._thread is not None:
+            return
+        with self._start_lock:
+            if self._thread is None:
+                thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+                thread.start()
+                self._thread = thread
+
+    def submit(self, item: Any) -> Future:
+        """Queue an item and return a future for its result."""
+        if self._closed.is_set():
+            raise RuntimeError("MicroBatcher is shut down")
+        self._ensure_worker()
+        future = Future()
+        self._queue.put((item, future))
+        return future
+
+    def process(self, item: Any, timeout: float = None) -> Any:
+        """Queue an item and block until its result is ready."""
+        return self.submit(item).result(timeout=timeout)
+
+    async def process_async(self, item: Any) -> Any:
+        """Queue an item and await its result from an event loop."""
+        return await asyncio.wrap_future(self.submit(item))
+
+    def _collect(self) -> List:
+        first = self._queue.get()
+        if first is None:
+            return []
+
+        batch = [first]
+        deadline = time.monotonic() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                entry = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if entry is None:
+                # Finish this batch, then let the loop see the shutdown
+                self._queue.put(None)
+                break
+            batch.append(entry)
+        return batch
+
+    def _run(self):
+        while not (self._closed.is_set() and self._queue.empty()):
+            batch = self._collect()
+            if not batch:
+                continue
+
+            items = [item for item, _ in batch]
+            try:
+                results = self.batch_fn(items)
+                if len(results) != len(items):
+                    raise ValueError(
+                        f"batch_fn returned {len(results)} results for {len(items)} items"
+                    )
+                for (_, future), result in zip(batch, results):
+                    future.set_result(result)
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+
+            self._stats['batches'] += 1
+            self._stats['items'] += len(items)
+            self._stats['max_batch'] = max(self._stats['max_batch'], len(items))
+
+    def get_statistics(self) -> Dict[str, float]:
+        """Batches run, items processed and average batch size."""
+        stats = dict(self._stats)
+        stats['avg_batch'] = stats['items'] / stats['batches'] if stats['batches'] else 0.0
+        stats['pending'] = self._queue.qsize()
+        return stats
+
+    def shutdown(self, wait: bool = True):
+        """Process what is queued, then stop the worker thread."""
+        self._closed.set()
+        if self._thread is None:
+            return
+        self._queue.put(None)
+        if wait:
+            self._thread.join()
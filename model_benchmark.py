@@ -0,0 +1,541 @@
+"""
+Model Benchmark Suite
+Measures latency percentiles, throughput, peak memory, file size and output
+drift for every converted model and its PyTorch source, and writes the
+results as JSON so backend and quantization choices can be compared across releases.
+"""
+
+import argparse
+import json
+import logging
+import os
+import platform
+import resource
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from multiprocessing import get_context
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+import config
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+BACKENDS = ('pytorch', 'pytorch_int8', 'onnxruntime', 'tflite')
+DEFAULT_BATCH_SIZES = (1, 4, 8, 16)
+DEFAULT_OUTPUT = Path("benchmarks/model_benchmark.json")
+
+
+# ============================================================================
+# MEASUREMENT
+# ============================================================================
+
+def summarize_latencies(latencies_ms: Sequence[float]) -> Dict[str, float]:
+    """Mean, spread and p50/p95/p99 of per-call latencies in milliseconds."""
+    samples = np.asarray(latencies_ms, dtype=np.float64)
+    p50, p95, p99 = np.percentile(samples, [50, 95, 99])
+    return {
+        'mean_ms': round(float(samples.mean()), 3),
+        'std_ms': round(float(samples.std()), 3),
+        'min_ms': round(float(samples.min()), 3),
+        'p50_ms': round(float(p50), 3),
+        'p95_ms': round(float(p95), 3),
+        'p99_ms': round(float(p99), 3),
+        'max_ms': round(float(samples.max()), 3)
+    }
+
+
+def measure_latency(run: Callable[[], object], iterations: int = 100, warmup: int = 10,
+                    batch_size: int = 1) -> Dict[str, float]:
+    """
+    Time repeated calls of a zero-argument callable.
+
+    Args:
+        run: Performs one inference
+        iterations: Timed calls
+        warmup: Untimed calls first (allocator, kernel selection, lazy init)
+        batch_size: Items per call, used for throughput
+
+    Returns:
+        Latency summary plus items per second
+    """
+    for _ in range(warmup):
+        run()
+
+    latencies = []
+    start = time.perf_counter()
+    for _ in range(iterations):
+        call_start = time.perf_counter()
+        run()
+        latencies.append((time.perf_counter() - call_start) * 1000)
+    elapsed = time.perf_counter() - start
+
+    stats = summarize_latencies(latencies)
+    stats['iterations'] = iterations
+    stats['throughput_per_s'] = round(batch_size * iterations / elapsed, 2)
+    return stats
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process (ru_maxrss is KiB on Linux, bytes on macOS)."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return round(peak / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)
+
+
+def file_size_mb(path) -> Optional[float]:
+    return round(os.path.getsize(path) / (1024 * 1024), 3) if path and os.path.exists(path) else None
+
+
+def output_drift(reference: List[np.ndarray], candidate: List[np.ndarray]) -> Dict[str, Dict]:
+    """
+    Compare a backend's outputs with the float PyTorch reference.
+
+    Outputs are paired in order, falling back to the first unused output
+    of the same shape (TFLite may reorder heads). Classification outputs
+    (2D) also report top-1 agreement.
+    """
+    drift = {}
+    unused = list(range(len(candidate)))
+    for i, expected in enumerate(reference):
+        match = i if i in unused and candidate[i].shape == expected.shape else next(
+            (j for j in unused if candidate[j].shape == expected.shape), None)
+        if match is None:
+            drift[f'output_{i}'] = {'error': f'no output with shape {expected.shape}'}
+            continue
+        unused.remove(match)
+
+        actual = candidate[match].astype(np.float32)
+        expected = expected.astype(np.float32)
+        entry = {
+            'mean_abs_diff': float(np.abs(actual - expected).mean()),
+            'max_abs_diff': float(np.abs(actual - expected).max())
+        }
+        if expected.ndim == 2:
+            entry['top1_agreement'] = float((actual.argmax(1) == expected.argmax(1)).mean())
+        drift[f'output_{i}'] = entry
+    return drift
+
+
+# ============================================================================
+# BACKEND RUNNERS
+# ============================================================================
+
+def _flatten_outputs(result) -> List[np.ndarray]:
+    import torch
+
+    if isinstance(result, dict):
+        result = [value for value in result.values() if isinstance(value, torch.Tensor)]
+    elif isinstance(result, torch.Tensor):
+        result = [result]
+    return [value.detach().cpu().float().numpy() for value in result if isinstance(value, torch.Tensor)]
+
+
+class TorchRunner:
+    """Eager PyTorch model (float source or INT8 TorchScript/pickled variant)."""
+
+    def __init__(self, model_path: str):
+        import torch
+
+        try:
+            model = torch.jit.load(model_path, map_location='cpu')
+        except Exception:
+            model = torch.load(model_path, map_location='cpu')
+            # Ultralytics checkpoints wrap the network in a dict
+            if isinstance(model, dict) and 'model' in model:
+                model = model['model'].float()
+        self.model = model.eval()
+
+    def declared_input_shape(self) -> Optional[List]:
+        return None
+
+    def set_threads(self, threads: int):
+        import torch
+        torch.set_num_threads(threads)
+
+    def __call__(self, batch: np.ndarray) -> List[np.ndarray]:
+        import torch
+
+        with torch.inference_mode():
+            return _flatten_outputs(self.model(torch.from_numpy(batch)))
+
+
+class OnnxRunner:
+    """ONNX Runtime CPU session, using the same session options as the server backend."""
+
+    def __init__(self, model_path: str):
+        self.model_path = model_path
+        self.set_threads(None)
+
+    def declared_input_shape(self) -> Optional[List]:
+        return self.session.session.get_inputs()[0].shape
+
+    def set_threads(self, threads: Optional[int]):
+        from onnx_backend import OnnxModel
+        self.session = OnnxModel(self.model_path, intra_op_threads=threads)
+
+    def __call__(self, batch: np.ndarray) -> List[np.ndarray]:
+        result = self.session(batch)
+        outputs = result if isinstance(result, tuple) else [result]
+        return [output.numpy() for output in outputs]
+
+
+def quantize_input(batch: np.ndarray, detail: Dict) -> np.ndarray:
+    """Quantize a float batch for an integer-input TFLite tensor (float inputs pass through)."""
+    scale, zero_point = detail['quantization']
+    if detail['dtype'] == np.float32 or not scale:
+        return batch.astype(np.float32)
+    limits = np.iinfo(detail['dtype'])
+    return np.clip(np.round(batch / scale + zero_point), limits.min, limits.max).astype(detail['dtype'])
+
+
+class TFLiteRunner:
+    """TFLite interpreter, resized per batch size; int8 models are (de)quantized at the edges."""
+
+    def __init__(self, model_path: str):
+        self.model_path = model_path
+        self.threads = None
+        self.batch_size = None
+        self.interpreter = None
+
+    def declared_input_shape(self) -> Optional[List]:
+        import tensorflow as tf
+
+        interpreter = tf.lite.Interpreter(model_path=self.model_path)
+        return list(interpreter.get_input_details()[0]['shape'])
+
+    def set_threads(self, threads: int):
+        self.threads = threads
+        self.batch_size = None
+
+    def _prepare(self, batch_size: int):
+        import tensorflow as tf
+
+        self.interpreter = tf.lite.Interpreter(model_path=self.model_path, num_threads=self.threads)
+        input_detail = self.interpreter.get_input_details()[0]
+        self.interpreter.resize_tensor_input(
+            input_detail['index'], [batch_size] + list(input_detail['shape'][1:])
+        )
+        self.interpreter.allocate_tensors()
+        self.input_detail = self.interpreter.get_input_details()[0]
+        self.output_details = self.interpreter.get_output_details()
+        self.batch_size = batch_size
+
+    def __call__(self, batch: np.ndarray) -> List[np.ndarray]:
+        if self.batch_size != batch.shape[0]:
+            self._prepare(batch.shape[0])
+
+        self.interpreter.set_tensor(self.input_detail['index'], quantize_input(batch, self.input_detail))
+        self.interpreter.invoke()
+
+        outputs = []
+        for detail in self.output_details:
+            output = self.interpreter.get_tensor(detail['index'])
+            scale, zero_point = detail['quantization']
+            if detail['dtype'] != np.float32 and scale:
+                output = (output.astype(np.float32) - zero_point) * scale
+            outputs.append(output)
+        return outputs
+
+
+def _is_fixed(dim) -> bool:
+    return isinstance(dim, (int, np.integer)) and dim > 0
+
+
+def artifact_input_shape(declared: Optional[Sequence], default: Sequence[int]) -> tuple:
+    """
+    Per-sample input shape a model file expects.
+
+    Ultralytics TFLite exports are channels-last (NHWC) while the MODELS
+    sizes and PyTorch sources are channels-first, so the layout is taken
+    from the artifact's declared input (batch axis included). Symbolic
+    axes (dynamic ONNX exports) are filled in from ``default``.
+
+    Args:
+        declared: Input shape reported by the runtime, or None if unknown
+        default: Channels-first shape without the batch axis
+
+    Returns:
+        Shape without the batch axis
+    """
+    default = tuple(default)
+    if declared is None or len(declared) != len(default) + 1:
+        return default
+    declared = list(declared)[1:]
+    if all(_is_fixed(dim) for dim in declared):
+        return tuple(int(dim) for dim in declared)
+
+    channels_last = default[1:] + default[:1]
+    for candidate in (default, channels_last):
+        if all(not _is_fixed(dim) or int(dim) == size for dim, size in zip(declared, candidate)):
+            return candidate
+    return default
+
+
+RUNNERS = {
+    'pytorch': TorchRunner,
+    'pytorch_int8': TorchRunner,
+    'onnxruntime': OnnxRunner,
+    'tflite': TFLiteRunner
+}
+
+
+# ============================================================================
+# BENCHMARK WORKER
+# ============================================================================
+
+def benchmark_model(spec: Dict) -> Dict:
+    """
+    Benchmark one model file on one backend.
+
+    Runs in a fresh process so peak RSS belongs to this model alone.
+
+    Args:
+        spec: name, backend, path, input_shape (without batch), batch_sizes,
+            thread_counts, iterations, warmup and an optional eval_path (.npy)
+
+    Returns:
+        File size, memory, per (batch, threads) latency/throughput (or the
+        error for configurations that failed), and outputs on the
+        evaluation set (for drift against the reference)
+    """
+    result = {
+        'model': spec['name'],
+        'backend': spec['backend'],
+        'path': spec['path'],
+        'file_size_mb': file_size_mb(spec['path']),
+        'rss_baseline_mb': peak_rss_mb()
+    }
+
+    try:
+        load_start = time.perf_counter()
+        runner = RUNNERS[spec['backend']](spec['path'])
+        result['load_seconds'] = round(time.perf_counter() - load_start, 3)
+
+        shape = artifact_input_shape(runner.declared_input_shape(), spec['input_shape'])
+        channels = spec['input_shape'][0]
+        channels_last = shape[0] != channels and shape[-1] == channels
+        result['input_shape'] = list(shape)
+
+        rng = np.random.default_rng(0)
+        sweep = []
+        active_threads = None
+        for threads in spec['thread_counts']:
+            for batch_size in spec['batch_sizes']:
+                # One failing configuration (e.g. a fixed-batch export) doesn't end the sweep
+                try:
+                    if threads != active_threads:
+                        runner.set_threads(threads)
+                        active_threads = threads
+                    batch = rng.standard_normal((batch_size, *shape)).astype(np.float32)
+                    stats = measure_latency(lambda: runner(batch), spec['iterations'],
+                                            spec['warmup'], batch_size)
+                except Exception as e:
+                    logger.warning(f"  {spec['name']}/{spec['backend']} batch={batch_size} "
+                                   f"threads={threads} failed: {e}")
+                    sweep.append({'batch_size': batch_size, 'threads': threads,
+                                  'status': 'failed', 'error': str(e)})
+                    continue
+                stats.update(batch_size=batch_size, threads=threads, status='ok')
+                sweep.append(stats)
+                logger.info(f"  {spec['name']}/{spec['backend']} batch={batch_size} threads={threads}: "
+                            f"p50 {stats['p50_ms']}ms, p99 {stats['p99_ms']}ms, "
+                            f"{stats['throughput_per_s']}/s")
+        result['sweep'] = sweep
+
+        if spec.get('eval_path'):
+            runner.set_threads(max(spec['thread_counts']))
+            inputs = np.load(spec['eval_path'], mmap_mode='r')
+            chunks = []
+            for i in range(0, len(inputs), 8):
+                chunk = np.array(inputs[i:i + 8])
+                chunks.append(runner(np.moveaxis(chunk, 1, -1) if channels_last else chunk))
+            result['eval_outputs'] = [np.concatenate(parts) for parts in zip(*chunks)]
+
+        result['peak_rss_mb'] = peak_rss_mb()
+        completed = sum(point['status'] == 'ok' for point in sweep)
+        result['status'] = 'ok' if completed == len(sweep) else 'partial' if completed else 'failed'
+        if not completed:
+            result['error'] = sweep[0]['error']
+    except Exception as e:
+        logger.error(f"✗ {spec['name']}/{spec['backend']} benchmark failed: {e}")
+        result['status'] = 'failed'
+        result['error'] = str(e)
+
+    return result
+
+
+# ============================================================================
+# SUITE
+# ============================================================================
+
+def model_files(name: str, model_config: Dict) -> Dict[str, Path]:
+    """Every benchmarkable artifact of a MODELS entry, keyed by backend."""
+    from convert_to_tflite import QUANTIZED_DIR
+
+    output = Path(model_config["output"])
+    candidates = {
+        'pytorch': Path(model_config["source"]),
+        'pytorch_int8': QUANTIZED_DIR / f"{name}_int8.pt",
+        'onnxruntime': output.with_suffix('.onnx'),
+        'tflite': output
+    }
+    return {backend: path for backend, path in candidates.items() if path.exists()}
+
+
+def input_shape(model_config: Dict) -> tuple:
+    """Channels-first model input shape without the batch axis (runners adapt it to the artifact)."""
+    height, width = model_config["input_size"]
+    if model_config.get("num_frames"):
+        return (3, model_config["num_frames"], height, width)
+    return (3, height, width)
+
+
+def evaluation_inputs(name: str, max_samples: int = 64) -> Optional[np.ndarray]:
+    """Held-out inputs (the quantization calibration split's evaluation part)."""
+    from convert_to_tflite import CalibrationData, MODELS
+
+    try:
+        if name == "pill_classifier":
+            _, records = CalibrationData.pill_splits()
+            batches = CalibrationData.pill_batches(
+                records, MODELS[name]["input_size"][0], max_samples=max_samples
+            )
+        elif name == "action_recognizer":
+            batches = CalibrationData.action_clips(
+                num_frames=MODELS[name]["num_frames"],
+                image_size=MODELS[name]["input_size"][0],
+                max_clips=max_samples
+            )
+        else:
+            return None
+    except Exception as e:
+        logger.warning(f"{name}: no evaluation data ({e}), reporting speed only")
+        return None
+
+    return np.concatenate([batch.numpy() for batch in batches]) if batches else None
+
+
+def run_suite(models: Optional[List[str]] = None, backends: Sequence[str] = BACKENDS,
+              batch_sizes: Sequence[int] = DEFAULT_BATCH_SIZES,
+              thread_counts: Optional[Sequence[int]] = None,
+              iterations: int = 50, warmup: int = 5) -> Dict:
+    """
+    Benchmark every MODELS entry on every backend it has an artifact for.
+
+    Args:
+        models: MODELS names (default: all)
+        backends: Backends to include
+        batch_sizes: Batch sizes swept
+        thread_counts: Thread counts swept (default: 1, half and all cores)
+        iterations: Timed calls per configuration
+        warmup: Untimed calls per configuration
+
+    Returns:
+        JSON-serializable report with environment metadata and per-model results
+    """
+    from convert_to_tflite import MODELS
+
+    cores = os.cpu_count() or 1
+    thread_counts = sorted(set(thread_counts or (1, max(1, cores // 2), cores)))
+    report = {
+        'metadata': _environment(),
+        'settings': {
+            'batch_sizes': list(batch_sizes),
+            'thread_counts': list(thread_counts),
+            'iterations': iterations,
+            'warmup': warmup
+        },
+        'models': {}
+    }
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for name in models or list(MODELS):
+            model_config = MODELS[name]
+            files = {b: p for b, p in model_files(name, model_config).items() if b in backends}
+            if not files:
+                logger.warning(f"{name}: no model files found, skipping")
+                continue
+
+            eval_path = None
+            eval_inputs = evaluation_inputs(name)
+            if eval_inputs is not None:
+                eval_path = os.path.join(tmp, f"{name}_eval.npy")
+                np.save(eval_path, eval_inputs)
+
+            logger.info(f"\nBenchmarking {name}: {', '.join(files)}")
+            results = {}
+            for backend, path in files.items():
+                spec = {
+                    'name': name, 'backend': backend, 'path': str(path),
+                    'input_shape': input_shape(model_config),
+                    'batch_sizes': list(batch_sizes), 'thread_counts': thread_counts,
+                    'iterations': iterations, 'warmup': warmup, 'eval_path': eval_path
+                }
+                # One fresh process per model file keeps peak RSS and thread pools isolated
+                with ProcessPoolExecutor(max_workers=1, mp_context=get_context('spawn')) as pool:
+                    results[backend] = pool.submit(benchmark_model, spec).result()
+
+            report['models'][name] = _attach_drift(results, eval_inputs)
+
+    return report
+
+
+def _attach_drift(results: Dict[str, Dict], eval_inputs: Optional[np.ndarray]) -> Dict:
+    reference = results.get('pytorch', {}).get('eval_outputs')
+    for backend, result in results.items():
+        outputs = result.pop('eval_outputs', None)
+        if eval_inputs is not None:
+            result['eval_samples'] = int(len(eval_inputs))
+        if reference is not None and outputs is not None and backend != 'pytorch':
+            result['drift_vs_pytorch'] = output_drift(reference, outputs)
+    return results
+
+
+def _environment() -> Dict:
+    versions = {}
+    for module in ('torch', 'onnxruntime', 'tensorflow', 'numpy'):
+        try:
+            versions[module] = getattr(__import__(module), '__version__', None)
+        except ImportError:
+            versions[module] = None
+    return {
+        'timestamp': datetime.now().isoformat(),
+        'pipeline_version': config.PIPELINE_VERSION,
+        'platform': platform.platform(),
+        'processor': platform.processor(),
+        'cpu_count': os.cpu_count(),
+        'python': platform.python_version(),
+        'versions': versions
+    }
+
+
+def main():
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Benchmark converted models against their PyTorch sources")
+    parser.add_argument('--models', nargs='*', help="MODELS entries to benchmark (default: all)")
+    parser.add_argument('--backends', nargs='*', default=list(BACKENDS), choices=BACKENDS)
+    parser.add_argument('--batch-sizes', nargs='*', type=int, default=list(DEFAULT_BATCH_SIZES))
+    parser.add_argument('--threads', nargs='*', type=int, help="Thread counts (default: 1, half, all cores)")
+    parser.add_argument('--iterations', type=int, default=50)
+    parser.add_argument('--warmup', type=int, default=5)
+    parser.add_argument('--output', default=str(DEFAULT_OUTPUT), help="JSON report path")
+    args = parser.parse_args()
+
+    report = run_suite(args.models, args.backends, args.batch_sizes, args.threads,
+                       args.iterations, args.warmup)
+
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, 'w') as f:
+        json.dump(report, f, indent=2)
+    logger.info(f"✓ Benchmark report: {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,190 @@
+"""
+Lazy model loading with background warm-up.
+Heavy components (OCR engines, transformers, validators) are registered as
+factories and built on first use or by a warm-up thread, so servers can bind
+and answer health checks before every model is in memory.
+"""
+
+import logging
+import threading
+import time
+from enum import Enum
+from typing import Any, Callable, Dict, Iterable, Optional
+
+import config
+
+logger = logging.getLogger(__name__)
+
+
+class ComponentState(str, Enum):
+    """Load state of a registered component."""
+    NOT_LOADED = "not_loaded"
+    LOADING = "loading"
+    READY = "ready"
+    FAILED = "failed"
+
+
+class _Entry:
+    def __init__(self, factory: Callable[[], Any], on_load: Optional[Callable[[Any], None]]):
+        self.factory = factory
+        self.on_load = on_load
+        self.instance = None
+        self.state = ComponentState.NOT_LOADED
+        self.error: Optional[Exception] = None
+        self.load_seconds: Optional[float] = None
+        self.attempts = 0
+        self.retry_at: Optional[float] = None
+        self.lock = threading.Lock()
+
+
+class ModelRegistry:
+    """
+    Registry of lazily constructed components.
+
+    ``get`` builds a component the first time it is needed (concurrent
+    callers wait for the same load). ``warm_up`` loads everything on a
+    background thread, and ``load_all`` does it synchronously; calling
+    ``load_all`` before the server forks its workers (gunicorn --preload)
+    lets all workers share the loaded weights copy-on-write.
+
+    A failed load is retried in the background with exponential backoff
+    (``retry_backoff``, doubled each time) up to ``max_retries`` times;
+    ``reload`` retries immediately, e.g. after a missing model file has
+    been restored.
+    """
+
+    def __init__(self, max_retries: Optional[int] = None, retry_backoff: Optional[float] = None):
+        """
+        Initialize the registry.
+
+        Args:
+            max_retries: Background retries after a failed load (defaults to config.MODEL_LOAD_RETRIES)
+            retry_backoff: Seconds before the first retry (defaults to config.MODEL_LOAD_BACKOFF)
+        """
+        self.max_retries = max_retries if max_retries is not None else config.MODEL_LOAD_RETRIES
+        self.retry_backoff = retry_backoff if retry_backoff is not None else config.MODEL_LOAD_BACKOFF
+        self._entries: Dict[str, _Entry] = {}
+        self._warmup_thread: Optional[threading.Thread] = None
+
+    def register(self, name: str, factory: Callable[[], Any],
+                 on_load: Optional[Callable[[Any], None]] = None):
+        """
+        Register a component factory.
+
+        Args:
+            name: Component name reported in health checks
+            factory: Zero-argument callable that builds the component
+            on_load: Called with the instance once it has loaded
+        """
+        self._entries[name] = _Entry(factory, on_load)
+
+    def get(self, name: str) -> Any:
+        """
+        Return a component, loading it first if needed.
+
+        Raises:
+            KeyError: If no component is registered under name
+            RuntimeError: If the component failed to load (and is not yet reloaded)
+        """
+        entry = self._entries[name]
+        if entry.state == ComponentState.READY:
+            return entry.instance
+
+        with entry.lock:
+            if entry.state == ComponentState.NOT_LOADED:
+                self._load(name, entry)
+            if entry.state == ComponentState.FAILED:
+                raise RuntimeError(f"Component '{name}' failed to load: {entry.error}") from entry.error
+            return entry.instance
+
+    def _load(self, name: str, entry: _Entry):
+        entry.state = ComponentState.LOADING
+        entry.retry_at = None
+        start = time.perf_counter()
+        try:
+            entry.instance = entry.factory()
+            entry.load_seconds = round(time.perf_counter() - start, 2)
+            entry.state = ComponentState.READY
+            entry.error = None
+            logger.info(f"Loaded {name} in {entry.load_seconds}s")
+            if entry.on_load:
+                entry.on_load(entry.instance)
+        except Exception as e:
+            entry.error = e
+            entry.state = ComponentState.FAILED
+            entry.attempts += 1
+            logger.error(f"Failed to load {name} (attempt {entry.attempts}): {e}")
+            self._schedule_retry(name, entry)
+
+    def _schedule_retry(self, name: str, entry: _Entry):
+        if entry.attempts > self.max_retries:
+            return
+        delay = self.retry_backoff * 2 ** (entry.attempts - 1)
+        entry.retry_at = time.monotonic() + delay
+        timer = threading.Timer(delay, self._retry, args=(name,))
+        timer.name = f"model-retry-{name}"
+        timer.daemon = True
+        timer.start()
+        logger.info(f"Retrying {name} in {delay:.0f}s")
+
+    def _retry(self, name: str):
+        entry = self._entries[name]
+        with entry.lock:
+            if entry.state == ComponentState.FAILED:
+                self._load(name, entry)
+
+    def reload(self, name: str) -> Any:
+        """
+        Rebuild a component now, resetting its retry budget.
+
+        Raises:
+            KeyError: If no component is registered under name
+            RuntimeError: If the component fails to load again
+        """
+        entry = self._entries[name]
+        with entry.lock:
+            entry.attempts = 0
+            entry.state = ComponentState.NOT_LOADED
+        return self.get(name)
+
+    def load_all(self, names: Optional[Iterable[str]] = None):
+        """Load components synchronously (failures are recorded, not raised)."""
+        for name in names or list(self._entries):
+            try:
+                self.get(name)
+            except RuntimeError:
+                pass
+
+    def warm_up(self, names: Optional[Iterable[str]] = None) -> threading.Thread:
+        """Load components on a background thread and return the thread."""
+        if self._warmup_thread is None or not self._warmup_thread.is_alive():
+            self._warmup_thread = threading.Thread(
+                target=self.load_all, args=(names,), name="model-warmup", daemon=True
+            )
+            self._warmup_thread.start()
+        return self._warmup_thread
+
+    def is_ready(self, name: Optional[str] = None) -> bool:
+        """Whether one component (or every component) is loaded."""
+        names = [name] if name else list(self._entries)
+        return all(self._entries[n].state == ComponentState.READY for n in names)
+
+    def has_failures(self) -> bool:
+        """Whether any component is currently in the failed state."""
+        return any(entry.state == ComponentState.FAILED for entry in self._entries.values())
+
+    def status(self) -> Dict[str, Dict]:
+        """Per-component state, load time, error and retry schedule."""
+        now = time.monotonic()
+        return {
+            name: {
+                'state': entry.state.value,
+                'load_seconds': entry.load_seconds,
+                'error': str(entry.error) if entry.error else None,
+                'failed_attempts': entry.attempts,
+                'retry_in_seconds': (
+                    round(max(0.0, entry.retry_at - now), 1) if entry.retry_at is not None else None
+                )
+            }
+            for name, entry in self._entries.items()
+        }
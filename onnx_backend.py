@@ -0,0 +1,360 @@
+"""
+ONNX Runtime inference backend for server-side PyTorch models.
+Exports a module's forward pass to ONNX once and swaps it for an optimized
+CPU InferenceSession, so existing predict/extract_entities wrappers keep
+working unchanged.
+"""
+
+import hashlib
+import logging
+import os
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+import torch
+
+import config
+
+try:
+    import onnxruntime as ort
+    ORT_AVAILABLE = True
+except ImportError:
+    ORT_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+BACKENDS = ('pytorch', 'onnxruntime')
+
+
+def default_intra_op_threads() -> int:
+    """Threads per session so concurrent inference workers don't oversubscribe the CPU."""
+    if config.ONNX_INTRA_OP_THREADS > 0:
+        return config.ONNX_INTRA_OP_THREADS
+    return max(1, (os.cpu_count() or 1) // max(1, config.INFERENCE_WORKERS))
+
+
+def create_session(onnx_path: str, intra_op_threads: int = None,
+                   inter_op_threads: int = None) -> "ort.InferenceSession":
+    """
+    Open an ONNX model on the CPU execution provider.
+
+    Args:
+        onnx_path: Exported model
+        intra_op_threads: Threads used inside one operator (defaults to default_intra_op_threads())
+        inter_op_threads: Threads running independent graph branches (defaults to config)
+
+    Returns:
+        InferenceSession with all graph optimizations enabled
+    """
+    if not ORT_AVAILABLE:
+        raise RuntimeError("onnxruntime is not installed")
+
+    options = ort.SessionOptions()
+    # Constant folding, node fusion (Conv+BN+ReLU, attention, GELU) and layout transforms
+    options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+    options.intra_op_num_threads = intra_op_threads or default_intra_op_threads()
+    options.inter_op_num_threads = inter_op_threads or config.ONNX_INTER_OP_THREADS
+    options.execution_mode = (
+        ort.ExecutionMode.ORT_PARALLEL if options.inter_op_num_threads > 1
+        else ort.ExecutionMode.ORT_SEQUENTIAL
+    )
+    return ort.InferenceSession(str(onnx_path), options, providers=['CPUExecutionProvider'])
+
+
+class OnnxModel:
+    """
+    Callable stand-in for a module's forward pass backed by ONNX Runtime.
+
+    Arguments are matched to graph inputs by position or keyword (inputs
+    the graph does not use, such as all-zero ``token_type_ids``, are
+    dropped). Inputs and outputs go through IO binding, and the result
+    comes back as torch tensors in the original forward's structure: a
+    tensor, a tuple, or a dict keyed like the PyTorch outputs.
+    """
+
+    def __init__(self, onnx_path: str, output_keys: Optional[List[str]] = None,
+                 output_adapter: Optional[Callable] = None, **session_kwargs):
+        """
+        Initialize the model.
+
+        Args:
+            onnx_path: Exported model
+            output_keys: Dict keys of the original outputs (None for tensor/tuple outputs)
+            output_adapter: Optional callable applied to the converted outputs
+            **session_kwargs: Passed to create_session
+        """
+        self.onnx_path = str(onnx_path)
+        self.session = create_session(onnx_path, **session_kwargs)
+        self.input_names = [i.name for i in self.session.get_inputs()]
+        self.output_names = [o.name for o in self.session.get_outputs()]
+        self.output_keys = output_keys
+        self.output_adapter = output_adapter
+
+    def _bind_inputs(self, args: Sequence, kwargs: Dict) -> Dict[str, np.ndarray]:
+        feeds = dict(zip(self.input_names, args))
+        feeds.update((name, value) for name, value in kwargs.items() if name in self.input_names)
+        missing = [name for name in self.input_names if feeds.get(name) is None]
+        if missing:
+            raise ValueError(f"Missing ONNX inputs: {missing}")
+        return {
+            name: np.ascontiguousarray(
+                value.detach().cpu().numpy() if isinstance(value, torch.Tensor) else value
+            )
+            for name, value in feeds.items()
+        }
+
+    def __call__(self, *args, **kwargs) -> Any:
+        binding = self.session.io_binding()
+        for name, array in self._bind_inputs(args, kwargs).items():
+            binding.bind_cpu_input(name, array)
+        for name in self.output_names:
+            binding.bind_output(name, 'cpu')
+
+        self.session.run_with_iobinding(binding)
+        outputs = [torch.from_numpy(array) for array in binding.copy_outputs_to_cpu()]
+
+        if self.output_keys:
+            result = dict(zip(self.output_keys, outputs))
+        elif len(outputs) == 1:
+            result = outputs[0]
+        else:
+            result = tuple(outputs)
+        return self.output_adapter(result) if self.output_adapter else result
+
+
+def export_onnx(module: torch.nn.Module, example_inputs: Sequence[torch.Tensor], onnx_path: str,
+                input_names: List[str], dynamic_axes: Dict[str, Dict[int, str]],
+                opset_version: int = 14) -> Optional[List[str]]:
+    """
+    Export a module's forward pass to ONNX.
+
+    Args:
+        module: Model in eval mode
+        example_inputs: Positional example inputs
+        onnx_path: Output path
+        input_names: Names for the positional inputs
+        dynamic_axes: Per-input axes left symbolic (batch, sequence, frames...)
+        opset_version: ONNX opset
+
+    Returns:
+        Dict keys of the forward outputs, or None for tensor/tuple outputs
+    """
+    with torch.inference_mode():
+        sample = module(*example_inputs)
+
+    output_keys = list(sample.keys()) if isinstance(sample, dict) else None
+    if output_keys:
+        output_names = output_keys
+    elif isinstance(sample, (tuple, list)):
+        output_names = [f'output_{i}' for i in range(len(sample))]
+    else:
+        output_names = ['output']
+
+    # Every output keeps a dynamic batch axis
+    axes = dict(dynamic_axes)
+    for name in output_names:
+        axes.setdefault(name, {0: 'batch'})
+
+    # Export next to the target and rename it into place, so concurrent workers
+    # never load a partially written graph
+    onnx_path = Path(onnx_path)
+    onnx_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = onnx_path.with_name(f"{onnx_path.name}.{os.getpid()}.tmp")
+    try:
+        torch.onnx.export(
+            module,
+            tuple(example_inputs),
+            str(tmp_path),
+            input_names=input_names,
+            output_names=output_names,
+            dynamic_axes=axes,
+            opset_version=opset_version,
+            do_constant_folding=True
+        )
+        os.replace(tmp_path, onnx_path)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+    logger.info(f"✓ ONNX export: {onnx_path}")
+    return output_keys
+
+
+def weights_digest(module: torch.nn.Module) -> str:
+    """Short SHA-256 of a module's parameters and buffers."""
+    digest = hashlib.sha256()
+    for key, tensor in sorted(module.state_dict().items()):
+        tensor = tensor.detach().cpu().contiguous()
+        digest.update(f"{key}:{tensor.dtype}:{tuple(tensor.shape)}".encode())
+        digest.update(tensor.reshape(-1).view(torch.uint8).numpy().tobytes())
+    return digest.hexdigest()[:16]
+
+
+def onnx_path_for(name: str, module: torch.nn.Module) -> Path:
+    """Export location for a component, keyed on its weights so retrained models re-export."""
+    return (Path(config.ONNX_MODEL_DIR)
+            / f"{name}-{config.PIPELINE_VERSION}-{weights_digest(module)}.onnx")
+
+
+def accelerate_module(module: torch.nn.Module, name: str, example_inputs: Sequence[torch.Tensor],
+                      input_names: List[str], dynamic_axes: Dict[str, Dict[int, str]],
+                      export_module: Optional[torch.nn.Module] = None,
+                      output_adapter: Optional[Callable] = None) -> OnnxModel:
+    """
+    Route a module's forward pass through ONNX Runtime.
+
+    The ONNX graph is exported on first use and reused afterwards (until the
+    weights change). The
+    module's ``forward`` is replaced on the instance, so ``module(x)`` and
+    any ``predict`` method built on it run through ONNX Runtime while
+    attributes, configs and label vocabularies stay on the module.
+
+    Args:
+        module: Model to accelerate (kept on the CPU in eval mode)
+        name: Component name used for the ONNX file
+        example_inputs: Positional example inputs for the export
+        input_names: Names for the positional inputs
+        dynamic_axes: Per-input symbolic axes
+        export_module: Module traced for the export (defaults to module)
+        output_adapter: Optional callable applied to the ONNX outputs
+
+    Returns:
+        The OnnxModel now serving module.forward
+    """
+    module.cpu().eval()
+    export_module = export_module or module
+    onnx_path = onnx_path_for(name, export_module)
+
+    if onnx_path.exists():
+        with torch.inference_mode():
+            sample = export_module(*example_inputs)
+        output_keys = list(sample.keys()) if isinstance(sample, dict) else None
+    else:
+        output_keys = export_onnx(export_module, example_inputs, onnx_path, input_names, dynamic_axes)
+
+    onnx_model = OnnxModel(onnx_path, output_keys=output_keys, output_adapter=output_adapter)
+    module.forward = onnx_model
+    logger.info(f"⚡ {name} running on ONNX Runtime ({default_intra_op_threads()} threads)")
+    return onnx_model
+
+
+# ============================================================================
+# COMPONENT ADAPTERS
+# ============================================================================
+
+def accelerate_pill_classifier(pill_classifier) -> OnnxModel:
+    """Serve PillClassifier's EfficientNet and shape/color/imprint heads from ONNX Runtime."""
+    size = getattr(pill_classifier, 'input_size', 224)
+    return accelerate_module(
+        pill_classifier, 'pill_classifier',
+        example_inputs=[torch.randn(1, 3, size, size)],
+        input_names=['image'],
+        dynamic_axes={'image': {0: 'batch'}}
+    )
+
+
+def accelerate_action_recognizer(action_recognizer) -> List[OnnxModel]:
+    """
+    Serve the Action3DCNN / ActionLSTM models of an ActionRecognizer from ONNX Runtime.
+
+    Clip length and resolution stay dynamic for the 3D CNN (live sessions
+    use shorter, smaller clips than offline videos), as does the LSTM's
+    sequence length.
+    """
+    accelerated = []
+    for module in list(vars(action_recognizer).values()):
+        if not isinstance(module, torch.nn.Module):
+            continue
+
+        kind = type(module).__name__
+        if kind == 'Action3DCNN':
+            accelerated.append(accelerate_module(
+                module, 'action_3dcnn',
+                example_inputs=[torch.randn(1, 3, 16, 112, 112)],
+                input_names=['clip'],
+                dynamic_axes={'clip': {0: 'batch', 2: 'frames', 3: 'height', 4: 'width'}}
+            ))
+        elif kind == 'ActionLSTM':
+            lstm = next(m for m in module.modules() if isinstance(m, torch.nn.LSTM))
+            accelerated.append(accelerate_module(
+                module, 'action_lstm',
+                example_inputs=[torch.randn(1, 30, lstm.input_size)],
+                input_names=['sequence'],
+                dynamic_axes={'sequence': {0: 'batch', 1: 'time'}}
+            ))
+
+    if not accelerated:
+        logger.warning("No Action3DCNN/ActionLSTM model found on the action recognizer")
+    return accelerated
+
+
+class _TokenClassifierLogits(torch.nn.Module):
+    """Exports only the logits of a Hugging Face token classifier."""
+
+    def __init__(self, model: torch.nn.Module):
+        super().__init__()
+        self.model = model
+
+    def forward(self, input_ids, attention_mask):
+        return self.model(input_ids=input_ids, attention_mask=attention_mask, return_dict=False)[0]
+
+
+def _token_classifier_output(logits: torch.Tensor):
+    try:
+        from transformers.modeling_outputs import TokenClassifierOutput
+        return TokenClassifierOutput(logits=logits)
+    except ImportError:
+        return (logits,)
+
+
+def accelerate_ner(ner_extractor) -> Optional[OnnxModel]:
+    """
+    Serve the NER extractor's ClinicalBERT/BioBERT token classifier from ONNX Runtime.
+
+    Batch and sequence length are dynamic. Outputs come back as a
+    TokenClassifierOutput, so Hugging Face pipelines and code reading
+    ``outputs.logits`` or ``outputs[0]`` both work.
+    """
+    for module in list(vars(ner_extractor).values()):
+        if isinstance(module, torch.nn.Module) and hasattr(module, 'config'):
+            example = torch.ones(1, 16, dtype=torch.long)
+            return accelerate_module(
+                module, 'ner',
+                example_inputs=[example, example],
+                input_names=['input_ids', 'attention_mask'],
+                dynamic_axes={
+                    'input_ids': {0: 'batch', 1: 'sequence'},
+                    'attention_mask': {0: 'batch', 1: 'sequence'},
+                    'output': {0: 'batch', 1: 'sequence'}
+                },
+                export_module=_TokenClassifierLogits(module),
+                output_adapter=_token_classifier_output
+            )
+
+    logger.warning("NER extractor has no transformer model to accelerate (rule-based mode?)")
+    return None
+
+
+def apply_backend(component: str, backend: str, accelerate: Callable, target) -> bool:
+    """
+    Switch one component to ONNX Runtime when configured to.
+
+    Falls back to PyTorch (with a warning) if onnxruntime is missing or
+    the export fails, so a bad export never takes the component down.
+
+    Returns:
+        True if the component now runs on ONNX Runtime
+    """
+    if backend not in BACKENDS:
+        logger.warning(f"Unknown backend '{backend}' for {component}, using pytorch")
+        return False
+    if backend == 'pytorch' or target is None:
+        return False
+    if not ORT_AVAILABLE:
+        logger.warning(f"onnxruntime not installed, {component} stays on PyTorch")
+        return False
+    try:
+        return bool(accelerate(target))
+    except Exception as e:
+        logger.warning(f"ONNX Runtime backend failed for {component} ({e}), using PyTorch")
+        return False
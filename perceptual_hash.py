@@ -0,0 +1,140 @@
+"""
+Perceptual hashing for near-duplicate prescription images.
+dHash/pHash fingerprints survive re-photographing (small shifts, scale,
+lighting), and a Hamming-distance index finds earlier extractions of the
+same paper prescription.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+
+import cv2
+import numpy as np
+
+
+def _grayscale(image: np.ndarray) -> np.ndarray:
+    if image.ndim == 3:
+        image = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+    return image.astype(np.float32)
+
+
+def _pack_bits(bits: np.ndarray) -> int:
+    value = 0
+    for bit in bits.flatten():
+        value = (value << 1) | int(bit)
+    return value
+
+
+def dhash(image: np.ndarray, hash_size: int = 8) -> int:
+    """
+    Difference hash: sign of horizontal gradients on a downscaled image.
+
+    Args:
+        image: Grayscale or BGR image (e.g. ImageProcessor output)
+        hash_size: Hash is hash_size x hash_size bits
+
+    Returns:
+        Hash as an integer
+    """
+    resized = cv2.resize(_grayscale(image), (hash_size + 1, hash_size),
+                         interpolation=cv2.INTER_AREA)
+    return _pack_bits(resized[:, 1:] > resized[:, :-1])
+
+
+def phash(image: np.ndarray, hash_size: int = 8, highfreq_factor: int = 4) -> int:
+    """
+    DCT hash: low-frequency DCT coefficients compared to their median.
+
+    Args:
+        image: Grayscale or BGR image (e.g. ImageProcessor output)
+        hash_size: Hash is hash_size x hash_size bits
+        highfreq_factor: Downscale size multiplier before the DCT
+
+    Returns:
+        Hash as an integer
+    """
+    size = hash_size * highfreq_factor
+    resized = cv2.resize(_grayscale(image), (size, size), interpolation=cv2.INTER_AREA)
+    low = cv2.dct(resized)[:hash_size, :hash_size]
+    # The DC term only encodes overall brightness
+    median = np.median(low.flatten()[1:])
+    return _pack_bits(low > median)
+
+
+def hamming_distance(a: int, b: int) -> int:
+    """Number of differing bits between two hashes."""
+    return bin(a ^ b).count('1')
+
+
+class PerceptualHashIndex:
+    """
+    Bounded index of 64-bit image hashes with nearest-neighbour lookup.
+
+    Hashes are kept in a numpy uint64 array so a lookup is one vectorized
+    XOR and popcount over all entries. The array grows by doubling and,
+    once ``max_entries`` is reached, the oldest entry's slot is reused, so
+    adding a hash is amortized O(1).
+    """
+
+    def __init__(self, max_entries: int = 4096):
+        """
+        Initialize the index.
+
+        Args:
+            max_entries: Maximum hashes retained
+        """
+        self.max_entries = max_entries
+        # hash -> slot in _hashes/_payloads, oldest first
+        self._entries: "OrderedDict[int, int]" = OrderedDict()
+        self._hashes = np.zeros(min(max_entries, 64), dtype=np.uint64)
+        self._payloads: list = []
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(self, image_hash: int, payload: Any):
+        """Store a payload under a hash (replacing any previous payload)."""
+        with self._lock:
+            slot = self._entries.get(image_hash)
+            if slot is not None:
+                self._entries.move_to_end(image_hash)
+                self._payloads[slot] = payload
+                return
+
+            if len(self._entries) >= self.max_entries:
+                _, slot = self._entries.popitem(last=False)
+                self._payloads[slot] = payload
+            else:
+                slot = len(self._payloads)
+                if slot == len(self._hashes):
+                    grown = np.zeros(min(self.max_entries, 2 * slot), dtype=np.uint64)
+                    grown[:slot] = self._hashes
+                    self._hashes = grown
+                self._payloads.append(payload)
+            self._hashes[slot] = image_hash
+            self._entries[image_hash] = slot
+
+    def nearest(self, image_hash: int, max_distance: int) -> Optional[Tuple[Any, int]]:
+        """
+        Closest stored payload within a Hamming distance.
+
+        Args:
+            image_hash: Query hash
+            max_distance: Largest acceptable number of differing bits
+
+        Returns:
+            (payload, distance), or None when nothing is close enough
+        """
+        with self._lock:
+            if not self._payloads:
+                return None
+            hashes = self._hashes[:len(self._payloads)]
+            diff = np.bitwise_xor(hashes, np.uint64(image_hash))
+            distances = np.unpackbits(diff.view(np.uint8).reshape(-1, 8), axis=1).sum(axis=1)
+            best = int(np.argmin(distances))
+            distance = int(distances[best])
+            if distance > max_distance:
+                return None
+            return self._payloads[best], distance
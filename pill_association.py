@@ -0,0 +1,223 @@
+"""
+Vectorized pill tracking for intake videos.
+Detections are associated to tracks with a NumPy IoU/center-distance cost
+matrix solved by the Hungarian algorithm, and each track carries a
+constant-velocity Kalman filter so pills are followed through fast motion
+and short occlusions.
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+import numpy as np
+from scipy.optimize import linear_sum_assignment
+
+# Cost assigned to pairs that fail the gate; never selected
+_INFEASIBLE = 1e6
+
+
+@dataclass
+class PillTrack:
+    """A pill followed across frames."""
+    track_id: int
+    detections: List = field(default_factory=list)
+
+    @property
+    def start_frame(self) -> int:
+        return self.detections[0].frame_id
+
+    @property
+    def end_frame(self) -> int:
+        return self.detections[-1].frame_id
+
+    @property
+    def total_frames(self) -> int:
+        return len(self.detections)
+
+    @property
+    def avg_confidence(self) -> float:
+        return float(np.mean([d.confidence for d in self.detections]))
+
+    @property
+    def movement_distance(self) -> float:
+        """Path length of the pill centre in pixels."""
+        if len(self.detections) < 2:
+            return 0.0
+        centers = np.array([[d.center_x, d.center_y] for d in self.detections])
+        return float(np.linalg.norm(np.diff(centers, axis=0), axis=1).sum())
+
+    def to_dict(self) -> Dict:
+        return {
+            'track_id': self.track_id,
+            'start_frame': self.start_frame,
+            'end_frame': self.end_frame,
+            'total_frames': self.total_frames,
+            'avg_confidence': self.avg_confidence,
+            'movement_distance': self.movement_distance
+        }
+
+
+def iou_matrix(boxes_a: np.ndarray, boxes_b: np.ndarray) -> np.ndarray:
+    """Pairwise IoU between (N, 4) and (M, 4) xyxy boxes."""
+    x1 = np.maximum(boxes_a[:, None, 0], boxes_b[None, :, 0])
+    y1 = np.maximum(boxes_a[:, None, 1], boxes_b[None, :, 1])
+    x2 = np.minimum(boxes_a[:, None, 2], boxes_b[None, :, 2])
+    y2 = np.minimum(boxes_a[:, None, 3], boxes_b[None, :, 3])
+    intersection = np.clip(x2 - x1, 0, None) * np.clip(y2 - y1, 0, None)
+
+    area_a = (boxes_a[:, 2] - boxes_a[:, 0]) * (boxes_a[:, 3] - boxes_a[:, 1])
+    area_b = (boxes_b[:, 2] - boxes_b[:, 0]) * (boxes_b[:, 3] - boxes_b[:, 1])
+    union = area_a[:, None] + area_b[None, :] - intersection
+    return np.where(union > 0, intersection / np.maximum(union, 1e-9), 0.0)
+
+
+class VectorizedPillTracker:
+    """
+    Multi-pill tracker with the PillTracker interface (``update``/``finish``).
+
+    Active track states live in stacked arrays, so prediction, gating and
+    the cost matrix are computed for all tracks and detections at once.
+    Tracks unseen for more than ``max_gap`` frames are retired, which keeps
+    the active set (and each frame's cost) small and total cost linear in
+    the number of frames.
+    """
+
+    def __init__(self, iou_threshold: float = 0.3, max_gap: int = 5,
+                 distance_weight: float = 0.5, max_center_distance: float = 2.0,
+                 process_noise: float = 1.0, measurement_noise: float = 10.0):
+        """
+        Initialize the tracker.
+
+        Args:
+            iou_threshold: Minimum IoU for an association (unless centres are close)
+            max_gap: Frames a track may go undetected before it is closed
+            distance_weight: Weight of normalized centre distance in the cost
+            max_center_distance: Gate on centre distance, in box diagonals
+            process_noise: Kalman process noise (pixels / frame^2)
+            measurement_noise: Kalman measurement noise (pixels)
+        """
+        self.iou_threshold = iou_threshold
+        self.max_gap = max_gap
+        self.distance_weight = distance_weight
+        self.max_center_distance = max_center_distance
+        self.process_noise = process_noise
+        self.measurement_noise = measurement_noise
+
+        self._tracks: List[PillTrack] = []
+        self._finished: List[PillTrack] = []
+        self._next_id = 0
+        self._frame = -1
+        # Per active track: Kalman state [cx, cy, vx, vy], covariance, box size, last frame
+        self._state = np.zeros((0, 4))
+        self._covariance = np.zeros((0, 4, 4))
+        self._size = np.zeros((0, 2))
+        self._last_seen = np.zeros(0, dtype=int)
+
+    def _predict(self, frame_id: int) -> np.ndarray:
+        """Predicted centres of all active tracks at frame_id."""
+        dt = (frame_id - self._last_seen).astype(float)
+        transition = np.tile(np.eye(4), (len(dt), 1, 1))
+        transition[:, 0, 2] = dt
+        transition[:, 1, 3] = dt
+
+        self._state = np.einsum('nij,nj->ni', transition, self._state)
+        noise = self.process_noise * np.maximum(dt, 1.0)[:, None, None] * np.eye(4)
+        self._covariance = transition @ self._covariance @ transition.transpose(0, 2, 1) + noise
+        self._last_seen = np.full(len(dt), frame_id)
+        return self._state[:, :2]
+
+    def _correct(self, indices: np.ndarray, centers: np.ndarray):
+        """Kalman update for matched tracks."""
+        observe = np.zeros((2, 4))
+        observe[0, 0] = observe[1, 1] = 1.0
+        covariance = self._covariance[indices]
+        innovation_cov = observe @ covariance @ observe.T + self.measurement_noise * np.eye(2)
+        gain = covariance @ observe.T @ np.linalg.inv(innovation_cov)
+        residual = centers - self._state[indices, :2]
+
+        self._state[indices] += np.einsum('nij,nj->ni', gain, residual)
+        self._covariance[indices] = (np.eye(4) - gain @ observe) @ covariance
+
+    def _cost_matrix(self, predicted: np.ndarray, detections: List) -> np.ndarray:
+        boxes = np.array([[d.x1, d.y1, d.x2, d.y2] for d in detections], dtype=float)
+        det_centers = np.array([[d.center_x, d.center_y] for d in detections], dtype=float)
+
+        half = self._size / 2
+        track_boxes = np.hstack([predicted - half, predicted + half])
+        iou = iou_matrix(track_boxes, boxes)
+
+        diagonal = np.maximum(np.linalg.norm(self._size, axis=1), 1.0)
+        distance = np.linalg.norm(predicted[:, None, :] - det_centers[None, :, :], axis=2)
+        distance /= diagonal[:, None]
+
+        cost = (1.0 - iou) + self.distance_weight * distance
+        gated = (iou < self.iou_threshold) & (distance > self.max_center_distance)
+        cost[gated] = _INFEASIBLE
+        return cost
+
+    def _retire(self, keep: np.ndarray):
+        for index in np.flatnonzero(~keep):
+            self._finished.append(self._tracks[index])
+        self._tracks = [t for t, k in zip(self._tracks, keep) if k]
+        self._state = self._state[keep]
+        self._covariance = self._covariance[keep]
+        self._size = self._size[keep]
+        self._last_seen = self._last_seen[keep]
+
+    def _start_tracks(self, detections: List, frame_id: int):
+        if not detections:
+            return
+        for detection in detections:
+            self._tracks.append(PillTrack(self._next_id, [detection]))
+            self._next_id += 1
+
+        centers = np.array([[d.center_x, d.center_y] for d in detections], dtype=float)
+        self._state = np.vstack([self._state, np.hstack([centers, np.zeros_like(centers)])])
+        initial = np.diag([self.measurement_noise, self.measurement_noise, 100.0, 100.0])
+        self._covariance = np.concatenate([self._covariance, np.tile(initial, (len(detections), 1, 1))])
+        self._size = np.vstack([self._size, [[d.width, d.height] for d in detections]])
+        self._last_seen = np.concatenate([self._last_seen, np.full(len(detections), frame_id)])
+
+    def update(self, detections: List, frame_id: Optional[int] = None):
+        """
+        Associate one frame's detections with the active tracks.
+
+        Args:
+            detections: PillDetection objects for a single frame
+            frame_id: Frame index (taken from the detections when omitted)
+        """
+        if frame_id is None:
+            frame_id = detections[0].frame_id if detections else self._frame + 1
+        self._frame = frame_id
+
+        if self._tracks:
+            last_detected = np.array([t.end_frame for t in self._tracks])
+            self._retire(frame_id - last_detected <= self.max_gap)
+
+        if not self._tracks:
+            self._start_tracks(detections, frame_id)
+            return
+
+        predicted = self._predict(frame_id)
+        if not detections:
+            return
+
+        cost = self._cost_matrix(predicted, detections)
+        rows, cols = linear_sum_assignment(cost)
+        feasible = cost[rows, cols] < _INFEASIBLE
+        rows, cols = rows[feasible], cols[feasible]
+
+        if len(rows):
+            centers = np.array([[detections[c].center_x, detections[c].center_y] for c in cols])
+            self._correct(rows, centers)
+            for row, col in zip(rows, cols):
+                self._tracks[row].detections.append(detections[col])
+                self._size[row] = (detections[col].width, detections[col].height)
+
+        matched = set(cols.tolist())
+        self._start_tracks([d for i, d in enumerate(detections) if i not in matched], frame_id)
+
+    def finish(self) -> List[PillTrack]:
+        """Close all tracks and return every trajectory, oldest first."""
+        self._retire(np.zeros(len(self._tracks), dtype=bool))
+        return sorted(self._finished, key=lambda t: t.track_id)
@@ -1,356 +1,812 @@
-"""
-Main prescription digitizer application.
-Orchestrates the complete pipeline: preprocessing, OCR, NER, and validation.
-"""
-
-import os
-import uuid
-from typing import Optional, Dict
-from datetime import datetime
-from dataclasses import asdict
-
-from src.preprocessing.image_processor import ImageProcessor
-from src.ocr.ocr_engine import OCREngine
-from src.ner.ner_extractor import NERExtractor
-from src.ner.pattern_matcher import PatternMatcher
-from src.validation.database_validator import DatabaseValidator
-from src.validation.confidence_scorer import ConfidenceScorer, ReviewStatus
-
-
-class PrescriptionDigitizer:
-    """Main application for prescription digitization."""
-
-    def __init__(self, config_path: str = "configs/config.yaml"):
-        """
-        Initialize prescription digitizer with all components.
-        
-        Args:
-            config_path: Path to configuration file
-        """
-        self.config = self._load_config(config_path)
-        
-        # Initialize components
-        self.image_processor = ImageProcessor(
-            target_width=self.config.get('preprocessing', {}).get('target_width', 800),
-            target_height=self.config.get('preprocessing', {}).get('target_height', 600)
-        )
-        
-        self.ocr_engine = OCREngine(
-            primary_backend=self.config.get('ocr', {}).get('backend', 'easyocr'),
-            languages=self.config.get('ocr', {}).get('languages', ['en']),
-            use_gpu=self.config.get('ocr', {}).get('use_gpu', False)
-        )
-        
-        self.ner_extractor = NERExtractor(
-            use_clinical_bert=self.config.get('ner', {}).get('use_clinical_bert', True),
-            use_gpu=self.config.get('ner', {}).get('use_gpu', False)
-        )
-        
-        self.pattern_matcher = PatternMatcher()
-        
-        self.validator = DatabaseValidator(
-            cache_dir=self.config.get('validation', {}).get('cache_dir', 'data/drug_cache')
-        )
-        
-        self.confidence_scorer = ConfidenceScorer(
-            ocr_weight=self.config.get('scoring', {}).get('ocr_weight', 0.4),
-            ner_weight=self.config.get('scoring', {}).get('ner_weight', 0.35),
-            validation_weight=self.config.get('scoring', {}).get('validation_weight', 0.25),
-            manual_review_threshold=self.config.get('scoring', {}).get('manual_review_threshold', 0.7)
-        )
-
-    def _load_config(self, config_path: str) -> Dict:
-        """Load configuration file."""
-        if os.path.exists(config_path):
-            import yaml
-            try:
-                with open(config_path, 'r') as f:
-                    return yaml.safe_load(f)
-            except Exception as e:
-                print(f"Error loading config: {e}")
-        
-        return self._default_config()
-
-    def _default_config(self) -> Dict:
-        """Default configuration."""
-        return {
-            'preprocessing': {
-                'target_width': 800,
-                'target_height': 600
-            },
-            'ocr': {
-                'backend': 'easyocr',
-                'languages': ['en'],
-                'use_gpu': False
-            },
-            'ner': {
-                'use_clinical_bert': True,
-                'use_gpu': False
-            },
-            'validation': {
-                'cache_dir': 'data/drug_cache'
-            },
-            'scoring': {
-                'ocr_weight': 0.4,
-                'ner_weight': 0.35,
-                'validation_weight': 0.25,
-                'manual_review_threshold': 0.7
-            }
-        }
-
-    def process_prescription(self, image_path: str, 
-                            save_intermediate: bool = False) -> Dict:
-        """
-        Complete prescription digitization pipeline.
-        
-        Args:
-            image_path: Path to prescription image
-            save_intermediate: Save intermediate processing results
-            
-        Returns:
-            Complete extraction and validation results
-        """
-        extraction_id = str(uuid.uuid4())[:8]
-        results = {
-            'extraction_id': extraction_id,
-            'timestamp': datetime.now().isoformat(),
-            'image_path': image_path,
-            'preprocessing': None,
-            'ocr': None,
-            'ner': None,
-            'patterns': None,
-            'validation': None,
-            'confidence_score': None,
-            'requires_review': False,
-            'review_queue_id': None
-        }
-
-        try:
-            # Step 1: Image Preprocessing
-            print(f"[{extraction_id}] Step 1: Image Preprocessing...")
-            processed_image = self.image_processor.preprocess_pipeline(image_path)
-            
-            if processed_image is None:
-                raise ValueError("Image preprocessing failed")
-            
-            results['preprocessing'] = {
-                'status': 'success',
-                'message': 'Image successfully preprocessed'
-            }
-
-            # Save preprocessed image if requested
-            if save_intermediate:
-                processed_path = f"data/processed_{extraction_id}.jpg"
-                self.image_processor.save_image(processed_image, processed_path)
-                results['preprocessing']['output_path'] = processed_path
-
-            # Step 2: OCR Text Extraction
-            print(f"[{extraction_id}] Step 2: OCR Text Extraction...")
-            ocr_results = self.ocr_engine.extract_text(image_path)
-            
-            if not ocr_results:
-                raise ValueError("OCR extraction failed")
-            
-            extracted_text = self.ocr_engine.get_full_text(ocr_results)
-            avg_ocr_confidence = sum(r.confidence for r in ocr_results) / len(ocr_results)
-            
-            results['ocr'] = {
-                'status': 'success',
-                'full_text': extracted_text,
-                'confidence': avg_ocr_confidence,
-                'num_extractions': len(ocr_results),
-                'details': [asdict(r) for r in ocr_results[:5]]  # Top 5
-            }
-
-            # Step 3: NER and Entity Extraction
-            print(f"[{extraction_id}] Step 3: NER Entity Extraction...")
-            entities = self.ner_extractor.extract_entities(extracted_text)
-            medications = self.ner_extractor.group_entities_into_medications(
-                entities, extracted_text
-            )
-            
-            avg_ner_confidence = sum(e.confidence for e in entities) / len(entities) if entities else 0.5
-            
-            results['ner'] = {
-                'status': 'success',
-                'num_entities': len(entities),
-                'num_medications': len(medications),
-                'confidence': avg_ner_confidence,
-                'medications': [
-                    {
-                        'drug_name': m.drug_name,
-                        'dosage': m.dosage,
-                        'frequency': m.frequency,
-                        'route': m.route,
-                        'duration': m.duration
-                    }
-                    for m in medications
-                ]
-            }
-
-            # Step 4: Pattern Matching
-            print(f"[{extraction_id}] Step 4: Pattern Matching...")
-            patterns = self.pattern_matcher.extract_all(extracted_text)
-            
-            results['patterns'] = {
-                'status': 'success',
-                'dosages': patterns['dosages'],
-                'frequency': patterns['frequency'],
-                'route': patterns['route'],
-                'duration': patterns['duration'],
-                'instructions': patterns['instructions']
-            }
-
-            # Step 5: Database Validation
-            print(f"[{extraction_id}] Step 5: Database Validation...")
-            validation_result = {}
-            validation_confidence = 0.5
-            
-            for med in medications:
-                if med.drug_name:
-                    validation = self.validator.validate_prescription(
-                        med.drug_name, med.dosage, med.frequency
-                    )
-                    validation_result[med.drug_name] = validation
-                    
-                    # Calculate validation confidence
-                    if validation['drug_valid']:
-                        validation_confidence = 0.9 if validation['dosage_valid'] else 0.7
-            
-            results['validation'] = {
-                'status': 'success',
-                'validations': validation_result,
-                'confidence': validation_confidence
-            }
-
-            # Step 6: Confidence Scoring
-            print(f"[{extraction_id}] Step 6: Confidence Scoring...")
-            score = self.confidence_scorer.calculate_confidence(
-                extraction_id=extraction_id,
-                ocr_confidence=avg_ocr_confidence,
-                ner_confidence=avg_ner_confidence,
-                validation_confidence=validation_confidence,
-                extracted_data={
-                    'medications': [asdict(m) for m in medications]
-                }
-            )
-            
-            results['confidence_score'] = asdict(score)
-            results['requires_review'] = score.requires_manual_review
-            
-            if score.requires_manual_review:
-                results['review_queue_id'] = extraction_id
-                print(f"[{extraction_id}] Low confidence ({score.overall_confidence:.2%}) - Added to manual review queue")
-            else:
-                print(f"[{extraction_id}] High confidence ({score.overall_confidence:.2%}) - Ready for use")
-
-        except Exception as e:
-            print(f"[{extraction_id}] Error: {str(e)}")
-            results['error'] = str(e)
-            results['status'] = 'failed'
-
-        return results
-
-    def get_review_queue(self) -> Dict:
-        """Get current manual review queue."""
-        pending = self.confidence_scorer.get_pending_reviews()
-        
-        return {
-            'total_pending': len(pending),
-            'items': [
-                {
-                    'extraction_id': item.extraction_id,
-                    'confidence': item.overall_confidence,
-                    'data': item.extracted_data
-                }
-                for item in pending
-            ],
-            'statistics': self.confidence_scorer.get_statistics()
-        }
-
-    def approve_extraction(self, extraction_id: str, notes: str = ""):
-        """Approve an extraction from review queue."""
-        self.confidence_scorer.update_review_status(
-            extraction_id, ReviewStatus.APPROVED, notes
-        )
-
-    def reject_extraction(self, extraction_id: str, reason: str):
-        """Reject an extraction from review queue."""
-        self.confidence_scorer.update_review_status(
-            extraction_id, ReviewStatus.REJECTED, reason
-        )
-
-    def process_batch(self, image_dir: str) -> Dict:
-        """
-        Process multiple prescription images in a directory.
-        
-        Args:
-            image_dir: Directory containing prescription images
-            
-        Returns:
-            Batch processing results
-        """
-        results = {
-            'total_processed': 0,
-            'successful': 0,
-            'failed': 0,
-            'manual_review_required': 0,
-            'extractions': []
-        }
-
-        for filename in os.listdir(image_dir):
-            if filename.lower().endswith(('.png', '.jpg', '.jpeg', '.bmp')):
-                image_path = os.path.join(image_dir, filename)
-                extraction = self.process_prescription(image_path)
-                
-                results['total_processed'] += 1
-                results['extractions'].append(extraction)
-                
-                if extraction.get('status') != 'failed':
-                    results['successful'] += 1
-                    if extraction.get('requires_review'):
-                        results['manual_review_required'] += 1
-                else:
-                    results['failed'] += 1
-
-        return results
-
-
-def main():
-    """Example usage of prescription digitizer."""
-    # Initialize digitizer
-    digitizer = PrescriptionDigitizer()
-    
-    # Process a single prescription
-    test_image = "data/sample_prescription.jpg"
-    if os.path.exists(test_image):
-        print("Processing prescription image...")
-        results = digitizer.process_prescription(test_image, save_intermediate=True)
-        
-        print("\n" + "="*50)
-        print("PRESCRIPTION DIGITIZATION RESULTS")
-        print("="*50)
-        print(f"Extraction ID: {results['extraction_id']}")
-        print(f"Status: {'Success' if results.get('status') != 'failed' else 'Failed'}")
-        
-        if results.get('ocr'):
-            print(f"\nExtracted Text: {results['ocr'].get('full_text', '')[:100]}...")
-            print(f"OCR Confidence: {results['ocr'].get('confidence', 0):.2%}")
-        
-        if results.get('ner'):
-            print(f"\nMedications Found: {results['ner'].get('num_medications', 0)}")
-            for med in results['ner'].get('medications', [])[:3]:
-                print(f"  - {med['drug_name']}: {med['dosage']} {med['frequency']}")
-        
-        if results.get('confidence_score'):
-            score = results['confidence_score']
-            print(f"\nOverall Confidence: {score['overall_confidence']:.2%}")
-            print(f"Requires Manual Review: {'Yes' if results.get('requires_review') else 'No'}")
-    
-    # Check manual review queue
-    queue = digitizer.get_review_queue()
-    print(f"\n\nManual Review Queue: {queue['total_pending']} items")
-
-
-if __name__ == "__main__":
-    main()
+"""
+Main prescription digitizer application.
+Orchestrates the complete pipeline: preprocessing, OCR, NER, and validation.
+"""
+
+import os
+import json
+import hashlib
+import threading
+import uuid
+from typing import Optional, Dict, List, Iterator, Tuple
+from datetime import datetime
+from dataclasses import asdict
+from concurrent.futures import Future, ProcessPoolExecutor, FIRST_COMPLETED, wait
+
+from src.preprocessing.image_processor import ImageProcessor
+from src.ocr.ocr_engine import OCREngine
+from src.ner.ner_extractor import NERExtractor
+from src.ner.pattern_matcher import PatternMatcher
+from src.validation.database_validator import DatabaseValidator
+from src.validation.confidence_scorer import ConfidenceScorer, ReviewStatus
+from drug_index import DrugIndex, LocalDrugValidator
+from batched_ner import BatchedNERExtractor
+from compiled_patterns import CompiledPatternMatcher
+from result_cache import ResultCache, hash_file
+from perceptual_hash import PerceptualHashIndex, dhash
+from model_registry import ModelRegistry
+from onnx_backend import apply_backend, accelerate_ner
+import config
+
+
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.bmp')
+
+# Digitizer owned by a batch worker process (models are loaded once per worker)
+_worker_digitizer = None
+
+
+def _init_batch_worker(config_path: str):
+    """Load all pipeline models once when a batch worker process starts."""
+    global _worker_digitizer
+    _worker_digitizer = PrescriptionDigitizer(config_path)
+
+
+def _process_in_worker(image_path: str) -> Dict:
+    """Process a single image with the worker's digitizer."""
+    return _worker_digitizer.process_prescription(image_path)
+
+
+class PrescriptionDigitizer:
+    """Main application for prescription digitization."""
+
+    def __init__(self, config_path: str = "configs/config.yaml", lazy: bool = False):
+        """
+        Initialize prescription digitizer with all components.
+        
+        Args:
+            config_path: Path to configuration file
+            lazy: Defer loading the OCR/NER models and validator until first use
+                  (or until models.warm_up()/models.load_all() is called)
+        """
+        self.config_path = config_path
+        self.config = self._load_config(config_path)
+        
+        # Initialize components
+        self.image_processor = ImageProcessor(
+            target_width=self.config.get('preprocessing', {}).get('target_width', 800),
+            target_height=self.config.get('preprocessing', {}).get('target_height', 600)
+        )
+        
+        # Heavy components are built through the registry (see the properties below)
+        ner_config = self.config.get('ner', {})
+        self.models = ModelRegistry()
+        self.models.register('ocr', lambda: OCREngine(
+            primary_backend=self.config.get('ocr', {}).get('backend', 'easyocr'),
+            languages=self.config.get('ocr', {}).get('languages', ['en']),
+            use_gpu=self.config.get('ocr', {}).get('use_gpu', False)
+        ))
+        self.models.register('ner', lambda: BatchedNERExtractor(
+            self._create_ner_extractor(ner_config),
+            batch_size=ner_config.get('batch_size', 16),
+            max_wait_ms=ner_config.get('max_wait_ms', 10),
+            micro_batching=ner_config.get('micro_batching', False)
+        ))
+        self.models.register('validator', lambda: self._create_validator(
+            self.config.get('validation', {})
+        ))
+        
+        if ner_config.get('pattern_engine', 'regex') == 'compiled':
+            self.pattern_matcher = CompiledPatternMatcher()
+        else:
+            self.pattern_matcher = PatternMatcher()
+        
+        self.confidence_scorer = ConfidenceScorer(
+            ocr_weight=self.config.get('scoring', {}).get('ocr_weight', 0.4),
+            ner_weight=self.config.get('scoring', {}).get('ner_weight', 0.35),
+            validation_weight=self.config.get('scoring', {}).get('validation_weight', 0.25),
+            manual_review_threshold=self.config.get('scoring', {}).get('manual_review_threshold', 0.7)
+        )
+        # ConfidenceScorer keeps its review queue in a plain dict; API servers
+        # score from several worker threads while review endpoints read it
+        self._scoring_lock = threading.Lock()
+        
+        cache_config = self.config.get('cache', {})
+        self.result_cache = None
+        if cache_config.get('enabled', config.RESULT_CACHE_ENABLED):
+            self.result_cache = ResultCache(
+                cache_dir=cache_config.get('dir', config.RESULT_CACHE_DIR),
+                max_items=cache_config.get('max_items', config.RESULT_CACHE_SIZE),
+                version=self.pipeline_version(),
+                max_disk_items=cache_config.get('max_disk_items', config.RESULT_CACHE_DISK_ITEMS)
+            )
+        
+        dedup_config = self.config.get('dedup', {})
+        self.duplicate_index = None
+        self.dedup_max_distance = dedup_config.get('max_distance', 6)
+        # Off by default: different prescriptions written on the same printed
+        # template can be within a few bits of each other
+        if dedup_config.get('enabled', False):
+            self.duplicate_index = PerceptualHashIndex(dedup_config.get('max_entries', 4096))
+        
+        if not lazy:
+            for name in ('ocr', 'ner', 'validator'):
+                self.models.get(name)
+
+    @property
+    def ocr_engine(self):
+        """OCR engine (loaded on first access when lazy)."""
+        return self.models.get('ocr')
+
+    @property
+    def ner_extractor(self):
+        """Batched NER extractor (loaded on first access when lazy)."""
+        return self.models.get('ner')
+
+    @property
+    def validator(self):
+        """Drug validator (loaded on first access when lazy)."""
+        return self.models.get('validator')
+
+    def pipeline_version(self) -> str:
+        """Version tag for cached results: release version plus a digest of model settings."""
+        settings = {
+            section: self.config.get(section)
+            for section in ('preprocessing', 'ocr', 'ner', 'validation', 'scoring')
+        }
+        digest = hashlib.sha256(
+            json.dumps(settings, sort_keys=True, default=str).encode()
+        ).hexdigest()[:12]
+        return f"{config.PIPELINE_VERSION}-{digest}"
+
+    def _create_ner_extractor(self, ner_config: Dict):
+        """Build the NER extractor, serving its transformer from ONNX Runtime if configured."""
+        extractor = NERExtractor(
+            use_clinical_bert=ner_config.get('use_clinical_bert', True),
+            use_gpu=ner_config.get('use_gpu', False)
+        )
+        apply_backend('ner', ner_config.get('backend', config.NER_BACKEND), accelerate_ner, extractor)
+        return extractor
+
+    def _create_validator(self, validation_config: Dict):
+        """Use the local drug index when built, keeping RxNav as fallback unless offline."""
+        offline = validation_config.get('offline', config.OFFLINE_MODE)
+        fallback = None
+        if not offline:
+            fallback = DatabaseValidator(
+                cache_dir=validation_config.get('cache_dir', 'data/drug_cache')
+            )
+        
+        index = DrugIndex(validation_config.get('drug_index_path', config.DRUG_INDEX_PATH))
+        if index.exists:
+            return LocalDrugValidator(index, fallback=fallback)
+        
+        if offline:
+            raise FileNotFoundError(
+                f"Offline validation requires a drug index at {index.db_path} "
+                f"(build it with: python drug_index.py build <rxnorm_rrf_dir>)"
+            )
+        return fallback
+
+    def _load_config(self, config_path: str) -> Dict:
+        """Load configuration file."""
+        if os.path.exists(config_path):
+            import yaml
+            try:
+                with open(config_path, 'r') as f:
+                    return yaml.safe_load(f)
+            except Exception as e:
+                print(f"Error loading config: {e}")
+        
+        return self._default_config()
+
+    def _default_config(self) -> Dict:
+        """Default configuration."""
+        return {
+            'preprocessing': {
+                'target_width': 800,
+                'target_height': 600
+            },
+            'ocr': {
+                'backend': 'easyocr',
+                'languages': ['en'],
+                'use_gpu': False
+            },
+            'ner': {
+                'use_clinical_bert': True,
+                'use_gpu': False,
+                'batch_size': 16,
+                'max_wait_ms': 10,
+                'micro_batching': False,
+                # 'compiled' switches to CompiledPatternMatcher once parity is confirmed
+                'pattern_engine': 'regex'
+            },
+            'validation': {
+                'cache_dir': 'data/drug_cache',
+                'drug_index_path': config.DRUG_INDEX_PATH,
+                'offline': config.OFFLINE_MODE
+            },
+            'scoring': {
+                'ocr_weight': 0.4,
+                'ner_weight': 0.35,
+                'validation_weight': 0.25,
+                'manual_review_threshold': 0.7
+            },
+            'cache': {
+                'enabled': config.RESULT_CACHE_ENABLED,
+                'dir': config.RESULT_CACHE_DIR,
+                'max_items': config.RESULT_CACHE_SIZE,
+                'max_disk_items': config.RESULT_CACHE_DISK_ITEMS
+            },
+            'dedup': {
+                'enabled': False,
+                'max_distance': 6,
+                'max_entries': 4096
+            },
+            'batch': {
+                'num_workers': os.cpu_count() or 1,
+                'progress_interval': 50
+            },
+            'pipeline': {
+                'queue_size': 8,
+                'workers': {
+                    'preprocess': 2,
+                    'ocr': 1,
+                    'ner': 4,
+                    'validate': 4
+                }
+            }
+        }
+
+    def process_prescription(self, image_path: str, 
+                            save_intermediate: bool = False,
+                            use_cache: bool = True,
+                            content_hash: Optional[str] = None) -> Dict:
+        """
+        Complete prescription digitization pipeline.
+        
+        Args:
+            image_path: Path to prescription image
+            save_intermediate: Save intermediate processing results
+            use_cache: Reuse the stored result for byte-identical images
+            content_hash: SHA-256 of the image file if already known (e.g. from the upload)
+            
+        Returns:
+            Complete extraction and validation results
+        """
+        results = self.new_results(image_path)
+
+        try:
+            # Hashing reads the file, so an unreadable path fails like any other stage
+            content_hash, cached = (
+                self.lookup_cached(image_path, content_hash) if use_cache else (None, None)
+            )
+            if cached is not None:
+                return cached
+
+            processed_image = self.run_preprocessing(results, image_path, save_intermediate)
+            image_hash, near_duplicate = self.find_near_duplicate(results, processed_image)
+            extracted_text, avg_ocr_confidence = self.run_ocr(results, processed_image)
+            if self.confirm_near_duplicate(results, near_duplicate, extracted_text):
+                self.reuse_extraction(results, *near_duplicate)
+            else:
+                medications, avg_ner_confidence = self.run_ner(results, extracted_text)
+                self.run_pattern_matching(results, extracted_text)
+                validation_confidence = self.run_validation(results, medications)
+                self.run_scoring(results, avg_ocr_confidence, avg_ner_confidence,
+                                 validation_confidence, medications)
+                if image_hash is not None:
+                    self.duplicate_index.add(image_hash, results)
+
+        except Exception as e:
+            self.mark_failed(results, e)
+
+        self.store_cached(content_hash, results)
+        return results
+
+    def lookup_cached(self, image_path: str,
+                      content_hash: Optional[str] = None) -> Tuple[Optional[str], Optional[Dict]]:
+        """
+        Look up the stored result for a byte-identical image.
+        
+        Args:
+            image_path: Path to prescription image
+            content_hash: SHA-256 of the file if already known (skips re-hashing)
+        
+        Returns:
+            (content hash or None if caching is off, cached result or None)
+        """
+        if self.result_cache is None or not os.path.isfile(image_path):
+            return None, None
+        content_hash = content_hash or hash_file(image_path)
+        cached = self.result_cache.get(content_hash)
+        if cached is None:
+            return content_hash, None
+        print(f"[{cached['extraction_id']}] Cache hit - reusing result for {image_path}")
+        return content_hash, dict(cached, image_path=image_path, cache_hit=True)
+
+    def store_cached(self, content_hash: Optional[str], results: Dict):
+        """
+        Store a finished result under its image's content hash.
+        
+        Failed results and results routed to manual review are not stored:
+        a re-upload must not return an unreviewed (or later rejected)
+        extraction as if it were final.
+        """
+        if content_hash is None or results.get('status') == 'failed' or results.get('requires_review'):
+            return
+        self.result_cache.put(content_hash, results)
+
+    # ------------------------------------------------------------------
+    # Pipeline stages (shared by process_prescription and PipelinedDigitizer)
+    # ------------------------------------------------------------------
+
+    def new_results(self, image_path: str) -> Dict:
+        """Create an empty results record for a new extraction."""
+        return {
+            'extraction_id': str(uuid.uuid4())[:8],
+            'timestamp': datetime.now().isoformat(),
+            'image_path': image_path,
+            'preprocessing': None,
+            'ocr': None,
+            'ner': None,
+            'patterns': None,
+            'validation': None,
+            'confidence_score': None,
+            'requires_review': False,
+            'review_queue_id': None
+        }
+
+    @staticmethod
+    def mark_failed(results: Dict, error: Exception):
+        """Record a pipeline failure on a results record."""
+        print(f"[{results['extraction_id']}] Error: {str(error)}")
+        results['error'] = str(error)
+        results['status'] = 'failed'
+
+    def run_preprocessing(self, results: Dict, image_path: str,
+                          save_intermediate: bool = False):
+        """Step 1: decode and preprocess the image."""
+        extraction_id = results['extraction_id']
+        print(f"[{extraction_id}] Step 1: Image Preprocessing...")
+        processed_image = self.image_processor.preprocess_pipeline(image_path)
+        
+        if processed_image is None:
+            raise ValueError("Image preprocessing failed")
+        
+        results['preprocessing'] = {
+            'status': 'success',
+            'message': 'Image successfully preprocessed'
+        }
+
+        # Save preprocessed image if requested
+        if save_intermediate:
+            processed_path = f"data/processed_{extraction_id}.jpg"
+            self.image_processor.save_image(processed_image, processed_path)
+            results['preprocessing']['output_path'] = processed_path
+
+        return processed_image
+
+    def find_near_duplicate(self, results: Dict, processed_image) -> Tuple[Optional[int], Optional[Tuple[Dict, int]]]:
+        """
+        Look for an earlier extraction of the same prescription re-photographed.
+        
+        A perceptual match is only a candidate; confirm_near_duplicate must
+        accept it against the new image's OCR text before anything is reused.
+        
+        Args:
+            results: Results record for the current extraction
+            processed_image: ImageProcessor output for the current image
+            
+        Returns:
+            (perceptual hash, (prior results, Hamming distance) or None)
+        """
+        if self.duplicate_index is None:
+            return None, None
+        
+        image_hash = dhash(processed_image)
+        results['perceptual_hash'] = f"{image_hash:016x}"
+        match = self.duplicate_index.nearest(image_hash, self.dedup_max_distance)
+        if match is None:
+            return image_hash, None
+        
+        prior, _ = match
+        # A reviewer has already acted on the earlier extraction; extract afresh
+        if prior.get('requires_review') and not self._review_pending(prior['extraction_id']):
+            return image_hash, None
+        return image_hash, match
+
+    def _review_pending(self, extraction_id: str) -> bool:
+        with self._scoring_lock:
+            pending = self.confidence_scorer.get_pending_reviews()
+        return any(item.extraction_id == extraction_id for item in pending)
+
+    @staticmethod
+    def confirm_near_duplicate(results: Dict, near_duplicate: Optional[Tuple[Dict, int]],
+                               extracted_text: str) -> bool:
+        """
+        Accept a near-duplicate candidate only if its OCR text is identical.
+        
+        NER, pattern matching and validation depend only on the text, so
+        reusing them for identical text gives the same answer as re-running.
+        """
+        if near_duplicate is None:
+            return False
+        prior, distance = near_duplicate
+        prior_text = (prior.get('ocr') or {}).get('full_text')
+        if prior_text is None or ' '.join(prior_text.split()) != ' '.join(extracted_text.split()):
+            print(f"[{results['extraction_id']}] Perceptual match with {prior['extraction_id']} "
+                  f"(distance {distance}) rejected - OCR text differs")
+            return False
+        return True
+
+    @staticmethod
+    def reuse_extraction(results: Dict, prior: Dict, distance: int):
+        """Copy NER/validation output from a confirmed near-duplicate extraction."""
+        print(f"[{results['extraction_id']}] Near-duplicate of {prior['extraction_id']} "
+              f"(distance {distance}, same OCR text) - reusing extraction")
+        for key in ('ner', 'patterns', 'validation', 'confidence_score',
+                    'requires_review', 'review_queue_id'):
+            results[key] = prior.get(key)
+        # Reuses the pending review entry instead of queueing the same prescription twice
+        results['near_duplicate_of'] = prior['extraction_id']
+        results['near_duplicate_distance'] = distance
+
+    def run_ocr(self, results: Dict, processed_image) -> Tuple[str, float]:
+        """Step 2: OCR text extraction on the in-memory preprocessed image."""
+        print(f"[{results['extraction_id']}] Step 2: OCR Text Extraction...")
+        # Reuses the preprocessed array so the source file is decoded only once
+        ocr_results = self.ocr_engine.extract_text(processed_image)
+        
+        if not ocr_results:
+            raise ValueError("OCR extraction failed")
+        
+        extracted_text = self.ocr_engine.get_full_text(ocr_results)
+        avg_ocr_confidence = sum(r.confidence for r in ocr_results) / len(ocr_results)
+        
+        results['ocr'] = {
+            'status': 'success',
+            'full_text': extracted_text,
+            'confidence': avg_ocr_confidence,
+            'num_extractions': len(ocr_results),
+            'details': [asdict(r) for r in ocr_results[:5]]  # Top 5
+        }
+
+        return extracted_text, avg_ocr_confidence
+
+    def run_ner(self, results: Dict, extracted_text: str) -> Tuple[List, float]:
+        """Step 3: NER and entity extraction."""
+        print(f"[{results['extraction_id']}] Step 3: NER Entity Extraction...")
+        entities = self.ner_extractor.extract_entities(extracted_text)
+        medications = self.ner_extractor.group_entities_into_medications(
+            entities, extracted_text
+        )
+        
+        avg_ner_confidence = sum(e.confidence for e in entities) / len(entities) if entities else 0.5
+        
+        results['ner'] = {
+            'status': 'success',
+            'num_entities': len(entities),
+            'num_medications': len(medications),
+            'confidence': avg_ner_confidence,
+            'medications': [
+                {
+                    'drug_name': m.drug_name,
+                    'dosage': m.dosage,
+                    'frequency': m.frequency,
+                    'route': m.route,
+                    'duration': m.duration
+                }
+                for m in medications
+            ]
+        }
+
+        return medications, avg_ner_confidence
+
+    def run_pattern_matching(self, results: Dict, extracted_text: str):
+        """Step 4: rule-based pattern matching."""
+        print(f"[{results['extraction_id']}] Step 4: Pattern Matching...")
+        patterns = self.pattern_matcher.extract_all(extracted_text)
+        
+        results['patterns'] = {
+            'status': 'success',
+            'dosages': patterns['dosages'],
+            'frequency': patterns['frequency'],
+            'route': patterns['route'],
+            'duration': patterns['duration'],
+            'instructions': patterns['instructions']
+        }
+
+    def run_validation(self, results: Dict, medications: List) -> float:
+        """Step 5: database validation of extracted medications."""
+        print(f"[{results['extraction_id']}] Step 5: Database Validation...")
+        validation_result = {}
+        validation_confidence = 0.5
+        
+        for med in medications:
+            if med.drug_name:
+                validation = self.validator.validate_prescription(
+                    med.drug_name, med.dosage, med.frequency
+                )
+                validation_result[med.drug_name] = validation
+                
+                # Calculate validation confidence
+                if validation['drug_valid']:
+                    validation_confidence = 0.9 if validation['dosage_valid'] else 0.7
+        
+        results['validation'] = {
+            'status': 'success',
+            'validations': validation_result,
+            'confidence': validation_confidence
+        }
+
+        return validation_confidence
+
+    def run_scoring(self, results: Dict, ocr_confidence: float,
+                    ner_confidence: float, validation_confidence: float,
+                    medications: List):
+        """Step 6: confidence scoring and review routing."""
+        extraction_id = results['extraction_id']
+        print(f"[{extraction_id}] Step 6: Confidence Scoring...")
+        with self._scoring_lock:
+            score = self.confidence_scorer.calculate_confidence(
+                extraction_id=extraction_id,
+                ocr_confidence=ocr_confidence,
+                ner_confidence=ner_confidence,
+                validation_confidence=validation_confidence,
+                extracted_data={
+                    'medications': [asdict(m) for m in medications]
+                }
+            )
+        
+        results['confidence_score'] = asdict(score)
+        results['requires_review'] = score.requires_manual_review
+        
+        if score.requires_manual_review:
+            results['review_queue_id'] = extraction_id
+            print(f"[{extraction_id}] Low confidence ({score.overall_confidence:.2%}) - Added to manual review queue")
+        else:
+            print(f"[{extraction_id}] High confidence ({score.overall_confidence:.2%}) - Ready for use")
+
+    def extract_text_batch(self, images: List) -> List[List]:
+        """
+        Run OCR over a batch of preprocessed images held in memory.
+        
+        Args:
+            images: Arrays as returned by ImageProcessor.preprocess_pipeline
+            
+        Returns:
+            One list of OCR results per input image
+        """
+        batch_extract = getattr(self.ocr_engine, 'extract_text_batch', None)
+        if batch_extract is not None:
+            return batch_extract(images)
+        
+        return [self.ocr_engine.extract_text(image) for image in images]
+
+    def extract_entities_batch(self, texts: List[str]) -> List[List]:
+        """
+        Run NER over many prescription texts in length-bucketed batches.
+        
+        Args:
+            texts: OCR output texts
+            
+        Returns:
+            One entity list per input text
+        """
+        return self.ner_extractor.extract_entities_batch(texts)
+
+    def get_review_queue(self) -> Dict:
+        """Get current manual review queue."""
+        with self._scoring_lock:
+            pending = list(self.confidence_scorer.get_pending_reviews())
+            statistics = self.confidence_scorer.get_statistics()
+        
+        return {
+            'total_pending': len(pending),
+            'items': [
+                {
+                    'extraction_id': item.extraction_id,
+                    'confidence': item.overall_confidence,
+                    'data': item.extracted_data
+                }
+                for item in pending
+            ],
+            'statistics': statistics
+        }
+
+    def approve_extraction(self, extraction_id: str, notes: str = ""):
+        """Approve an extraction from review queue."""
+        with self._scoring_lock:
+            self.confidence_scorer.update_review_status(
+                extraction_id, ReviewStatus.APPROVED, notes
+            )
+
+    def reject_extraction(self, extraction_id: str, reason: str):
+        """Reject an extraction from review queue."""
+        with self._scoring_lock:
+            self.confidence_scorer.update_review_status(
+                extraction_id, ReviewStatus.REJECTED, reason
+            )
+
+    @staticmethod
+    def iter_image_paths(image_dir: str) -> Iterator[str]:
+        """Lazily yield prescription image paths found in a directory."""
+        with os.scandir(image_dir) as entries:
+            for entry in entries:
+                if entry.is_file() and entry.name.lower().endswith(IMAGE_EXTENSIONS):
+                    yield entry.path
+
+    def process_batch(self, image_dir: str, num_workers: int = 1,
+                      content_hashes: Optional[Dict[str, str]] = None) -> Dict:
+        """
+        Process multiple prescription images in a directory.
+        
+        Args:
+            image_dir: Directory containing prescription images
+            num_workers: Worker processes to use (1 processes in this process)
+            content_hashes: Known SHA-256 per image path (e.g. from the uploads)
+            
+        Returns:
+            Batch processing results
+        """
+        results = {
+            'total_processed': 0,
+            'successful': 0,
+            'failed': 0,
+            'manual_review_required': 0,
+            'extractions': []
+        }
+
+        if num_workers > 1:
+            extractions = self.process_batch_parallel(image_dir, num_workers=num_workers)
+        else:
+            content_hashes = content_hashes or {}
+            extractions = (
+                self.process_prescription(image_path, content_hash=content_hashes.get(image_path))
+                for image_path in self.iter_image_paths(image_dir)
+            )
+
+        for extraction in extractions:
+            results['total_processed'] += 1
+            results['extractions'].append(extraction)
+            
+            if extraction.get('status') != 'failed':
+                results['successful'] += 1
+                if extraction.get('requires_review'):
+                    results['manual_review_required'] += 1
+            else:
+                results['failed'] += 1
+
+        return results
+
+    def process_batch_parallel(self, image_dir: str,
+                               num_workers: Optional[int] = None,
+                               max_pending: Optional[int] = None,
+                               show_progress: bool = True) -> Iterator[Dict]:
+        """
+        Process a directory of prescriptions across a pool of worker processes.
+        
+        Each worker loads the OCR/NER models once. Results are yielded in
+        completion order and only a bounded number of images are in flight,
+        so arbitrarily large directories can be streamed without holding all
+        extractions in memory. An image whose worker fails (or a broken
+        pool) yields a ``status: 'failed'`` record instead of ending the run.
+        
+        This digitizer only hands out paths, so build it with ``lazy=True``
+        (see process_directory) to avoid loading a copy of every model in
+        the parent as well.
+        
+        Args:
+            image_dir: Directory containing prescription images
+            num_workers: Number of worker processes (defaults to config/CPU count)
+            max_pending: Maximum submitted-but-unfinished images (defaults to 4x workers)
+            show_progress: Print periodic progress lines
+            
+        Yields:
+            Extraction results, one per image, as they complete
+        """
+        batch_config = self.config.get('batch', {})
+        num_workers = num_workers or batch_config.get('num_workers') or os.cpu_count() or 1
+        max_pending = max_pending or num_workers * 4
+        progress_interval = batch_config.get('progress_interval', 50)
+
+        image_paths = self.iter_image_paths(image_dir)
+        completed = 0
+        failed = 0
+
+        with ProcessPoolExecutor(max_workers=num_workers,
+                                 initializer=_init_batch_worker,
+                                 initargs=(self.config_path,)) as executor:
+            pending = {}
+            exhausted = False
+
+            while pending or not exhausted:
+                # Keep the pool saturated without queueing the whole directory
+                while not exhausted and len(pending) < max_pending:
+                    image_path = next(image_paths, None)
+                    if image_path is None:
+                        exhausted = True
+                        break
+                    try:
+                        pending[executor.submit(_process_in_worker, image_path)] = image_path
+                    except Exception as e:
+                        # Broken pool: report the image instead of aborting the batch
+                        failed_future = Future()
+                        failed_future.set_exception(e)
+                        pending[failed_future] = image_path
+
+                if not pending:
+                    break
+
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    image_path = pending.pop(future)
+                    try:
+                        extraction = future.result()
+                    except Exception as e:
+                        extraction = self.new_results(image_path)
+                        self.mark_failed(extraction, e)
+                    completed += 1
+                    if extraction.get('status') == 'failed':
+                        failed += 1
+                    
+                    if show_progress and completed % progress_interval == 0:
+                        print(f"[Batch] {completed} processed ({failed} failed), "
+                              f"{len(pending)} in flight")
+                    
+                    yield extraction
+
+        if show_progress:
+            print(f"[Batch] Complete: {completed} processed ({failed} failed)")
+
+
+def process_directory(image_dir: str, config_path: str = "configs/config.yaml",
+                      num_workers: Optional[int] = None) -> Dict:
+    """
+    Process a directory of prescriptions across worker processes.
+    
+    Only the workers load models; the coordinating digitizer is lazy
+    (with a single worker, the models load in this process on first use).
+    
+    Args:
+        image_dir: Directory containing prescription images
+        config_path: Path to configuration file
+        num_workers: Number of worker processes (defaults to config/CPU count)
+        
+    Returns:
+        Batch processing results
+    """
+    digitizer = PrescriptionDigitizer(config_path, lazy=True)
+    batch_config = digitizer.config.get('batch', {})
+    num_workers = num_workers or batch_config.get('num_workers') or os.cpu_count() or 1
+    return digitizer.process_batch(image_dir, num_workers=num_workers)
+
+
+def main():
+    """Example usage of prescription digitizer."""
+    # Initialize digitizer
+    digitizer = PrescriptionDigitizer()
+    
+    # Process a single prescription
+    test_image = "data/sample_prescription.jpg"
+    if os.path.exists(test_image):
+        print("Processing prescription image...")
+        results = digitizer.process_prescription(test_image, save_intermediate=True)
+        
+        print("\n" + "="*50)
+        print("PRESCRIPTION DIGITIZATION RESULTS")
+        print("="*50)
+        print(f"Extraction ID: {results['extraction_id']}")
+        print(f"Status: {'Success' if results.get('status') != 'failed' else 'Failed'}")
+        
+        if results.get('ocr'):
+            print(f"\nExtracted Text: {results['ocr'].get('full_text', '')[:100]}...")
+            print(f"OCR Confidence: {results['ocr'].get('confidence', 0):.2%}")
+        
+        if results.get('ner'):
+            print(f"\nMedications Found: {results['ner'].get('num_medications', 0)}")
+            for med in results['ner'].get('medications', [])[:3]:
+                print(f"  - {med['drug_name']}: {med['dosage']} {med['frequency']}")
+        
+        if results.get('confidence_score'):
+            score = results['confidence_score']
+            print(f"\nOverall Confidence: {score['overall_confidence']:.2%}")
+            print(f"Requires Manual Review: {'Yes' if results.get('requires_review') else 'No'}")
+    
+    # Check manual review queue
+    queue = digitizer.get_review_queue()
+    print(f"\n\nManual Review Queue: {queue['total_pending']} items")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,295 @@
+"""
+Stage-pipelined prescription processing.
+Runs preprocessing, OCR, NER and validation as concurrent stages connected
+by bounded queues, so throughput is set by the slowest stage instead of the
+sum of all of them.
+"""
+
+import queue
+import threading
+from contextlib import nullcontext
+from dataclasses import dataclass, field
+from typing import Optional, Dict, List, Iterable, Iterator, Callable, Tuple
+
+from prescription_digitizer import PrescriptionDigitizer
+
+
+# Marks the end of the input stream on a stage queue
+_END = object()
+
+
+@dataclass
+class PipelineItem:
+    """A prescription moving through the pipeline with its intermediate state."""
+    image_path: str
+    results: Dict
+    sequence: int = 0
+    content_hash: Optional[str] = None
+    image_hash: Optional[int] = None
+    near_duplicate: Optional[Tuple[Dict, int]] = None
+    # Set when a cached or confirmed near-duplicate result already answers the item
+    complete: bool = False
+    processed_image: object = None
+    extracted_text: str = ""
+    ocr_confidence: float = 0.0
+    medications: List = field(default_factory=list)
+    ner_confidence: float = 0.5
+
+    @property
+    def failed(self) -> bool:
+        return self.results.get('status') == 'failed'
+
+
+class PipelineStage:
+    """A pool of worker threads that reads items from one queue and feeds the next."""
+
+    def __init__(self, name: str, handler: Callable[[PipelineItem], None],
+                 num_workers: int, input_queue: queue.Queue,
+                 output_queue: queue.Queue, stop_event: threading.Event):
+        self.name = name
+        self.handler = handler
+        self.num_workers = max(1, num_workers)
+        self.input_queue = input_queue
+        self.output_queue = output_queue
+        self.stop_event = stop_event
+        self.processed = 0
+        self._active = self.num_workers
+        self._lock = threading.Lock()
+        self._threads = []
+
+    def start(self):
+        """Start the stage's worker threads."""
+        for i in range(self.num_workers):
+            thread = threading.Thread(
+                target=self._run, name=f"pipeline-{self.name}-{i}", daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+
+    def _run(self):
+        while not self.stop_event.is_set():
+            try:
+                item = self.input_queue.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            if item is _END:
+                break
+
+            # Failed and already answered items skip the remaining stages but still reach the output
+            if not item.failed and not item.complete:
+                try:
+                    self.handler(item)
+                except Exception as e:
+                    PrescriptionDigitizer.mark_failed(item.results, e)
+
+            with self._lock:
+                self.processed += 1
+            put_with_backpressure(self.output_queue, item, self.stop_event)
+
+        # The last worker to exit propagates end-of-stream downstream
+        with self._lock:
+            self._active -= 1
+            last = self._active == 0
+        if last:
+            put_with_backpressure(self.output_queue, _END, self.stop_event)
+        else:
+            # Let sibling workers see the end marker too
+            put_with_backpressure(self.input_queue, _END, self.stop_event)
+
+
+def put_with_backpressure(target: queue.Queue, item, stop_event: threading.Event,
+                          poll_interval: float = 0.1) -> bool:
+    """Block until the queue accepts the item, giving up if the pipeline stops."""
+    while not stop_event.is_set():
+        try:
+            target.put(item, timeout=poll_interval)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+class PipelinedDigitizer:
+    """
+    Concurrent prescription pipeline built on a PrescriptionDigitizer.
+
+    Stages and their default concurrency:
+        preprocess (CPU-bound)      ImageProcessor
+        ocr        (model-bound)    OCREngine
+        ner        (model-bound)    NERExtractor + PatternMatcher
+        validate   (I/O-bound)      DatabaseValidator + ConfidenceScorer
+
+    Every queue between stages is bounded, so a slow stage throttles the
+    ones in front of it instead of letting work pile up in memory.
+    """
+
+    STAGES = ('preprocess', 'ocr', 'ner', 'validate')
+
+    def __init__(self, digitizer: Optional[PrescriptionDigitizer] = None,
+                 stage_workers: Optional[Dict[str, int]] = None,
+                 queue_size: Optional[int] = None):
+        """
+        Initialize the pipelined engine.
+
+        Args:
+            digitizer: Digitizer whose components run in each stage
+            stage_workers: Worker threads per stage (overrides config)
+            queue_size: Capacity of each inter-stage queue (overrides config)
+        """
+        self.digitizer = digitizer or PrescriptionDigitizer()
+
+        pipeline_config = self.digitizer.config.get('pipeline', {})
+        self.stage_workers = dict(pipeline_config.get('workers', {}))
+        self.stage_workers.update(stage_workers or {})
+        self.queue_size = queue_size or pipeline_config.get('queue_size', 8)
+
+        # NER and validation components are serialized unless they declare
+        # thread_safe; the digitizer serializes confidence scoring itself
+        self._component_locks = {'ner': threading.Lock(), 'validate': threading.Lock()}
+        self.stats = {}
+
+    # ------------------------------------------------------------------
+    # Stage handlers
+    # ------------------------------------------------------------------
+
+    def _guard(self, stage: str, component):
+        if getattr(component, 'thread_safe', False):
+            return nullcontext()
+        return self._component_locks[stage]
+
+    def _preprocess(self, item: PipelineItem):
+        item.content_hash, cached = self.digitizer.lookup_cached(item.image_path)
+        if cached is not None:
+            item.results = cached
+            item.complete = True
+            return
+
+        item.processed_image = self.digitizer.run_preprocessing(
+            item.results, item.image_path
+        )
+        item.image_hash, item.near_duplicate = self.digitizer.find_near_duplicate(
+            item.results, item.processed_image
+        )
+
+    def _ocr(self, item: PipelineItem):
+        item.extracted_text, item.ocr_confidence = self.digitizer.run_ocr(
+            item.results, item.processed_image
+        )
+        # The image is not needed downstream; release it early
+        item.processed_image = None
+        if self.digitizer.confirm_near_duplicate(item.results, item.near_duplicate,
+                                                 item.extracted_text):
+            self.digitizer.reuse_extraction(item.results, *item.near_duplicate)
+            item.complete = True
+
+    def _ner(self, item: PipelineItem):
+        with self._guard('ner', self.digitizer.ner_extractor):
+            item.medications, item.ner_confidence = self.digitizer.run_ner(
+                item.results, item.extracted_text
+            )
+        self.digitizer.run_pattern_matching(item.results, item.extracted_text)
+
+    def _validate(self, item: PipelineItem):
+        with self._guard('validate', self.digitizer.validator):
+            validation_confidence = self.digitizer.run_validation(
+                item.results, item.medications
+            )
+        self.digitizer.run_scoring(
+            item.results, item.ocr_confidence, item.ner_confidence,
+            validation_confidence, item.medications
+        )
+        if item.image_hash is not None:
+            self.digitizer.duplicate_index.add(item.image_hash, item.results)
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def process_stream(self, image_paths: Iterable[str], ordered: bool = False) -> Iterator[Dict]:
+        """
+        Process prescriptions concurrently across all stages.
+
+        Args:
+            image_paths: Iterable of prescription image paths (may be lazy)
+            ordered: Yield results in input order instead of completion order
+
+        Yields:
+            Extraction results
+
+        Raises:
+            Whatever image_paths raised, after every item read before the error
+        """
+        stop_event = threading.Event()
+        handlers = {
+            'preprocess': self._preprocess,
+            'ocr': self._ocr,
+            'ner': self._ner,
+            'validate': self._validate,
+        }
+
+        queues = [queue.Queue(maxsize=self.queue_size) for _ in range(len(self.STAGES) + 1)]
+        stages = [
+            PipelineStage(
+                name, handlers[name], self.stage_workers.get(name, 1),
+                queues[i], queues[i + 1], stop_event
+            )
+            for i, name in enumerate(self.STAGES)
+        ]
+        for stage in stages:
+            stage.start()
+
+        feed_errors = []
+
+        def feed():
+            try:
+                for sequence, image_path in enumerate(image_paths):
+                    item = PipelineItem(
+                        image_path=image_path,
+                        results=self.digitizer.new_results(image_path),
+                        sequence=sequence
+                    )
+                    if not put_with_backpressure(queues[0], item, stop_event):
+                        return
+            except Exception as e:
+                feed_errors.append(e)
+            finally:
+                # Always end the stream so the consumer below never waits forever
+                put_with_backpressure(queues[0], _END, stop_event)
+
+        feeder = threading.Thread(target=feed, name="pipeline-feeder", daemon=True)
+        feeder.start()
+
+        output_queue = queues[-1]
+        reorder_buffer = {}
+        next_sequence = 0
+        try:
+            while True:
+                item = output_queue.get()
+                if item is _END:
+                    break
+                if not item.results.get('cache_hit'):
+                    self.digitizer.store_cached(item.content_hash, item.results)
+                if not ordered:
+                    yield item.results
+                    continue
+                reorder_buffer[item.sequence] = item
+                while next_sequence in reorder_buffer:
+                    yield reorder_buffer.pop(next_sequence).results
+                    next_sequence += 1
+            if feed_errors:
+                raise feed_errors[0]
+        finally:
+            # Also reached when the consumer abandons the generator early
+            stop_event.set()
+            self.stats = {stage.name: stage.processed for stage in stages}
+
+    def process_directory(self, image_dir: str) -> Iterator[Dict]:
+        """Pipeline every prescription image in a directory."""
+        return self.process_stream(PrescriptionDigitizer.iter_image_paths(image_dir))
+
+    def get_queue_config(self) -> Dict:
+        """Return the effective stage concurrency and queue capacity."""
+        return {
+            'queue_size': self.queue_size,
+            'workers': {name: max(1, self.stage_workers.get(name, 1)) for name in self.STAGES}
+        }
@@ -0,0 +1,117 @@
+"""
+Replay an intake video against the live-intake WebSocket endpoint.
+Sends the video frame by frame as JPEG messages, optionally paced at the
+video's frame rate, and prints intake events with their end-to-end latency.
+"""
+
+import argparse
+import asyncio
+import json
+import time
+
+import cv2
+import websockets
+
+from video_stream import VideoFrameStream
+
+DEFAULT_URL = "ws://localhost:8000/api/v1/live-intake"
+
+
+async def _send_frames(connection, video_path: str, stride: int, realtime: bool,
+                       jpeg_quality: int, max_width: int) -> int:
+    sent = 0
+    with VideoFrameStream(video_path, stride=stride) as stream:
+        interval = stride / stream.fps if realtime else 0.0
+        started = time.monotonic()
+
+        for frame_id, frame in stream:
+            if max_width and frame.shape[1] > max_width:
+                scale = max_width / frame.shape[1]
+                frame = cv2.resize(frame, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+
+            ok, encoded = cv2.imencode('.jpg', frame, [cv2.IMWRITE_JPEG_QUALITY, jpeg_quality])
+            if not ok:
+                continue
+            await connection.send(encoded.tobytes())
+            sent += 1
+
+            if interval:
+                # Pace against the start time so encoding cost does not accumulate as drift
+                delay = started + sent * interval - time.monotonic()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+
+    await connection.send(json.dumps({'type': 'end'}))
+    return sent
+
+
+async def _receive_messages(connection):
+    summary = None
+    async for raw in connection:
+        message = json.loads(raw)
+        if message['type'] == 'event':
+            print(f"  intake event at frame {message['frame_id']}: "
+                  f"{message['event']['status']} ({message['confidence']:.0%}), "
+                  f"latency {message['latency_ms']:.0f} ms")
+        elif message['type'] == 'error':
+            print(f"  error: {message['message']}")
+        elif message['type'] == 'summary':
+            summary = message
+    return summary
+
+
+async def replay(video_path: str, url: str = DEFAULT_URL, patient_id: str = 'replay',
+                 medication_id: str = 'replay', stride: int = 1, realtime: bool = True,
+                 jpeg_quality: int = 80, max_width: int = 640):
+    """
+    Stream a video file to the live-intake endpoint.
+
+    Args:
+        video_path: Video to replay
+        url: WebSocket endpoint URL
+        patient_id: Patient identifier sent with the session
+        medication_id: Medication identifier sent with the session
+        stride: Send every n-th frame
+        realtime: Pace frames at the video's frame rate (otherwise as fast as possible)
+        jpeg_quality: JPEG quality of sent frames
+        max_width: Downscale wider frames to this width (0 keeps the original size)
+
+    Returns:
+        Summary message sent by the server when the session closes
+    """
+    session_url = f"{url}?patient_id={patient_id}&medication_id={medication_id}"
+    async with websockets.connect(session_url, max_size=None) as connection:
+        receiver = asyncio.create_task(_receive_messages(connection))
+        sent = await _send_frames(connection, video_path, stride, realtime, jpeg_quality, max_width)
+        summary = await receiver
+
+    print(f"Sent {sent} frames")
+    if summary:
+        print(f"Server processed {summary['frames_processed']} frames "
+              f"({summary['frames_dropped']} dropped), {summary['events_emitted']} intake events")
+    return summary
+
+
+def main():
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Replay an intake video as a live frame stream")
+    parser.add_argument('video', help="Video file to replay (MP4/MOV/AVI)")
+    parser.add_argument('--url', default=DEFAULT_URL, help="live-intake WebSocket URL")
+    parser.add_argument('--patient-id', default='replay')
+    parser.add_argument('--medication-id', default='replay')
+    parser.add_argument('--stride', type=int, default=1, help="Send every n-th frame")
+    parser.add_argument('--fast', action='store_true',
+                        help="Send frames as fast as possible (the server drops frames it cannot keep up with)")
+    parser.add_argument('--quality', type=int, default=80, help="JPEG quality")
+    parser.add_argument('--max-width', type=int, default=640, help="Downscale wider frames (0 = off)")
+    args = parser.parse_args()
+
+    asyncio.run(replay(
+        args.video, args.url, args.patient_id, args.medication_id,
+        stride=args.stride, realtime=not args.fast,
+        jpeg_quality=args.quality, max_width=args.max_width
+    ))
+
+
+if __name__ == "__main__":
+    main()
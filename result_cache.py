@@ -0,0 +1,177 @@
+"""
+Content-addressed cache for prescription extraction results.
+Results are keyed by the SHA-256 of the uploaded image bytes plus the
+pipeline version, held in an in-memory LRU and persisted as JSON on disk.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+import config
+
+
+def hash_bytes(data: bytes) -> str:
+    """SHA-256 hex digest of raw bytes."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def hash_file(path: str, chunk_size: int = 1 << 20) -> str:
+    """SHA-256 hex digest of a file, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """
+    Two-level result cache.
+
+    Lookups hit the in-memory LRU first, then the on-disk store (one JSON
+    file per key, sharded by prefix). Entries written under a different
+    pipeline version are never returned, so upgrading models or changing
+    the pipeline config invalidates old results without a manual purge;
+    the disk store is capped at ``max_disk_items`` files and the least
+    recently used ones (stale versions first, in practice) are deleted.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, max_items: Optional[int] = None,
+                 version: Optional[str] = None, max_disk_items: Optional[int] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory for the on-disk store (defaults to config.RESULT_CACHE_DIR)
+            max_items: Entries kept in memory (defaults to config.RESULT_CACHE_SIZE)
+            version: Pipeline/model version mixed into every key
+            max_disk_items: Files kept on disk (defaults to config.RESULT_CACHE_DISK_ITEMS)
+        """
+        self.cache_dir = cache_dir or config.RESULT_CACHE_DIR
+        self.max_items = max_items or config.RESULT_CACHE_SIZE
+        self.version = version or config.PIPELINE_VERSION
+        self.max_disk_items = max_disk_items or config.RESULT_CACHE_DISK_ITEMS
+        self._memory: "OrderedDict[str, Dict]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {'memory_hits': 0, 'disk_hits': 0, 'misses': 0}
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self._disk_items = len(self._disk_entries())
+
+    def _disk_entries(self) -> List[str]:
+        entries = []
+        for shard in os.scandir(self.cache_dir):
+            if shard.is_dir():
+                entries.extend(entry.path for entry in os.scandir(shard.path)
+                               if entry.name.endswith('.json'))
+        return entries
+
+    def _prune_disk(self):
+        """Delete least recently used files down to 90% of the disk bound."""
+        entries = []
+        for path in self._disk_entries():
+            try:
+                entries.append((os.path.getmtime(path), path))
+            except OSError:
+                continue
+        entries.sort()
+        excess = len(entries) - int(self.max_disk_items * 0.9)
+        for _, path in entries[:max(0, excess)]:
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+        with self._lock:
+            self._disk_items = len(entries) - max(0, excess)
+
+    def key(self, content_hash: str) -> str:
+        """Cache key for a content hash under the current pipeline version."""
+        return hashlib.sha256(f"{self.version}:{content_hash}".encode()).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key[:2], f"{key}.json")
+
+    def _remember(self, key: str, result: Dict):
+        with self._lock:
+            self._memory[key] = result
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_items:
+                self._memory.popitem(last=False)
+
+    def get(self, content_hash: str) -> Optional[Dict]:
+        """
+        Look up a cached result.
+
+        Args:
+            content_hash: SHA-256 of the image bytes
+
+        Returns:
+            Cached result, or None on a miss
+        """
+        key = self.key(content_hash)
+        with self._lock:
+            result = self._memory.get(key)
+            if result is not None:
+                self._memory.move_to_end(key)
+                self.stats['memory_hits'] += 1
+                return result
+
+        path = self._path(key)
+        if os.path.exists(path):
+            try:
+                with open(path, 'r') as f:
+                    result = json.load(f)
+            except (OSError, ValueError):
+                result = None
+            if result is not None:
+                self._remember(key, result)
+                self.stats['disk_hits'] += 1
+                try:
+                    # Mark as recently used for disk pruning
+                    os.utime(path)
+                except OSError:
+                    pass
+                return result
+
+        self.stats['misses'] += 1
+        return None
+
+    def put(self, content_hash: str, result: Dict):
+        """
+        Store a result in memory and on disk.
+
+        Args:
+            content_hash: SHA-256 of the image bytes
+            result: JSON-serializable extraction result
+        """
+        key = self.key(content_hash)
+        self._remember(key, result)
+
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Write then rename so concurrent readers never see a partial file
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(result, f, default=str)
+        is_new = not os.path.exists(path)
+        os.replace(tmp_path, path)
+
+        if is_new:
+            with self._lock:
+                self._disk_items += 1
+                over_limit = self._disk_items > self.max_disk_items
+            if over_limit:
+                self._prune_disk()
+
+    def get_statistics(self) -> Dict:
+        """Hit/miss counters and memory occupancy."""
+        stats = dict(self.stats)
+        lookups = sum(stats.values())
+        stats['hit_rate'] = (stats['memory_hits'] + stats['disk_hits']) / lookups if lookups else 0.0
+        stats['memory_items'] = len(self._memory)
+        stats['disk_items'] = self._disk_items
+        stats['version'] = self.version
+        return stats
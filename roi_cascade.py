@@ -0,0 +1,173 @@
+"""
+Region-of-interest cascade for intake verification.
+Cheap pill and face detections decide where (and whether) the heavier hand
+pose and action models run, so they see small crops around the pill and the
+patient's face instead of full frames.
+"""
+
+from typing import List, Optional, Sequence, Tuple
+
+import cv2
+import numpy as np
+
+Box = Tuple[int, int, int, int]
+
+
+class FaceDetector:
+    """
+    Haar-cascade face detector run on a downscaled grayscale frame.
+
+    The result is cached for ``refresh_interval`` frames; faces move slowly
+    compared with hands, so the cascade only needs an occasional update.
+    """
+
+    def __init__(self, scale: float = 0.25, refresh_interval: int = 8):
+        """
+        Initialize the face detector.
+
+        Args:
+            scale: Downscale factor applied before detection
+            refresh_interval: Frames a detected face box is reused for
+        """
+        self.scale = scale
+        self.refresh_interval = refresh_interval
+        self._cascade = cv2.CascadeClassifier(
+            cv2.data.haarcascades + 'haarcascade_frontalface_default.xml'
+        )
+        self._last_box: Optional[Box] = None
+        self._last_frame: Optional[int] = None
+
+    def detect(self, frame: np.ndarray, frame_id: int) -> Optional[Box]:
+        """
+        Largest face in the frame, as an (x1, y1, x2, y2) box.
+
+        Args:
+            frame: BGR frame
+            frame_id: Frame index (used for caching)
+
+        Returns:
+            Face box in frame coordinates, or None
+        """
+        if self._last_frame is not None and 0 <= frame_id - self._last_frame < self.refresh_interval:
+            return self._last_box
+
+        small = cv2.resize(frame, None, fx=self.scale, fy=self.scale, interpolation=cv2.INTER_AREA)
+        gray = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
+        faces = self._cascade.detectMultiScale(gray, scaleFactor=1.2, minNeighbors=4)
+
+        box = None
+        if len(faces):
+            x, y, w, h = max(faces, key=lambda f: f[2] * f[3])
+            box = tuple(int(v / self.scale) for v in (x, y, x + w, y + h))
+
+        self._last_box = box
+        self._last_frame = frame_id
+        return box
+
+
+def union_box(boxes: Sequence[Box]) -> Box:
+    """Smallest box containing all boxes."""
+    boxes = np.asarray(boxes, dtype=float)
+    return (int(boxes[:, 0].min()), int(boxes[:, 1].min()),
+            int(np.ceil(boxes[:, 2].max())), int(np.ceil(boxes[:, 3].max())))
+
+
+def expand_box(box: Box, frame_shape: Tuple[int, ...], margin: float = 0.5,
+               min_size: int = 96) -> Box:
+    """
+    Grow a box by ``margin`` of its size on every side, clipped to the frame.
+
+    Args:
+        box: (x1, y1, x2, y2) box
+        frame_shape: Shape of the frame the box belongs to
+        margin: Fraction of the box size added on each side
+        min_size: Minimum side length of the result
+
+    Returns:
+        Expanded box
+    """
+    height, width = frame_shape[:2]
+    x1, y1, x2, y2 = box
+    pad_x = max((x2 - x1) * margin, (min_size - (x2 - x1)) / 2, 0)
+    pad_y = max((y2 - y1) * margin, (min_size - (y2 - y1)) / 2, 0)
+    return (max(0, int(x1 - pad_x)), max(0, int(y1 - pad_y)),
+            min(width, int(x2 + pad_x)), min(height, int(y2 + pad_y)))
+
+
+class RoiCascade:
+    """
+    Chooses the crop the heavy intake models run on.
+
+    A frame is *active* while a pill has been seen within ``event_margin``
+    frames. The pill disappearing into the mouth starts the event, and the
+    swallow that confirms it comes seconds later (drinking, tilting the
+    head back), so the margin must span several seconds of video. The crop is the union
+    of the latest pill boxes and the face, expanded so hands reaching
+    between them are included. Inactive frames get no crop and the heavy
+    models are skipped.
+    """
+
+    def __init__(self, event_margin: int = 180, margin: float = 0.5, min_size: int = 96,
+                 face_detector: Optional[FaceDetector] = None):
+        """
+        Initialize the cascade.
+
+        Args:
+            event_margin: Frames after the last pill sighting that stay active
+                (180 is 6 s at 30 fps)
+            margin: Fraction of the region size added around it
+            min_size: Minimum crop side length
+            face_detector: Face detector (a Haar-cascade FaceDetector by default)
+        """
+        self.event_margin = event_margin
+        self.margin = margin
+        self.min_size = min_size
+        self.face_detector = face_detector or FaceDetector()
+        self._pill_boxes: List[Box] = []
+        self._last_pill_frame: Optional[int] = None
+
+    def observe(self, detections: List, frame_id: int):
+        """Record one frame's pill detections."""
+        if detections:
+            self._pill_boxes = [(d.x1, d.y1, d.x2, d.y2) for d in detections]
+            self._last_pill_frame = frame_id
+
+    def is_active(self, frame_id: int) -> bool:
+        """Whether frame_id is near a candidate intake event."""
+        return (self._last_pill_frame is not None
+                and 0 <= frame_id - self._last_pill_frame <= self.event_margin)
+
+    def region(self, frame: np.ndarray, frame_id: int) -> Optional[Box]:
+        """
+        Crop box for the heavy models on this frame.
+
+        Args:
+            frame: BGR frame
+            frame_id: Frame index
+
+        Returns:
+            (x1, y1, x2, y2) crop, or None if the frame should be skipped
+        """
+        if not self.is_active(frame_id):
+            return None
+
+        boxes = list(self._pill_boxes)
+        face = self.face_detector.detect(frame, frame_id)
+        if face is not None:
+            boxes.append(face)
+        return expand_box(union_box(boxes), frame.shape, self.margin, self.min_size)
+
+
+def crop(frame: np.ndarray, box: Box) -> np.ndarray:
+    """View of the frame inside box."""
+    x1, y1, x2, y2 = box
+    return frame[y1:y2, x1:x2]
+
+
+def offset_poses(poses: List, x_offset: int, y_offset: int) -> List:
+    """Shift hand keypoints estimated on a crop back to frame coordinates."""
+    for pose in poses:
+        for keypoint in getattr(pose, 'keypoints', None) or []:
+            keypoint.x += x_offset
+            keypoint.y += y_offset
+    return poses
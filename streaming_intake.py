@@ -0,0 +1,235 @@
+"""
+Streaming intake verification.
+Runs the IntakeVerifier's detector, hand pose estimator and action
+recognizer over a VideoFrameStream, with each model pulling only the frames
+it needs, then fuses the results with the verifier's VerificationEngine.
+"""
+
+import logging
+import math
+from collections import deque
+from typing import Dict, List, Optional
+
+import cv2
+import numpy as np
+
+import config
+from video_stream import VideoFrameStream
+from batched_detection import BatchedPillDetector
+from pill_association import VectorizedPillTracker
+from roi_cascade import RoiCascade, crop, offset_poses
+
+logger = logging.getLogger(__name__)
+
+
+class _IntakeEvidence:
+    """Per-video accumulators, updated one chunk of frames at a time."""
+
+    def __init__(self, clip_length: int, roi: Optional[RoiCascade] = None):
+        self.roi = roi
+        self.tracker = VectorizedPillTracker(iou_threshold=0.3, max_gap=5)
+        self.pill_confidences: List[float] = []
+        self.last_pill_frame = None
+        self.hand_confidences: List[float] = []
+        self.mouth_contact_frames: List[int] = []
+        self.pose_frames = 0
+        self.swallow_frames: List = []
+        self.action_confidences: List[float] = []
+        self.window = deque(maxlen=clip_length)
+        self.window_step = max(1, clip_length // 2)
+        self.samples_since_window = 0
+        self.skipped_frames = 0
+
+    def summarize(self) -> Dict:
+        """Per-modality summaries in the form VerificationEngine.verify_intake expects."""
+        trajectories = self.tracker.finish()
+        best = max(trajectories, key=lambda t: t.total_frames, default=None)
+        return {
+            'pill_trajectory': {
+                'detected': best is not None,
+                'avg_confidence': float(np.mean(self.pill_confidences)) if self.pill_confidences else 0.0,
+                'movement_distance': best.movement_distance if best else 0.0,
+                'disappearance_frame': self.last_pill_frame,
+                'num_frames': best.total_frames if best else 0
+            },
+            'hand_trajectory': {
+                'detected': bool(self.hand_confidences),
+                'avg_confidence': float(np.mean(self.hand_confidences)) if self.hand_confidences else 0.0,
+                'mouth_contact_frames': self.mouth_contact_frames,
+                'total_frames': self.pose_frames
+            },
+            'action_sequence': {
+                'detected': bool(self.swallow_frames),
+                'avg_confidence': float(np.mean(self.action_confidences)) if self.action_confidences else 0.0,
+                'swallow_frames': self.swallow_frames
+            }
+        }
+
+
+class StreamingIntakeVerifier:
+    """
+    Drop-in ``verify_video`` for IntakeVerifier that never stacks the clip.
+
+    Pill detection runs every ``detection_stride`` frames, batched
+    ``batch_size`` frames at a time; hand pose runs every ``pose_stride``
+    frames, and the 3D CNN sees sliding windows of ``clip_length`` frames
+    sampled every ``action_stride`` frames. Only the current batch and
+    action window are held in memory. Other attributes are delegated to the
+    wrapped verifier.
+
+    With ``roi_cascade`` enabled (off by default), pill detections gate the
+    heavy models: hand pose and the 3D CNN run only on frames within
+    ``event_seconds`` of a pill sighting, on a crop around the pills and
+    face (see RoiCascade).
+    """
+
+    def __init__(self, intake_verifier, detection_stride: Optional[int] = None,
+                 pose_stride: Optional[int] = None, action_stride: Optional[int] = None,
+                 clip_length: Optional[int] = None, clip_size: Optional[int] = None,
+                 batch_size: Optional[int] = None, roi_cascade: Optional[bool] = None):
+        """
+        Initialize the streaming verifier.
+
+        Args:
+            intake_verifier: Loaded IntakeVerifier (provides the models)
+            detection_stride: Frames between pill detections
+            pose_stride: Frames between hand pose estimates
+            action_stride: Frames between samples in an action window
+            clip_length: Sampled frames per 3D CNN window
+            clip_size: Side length frames are resized to for the 3D CNN
+            batch_size: Frames per batched pill-detection call
+            roi_cascade: Run hand pose / action models only on pill and face crops
+        """
+        self.intake_verifier = intake_verifier
+        streaming_config = getattr(intake_verifier, 'config', {}).get('streaming', {})
+        self.detection_stride = detection_stride or streaming_config.get('detection_stride', 1)
+        self.pose_stride = pose_stride or streaming_config.get('pose_stride', 2)
+        self.action_stride = action_stride or streaming_config.get('action_stride', 4)
+        self.clip_length = clip_length or streaming_config.get('clip_length', 16)
+        self.clip_size = clip_size or streaming_config.get('clip_size', config.INTAKE_CLIP_SIZE)
+        self.batch_size = batch_size or streaming_config.get('batch_size', 8)
+        self.pill_detector = BatchedPillDetector(intake_verifier.pill_detector, self.batch_size)
+        self.roi_cascade = (
+            streaming_config.get('roi_cascade', config.INTAKE_ROI_CASCADE)
+            if roi_cascade is None else roi_cascade
+        )
+        self.event_seconds = streaming_config.get('event_seconds', config.INTAKE_ROI_EVENT_SECONDS)
+
+    def _classify_window(self, evidence: _IntakeEvidence):
+        window = evidence.window
+        clip = np.stack([frame for _, frame in window])
+        classifications = self.intake_verifier.action_recognizer.predict_3dcnn(clip, frame_stride=1)
+        evidence.action_confidences.extend(c.confidence for c in classifications)
+        if any(c.is_positive for c in classifications):
+            evidence.swallow_frames.append((window[0][0], window[-1][0]))
+
+    def _flush_window(self, evidence: _IntakeEvidence):
+        """Classify samples not yet covered by a window, then start a new one."""
+        if evidence.window and evidence.samples_since_window > 0:
+            # Tail of a segment (or one shorter than a window): pad with the last frame
+            while len(evidence.window) < self.clip_length:
+                evidence.window.append(evidence.window[-1])
+            self._classify_window(evidence)
+        evidence.window.clear()
+        evidence.samples_since_window = 0
+
+    def _process_chunk(self, chunk: List, evidence: _IntakeEvidence):
+        """Run the models over a chunk of (step, frame_id, frame) samples."""
+        detection_frames = [(frame_id, frame) for step, frame_id, frame in chunk
+                            if step % self.detection_stride == 0]
+        detections_by_frame = {}
+        if detection_frames:
+            frame_ids = [frame_id for frame_id, _ in detection_frames]
+            batch = self.pill_detector.detect_batch([frame for _, frame in detection_frames], frame_ids)
+            detections_by_frame = dict(zip(frame_ids, batch))
+
+        for step, frame_id, frame in chunk:
+            if frame_id in detections_by_frame:
+                detections = detections_by_frame[frame_id]
+                evidence.tracker.update(detections, frame_id=frame_id)
+                if detections:
+                    evidence.pill_confidences.extend(d.confidence for d in detections)
+                    evidence.last_pill_frame = frame_id
+
+                if evidence.roi is not None:
+                    evidence.roi.observe(detections, frame_id)
+
+            pose_due = step % self.pose_stride == 0
+            action_due = step % self.action_stride == 0
+            if not (pose_due or action_due):
+                continue
+
+            region = None
+            if evidence.roi is not None:
+                region = evidence.roi.region(frame, frame_id)
+                if region is None:
+                    # No pill nearby: skip the heavy models and close any open window
+                    evidence.skipped_frames += 1
+                    self._flush_window(evidence)
+                    continue
+                frame = crop(frame, region)
+
+            if pose_due:
+                poses = self.intake_verifier.hand_estimator.estimate(frame, frame_id=frame_id)
+                if region is not None:
+                    offset_poses(poses, region[0], region[1])
+                evidence.pose_frames += 1
+                evidence.hand_confidences.extend(p.avg_confidence for p in poses)
+                if any(p.is_near_mouth for p in poses):
+                    evidence.mouth_contact_frames.append(frame_id)
+
+            if action_due:
+                evidence.window.append((frame_id, cv2.resize(frame, (self.clip_size, self.clip_size))))
+                evidence.samples_since_window += 1
+                # Half-overlapping windows once the first one is full
+                if (len(evidence.window) == self.clip_length
+                        and evidence.samples_since_window >= evidence.window_step):
+                    self._classify_window(evidence)
+                    evidence.samples_since_window = 0
+
+    def verify_video(self, video_path: str, target_fps: Optional[float] = None):
+        """
+        Verify medication intake from a video file, decoding it as a stream.
+
+        Args:
+            video_path: Path to the intake video
+            target_fps: Resample the video to roughly this rate first
+                (model strides then count resampled frames)
+
+        Returns:
+            VerificationEngine result for the video
+        """
+        # Decode only frames at least one model needs
+        base_stride = math.gcd(math.gcd(self.detection_stride, self.pose_stride), self.action_stride)
+
+        with VideoFrameStream(video_path, stride=base_stride, target_fps=target_fps) as stream:
+            metadata = stream.metadata()
+            roi = None
+            if self.roi_cascade:
+                # Frame ids are source-video frames, so the margin follows the source rate
+                roi = RoiCascade(event_margin=int(math.ceil(self.event_seconds * stream.fps)))
+            evidence = _IntakeEvidence(self.clip_length, roi)
+
+            chunk = []
+            for index, (frame_id, frame) in enumerate(stream):
+                chunk.append((index * base_stride, frame_id, frame))
+                if len(chunk) == self.batch_size:
+                    self._process_chunk(chunk, evidence)
+                    chunk = []
+            if chunk:
+                self._process_chunk(chunk, evidence)
+
+        self._flush_window(evidence)
+
+        summary = evidence.summarize()
+        logger.info(f"Streamed {metadata['frame_count']} frames from {video_path}: "
+                    f"{len(summary['hand_trajectory']['mouth_contact_frames'])} mouth contacts, "
+                    f"{len(summary['action_sequence']['swallow_frames'])} swallow windows, "
+                    f"{evidence.skipped_frames} frames skipped by the ROI cascade")
+
+        return self.intake_verifier.verification_engine.verify_intake(
+            video_metadata=metadata, **summary
+        )
+
+    def __getattr__(self, name: str):
+        return getattr(self.intake_verifier, name)
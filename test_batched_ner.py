@@ -0,0 +1,164 @@
+"""
+Batched NER - Test Suite
+Checks micro-batching and length-bucketed NER dispatch without loading models.
+"""
+
+import os
+import threading
+import unittest
+import logging
+from types import SimpleNamespace
+
+import torch
+import torch.nn as nn
+
+from micro_batching import MicroBatcher
+from batched_ner import BatchedNERExtractor
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class FakeExtractor:
+    """Stand-in NER extractor that records each batch it receives"""
+
+    def __init__(self):
+        self.batches = []
+
+    def extract_entities_batch(self, texts):
+        self.batches.append(list(texts))
+        return [[text.upper()] for text in texts]
+
+
+class CharTokenizer:
+    """Stand-in Hugging Face tokenizer: one token per character, right padding"""
+
+    pad_token_id = 0
+
+    def __call__(self, texts, padding=False, truncation=False, return_tensors=None):
+        texts = [texts] if isinstance(texts, str) else texts
+        length = max(len(text) for text in texts)
+        ids = [[ord(c) % 90 + 1 for c in text] + [0] * (length - len(text)) for text in texts]
+        input_ids = torch.tensor(ids)
+        return {'input_ids': input_ids, 'attention_mask': (input_ids != 0).long()}
+
+
+class TinyTokenClassifier(nn.Module):
+    """Stand-in token classifier whose padded positions can't leak into real ones"""
+
+    config = SimpleNamespace(id2label={0: 'O', 1: 'B-DRUG'})
+
+    def __init__(self):
+        super().__init__()
+        torch.manual_seed(0)
+        self.embedding = nn.Embedding(91, 8)
+        self.classifier = nn.Linear(8, 2)
+        self.calls = []
+
+    def forward(self, input_ids, attention_mask=None):
+        self.calls.append(tuple(input_ids.shape))
+        return (self.classifier(self.embedding(input_ids)),)
+
+
+class TransformerExtractor:
+    """Stand-in NERExtractor that tokenizes and runs its model one text at a time"""
+
+    def __init__(self):
+        self.tokenizer = CharTokenizer()
+        self.model = TinyTokenClassifier()
+
+    def extract_entities(self, text):
+        logits = self.model(**self.tokenizer(text, return_tensors='pt'))[0]
+        labels = logits.argmax(-1)[0].tolist()
+        return [(char, self.model.config.id2label[label]) for char, label in zip(text, labels)]
+
+
+class TestMicroBatcher(unittest.TestCase):
+    """Test request coalescing"""
+
+    def test_concurrent_requests_share_batches(self):
+        """Test concurrent callers are grouped and get their own results"""
+        batcher = MicroBatcher(lambda items: [i * 2 for i in items],
+                               max_batch_size=4, max_wait_ms=100)
+        results = {}
+        threads = [
+            threading.Thread(target=lambda i=i: results.__setitem__(i, batcher.process(i)))
+            for i in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        batcher.shutdown()
+
+        self.assertEqual(results, {i: i * 2 for i in range(8)})
+        self.assertLess(batcher.get_statistics()['batches'], 8)
+        logger.info("✓ Micro-batching working")
+
+    def test_errors_reach_callers(self):
+        """Test a failing batch raises in every caller"""
+        batcher = MicroBatcher(lambda items: 1 / 0)
+        with self.assertRaises(ZeroDivisionError):
+            batcher.process('x')
+        batcher.shutdown()
+
+    @unittest.skipUnless(hasattr(os, 'fork'), "fork not available")
+    def test_forked_child_starts_own_worker(self):
+        """Test a batcher created (and used) before a fork still works in the child"""
+        batcher = MicroBatcher(lambda items: [i + 1 for i in items], max_wait_ms=1)
+        self.assertEqual(batcher.process(1, timeout=2), 2)
+
+        pid = os.fork()
+        if pid == 0:
+            try:
+                ok = batcher.process(41, timeout=2) == 42
+            except Exception:
+                ok = False
+            os._exit(0 if ok else 1)
+        _, status = os.waitpid(pid, 0)
+        batcher.shutdown()
+
+        self.assertEqual(os.waitstatus_to_exitcode(status), 0)
+        logger.info("✓ Micro-batching after fork working")
+
+
+class TestBatchedNERExtractor(unittest.TestCase):
+    """Test length bucketing"""
+
+    def test_buckets_by_length_and_keeps_order(self):
+        """Test similar-length texts are batched together"""
+        extractor = FakeExtractor()
+        batched = BatchedNERExtractor(extractor, batch_size=2, micro_batching=False)
+        texts = ['aaaa', 'b', 'ccc', 'dd']
+
+        self.assertEqual(batched.extract_entities_batch(texts),
+                         [['AAAA'], ['B'], ['CCC'], ['DD']])
+        self.assertEqual(extractor.batches, [['b', 'dd'], ['ccc', 'aaaa']])
+        logger.info("✓ Length-bucketed NER working")
+
+    def test_micro_batching_off_by_default(self):
+        """Test single-text calls run directly unless micro-batching is requested"""
+        extractor = FakeExtractor()
+        batched = BatchedNERExtractor(extractor)
+        self.assertEqual(batched.extract_entities('abc'), ['ABC'])
+        self.assertEqual(batched.get_statistics(), {})
+        self.assertFalse(batched.thread_safe)
+
+    def test_transformer_bucket_single_forward(self):
+        """Test a bucket is padded into one forward pass and decoded like unbatched calls"""
+        texts = ['amoxicillin', 'ibuprofen 200', 'x', 'metformin']
+        expected = [TransformerExtractor().extract_entities(text) for text in texts]
+
+        extractor = TransformerExtractor()
+        batched = BatchedNERExtractor(extractor, batch_size=4)
+        self.assertEqual(batched.extract_entities_batch(texts), expected)
+        self.assertEqual(extractor.model.calls, [(4, 13)])
+
+        # Outside a batch the model runs as usual
+        self.assertEqual(batched.extract_entities('abc'), extractor.extract_entities('abc'))
+        self.assertEqual(len(extractor.model.calls), 3)
+        logger.info("✓ Padded NER batches working")
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
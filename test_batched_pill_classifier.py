@@ -0,0 +1,165 @@
+"""
+Batched Pill Classifier - Test Suite
+Checks stacked forward passes and per-caller routing without loading EfficientNet.
+"""
+
+import threading
+import unittest
+import logging
+
+import numpy as np
+import torch
+import torch.nn as nn
+from PIL import Image
+
+from batched_pill_classifier import BatchedPillClassifier, summarize_heads
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class FakeClassifier:
+    """Stand-in PillClassifier whose heads read the image's mean intensity"""
+
+    device = 'cpu'
+    input_size = 32
+
+    def __init__(self):
+        self.batch_sizes = []
+
+    def predict(self, batch, return_probabilities=False):
+        self.batch_sizes.append(batch.shape[0])
+        # Brighter images score higher on class 1 of every head
+        brightness = batch.mean(dim=(1, 2, 3))
+        logits = torch.stack([-brightness, brightness], dim=1)
+        probs = torch.softmax(logits * 10, dim=1)
+        return {f'{head}_{key}': value for head in ('shape', 'color', 'imprint')
+                for key, value in (('probs', probs), ('pred', probs.argmax(dim=1)))}
+
+
+class TinyPillClassifier(nn.Module):
+    """Stand-in PillClassifier with BatchNorm, its own transform and the real output format"""
+
+    device = 'cpu'
+    heads = {'shape': 4, 'color': 6, 'imprint': 8}
+
+    def __init__(self):
+        super().__init__()
+        torch.manual_seed(0)
+        self.backbone = nn.Sequential(nn.Conv2d(3, 8, 3), nn.BatchNorm2d(8), nn.ReLU(),
+                                      nn.AdaptiveAvgPool2d(1), nn.Flatten())
+        self.classifiers = nn.ModuleDict({head: nn.Linear(8, n) for head, n in self.heads.items()})
+        self.eval()
+
+    def transform(self, image):
+        # Deliberately different from the ImageNet fallback
+        array = np.asarray(image.resize((20, 20)), dtype=np.float32) / 127.5 - 1.0
+        return torch.from_numpy(array.transpose(2, 0, 1).copy())
+
+    def predict(self, x, return_probabilities=False):
+        with torch.no_grad():
+            features = self.backbone(x)
+        outputs = {}
+        for head, layer in self.classifiers.items():
+            probs = torch.softmax(layer(features), dim=1)
+            outputs[f'{head}_pred'] = probs.argmax(dim=1)
+            if return_probabilities:
+                outputs[f'{head}_probs'] = probs
+        return outputs
+
+
+class TestBatchedPillClassifier(unittest.TestCase):
+    """Test micro-batched pill classification"""
+
+    def setUp(self):
+        self.classifier = FakeClassifier()
+        self.batched = BatchedPillClassifier(self.classifier, batch_size=8, max_wait_ms=100)
+
+    def tearDown(self):
+        self.batched.shutdown()
+
+    def test_preprocess(self):
+        """Test images are resized and normalized to (3, H, W)"""
+        tensor = self.batched.preprocess(Image.new('RGB', (64, 48), color='white'))
+        self.assertEqual(tuple(tensor.shape), (3, 32, 32))
+        self.assertGreater(float(tensor.min()), 1.0)
+
+    def test_concurrent_requests_share_forward_pass(self):
+        """Test concurrent callers are stacked and each gets its own result"""
+        images = {i: Image.fromarray(np.full((40, 40, 3), 255 if i % 2 else 0, dtype=np.uint8))
+                  for i in range(8)}
+        results = {}
+        threads = [
+            threading.Thread(target=lambda i=i: results.__setitem__(i, self.batched.predict(images[i])))
+            for i in images
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertLess(len(self.classifier.batch_sizes), 8)
+        for i, result in results.items():
+            self.assertEqual(tuple(result['shape_probs'].shape), (1, 2))
+            heads = summarize_heads(result)
+            self.assertEqual(set(heads), {'shape', 'color', 'imprint'})
+            self.assertEqual(heads['shape']['class_id'], i % 2)
+            self.assertGreater(heads['color']['confidence'], 0.5)
+        logger.info("✓ Batched pill classification working")
+
+    def test_batched_tensor_passthrough(self):
+        """Test 4D tensors go straight to the classifier"""
+        predictions = self.batched.predict(torch.zeros(3, 3, 32, 32), return_probabilities=True)
+        self.assertEqual(tuple(predictions['shape_probs'].shape), (3, 2))
+        self.assertEqual(self.classifier.batch_sizes, [3])
+
+    def test_mixed_sizes_batched_per_size(self):
+        """Test tensors of different sizes in one batch are stacked per size"""
+        images = [torch.zeros(3, 32, 32), torch.ones(3, 16, 16), torch.ones(3, 32, 32)]
+        results = self.batched.predict_batch(images)
+
+        self.assertEqual(sorted(self.classifier.batch_sizes), [1, 2])
+        self.assertEqual([int(r['shape_pred']) for r in results], [0, 1, 1])
+
+    def test_other_options_bypass_batching(self):
+        """Test caller kwargs reach the classifier instead of being dropped"""
+        calls = []
+        self.classifier.predict = lambda batch, **kwargs: calls.append(kwargs) or {}
+        self.batched.predict(torch.zeros(3, 32, 32), return_probabilities=False)
+        self.assertEqual(calls, [{'return_probabilities': False}])
+
+
+class TestPillClassifierParity(unittest.TestCase):
+    """Test batched results match PillClassifier.predict one image at a time"""
+
+    def test_matches_unbatched_predict(self):
+        """Test the classifier's transform and output format are used unchanged"""
+        classifier = TinyPillClassifier()
+        batched = BatchedPillClassifier(classifier, batch_size=8, max_wait_ms=100)
+        rng = np.random.default_rng(0)
+        images = [Image.fromarray(rng.integers(0, 255, (30 + i, 40, 3), dtype=np.uint8))
+                  for i in range(6)]
+
+        results = [None] * len(images)
+        threads = [
+            threading.Thread(target=lambda i=i: results.__setitem__(i, batched.predict(images[i])))
+            for i in range(len(images))
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        batched.shutdown()
+
+        for image, result in zip(images, results):
+            expected = classifier.predict(classifier.transform(image).unsqueeze(0),
+                                          return_probabilities=True)
+            self.assertEqual(set(result), set(expected))
+            for key, value in expected.items():
+                self.assertEqual(result[key].shape, value.shape)
+                self.assertTrue(torch.allclose(result[key].float(), value.float(), atol=1e-5), key)
+        logger.info("✓ Batched pill classifier parity working")
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,102 @@
+"""
+Concurrent Workflow - Test Suite
+Checks prefetched component calls with stub components instead of models.
+"""
+
+import threading
+import unittest
+import logging
+
+from concurrent_workflow import ConcurrentVerificationRunner
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class StubComponent:
+    """Component whose method records its calls and optionally waits on a barrier"""
+
+    def __init__(self, method, label, barrier=None, error=None):
+        self.label = label
+        self.barrier = barrier
+        self.error = error
+        self.calls = []
+        setattr(self, method, self._call)
+
+    def _call(self, path):
+        self.calls.append(path)
+        if self.barrier is not None:
+            # Only passes if the other components are running at the same time
+            self.barrier.wait()
+        if self.error is not None:
+            raise self.error
+        return f"{self.label}:{path}"
+
+
+class StubWorkflow:
+    """MedicationVerificationWorkflow stand-in that calls its components one after another"""
+
+    def __init__(self, barrier=None, pill_error=None):
+        self.prescription_digitizer = StubComponent('process_prescription', 'rx', barrier)
+        self.pill_classifier = StubComponent('predict', 'pill', barrier, pill_error)
+        self.intake_verifier = StubComponent('verify_video', 'intake', barrier)
+
+    def process_medication_verification(self, patient_id, prescription_image_path,
+                                        pill_image_path=None, intake_video_path=None):
+        result = {
+            'patient_id': patient_id,
+            'prescription': self.prescription_digitizer.process_prescription(prescription_image_path)
+        }
+        if pill_image_path:
+            result['pill'] = self.pill_classifier.predict(pill_image_path)
+        if intake_video_path:
+            result['intake'] = self.intake_verifier.verify_video(intake_video_path)
+        return result
+
+
+class TestConcurrentVerificationRunner(unittest.TestCase):
+    """Test the concurrent runner against the sequential workflow"""
+
+    def _run(self, workflow, **paths):
+        runner = ConcurrentVerificationRunner(workflow, max_workers=3)
+        try:
+            return runner.process_medication_verification(patient_id='p1', **paths)
+        finally:
+            runner.shutdown()
+
+    def test_components_run_concurrently(self):
+        """Test the three component calls overlap (a barrier no sequential run can pass)"""
+        workflow = StubWorkflow(barrier=threading.Barrier(3, timeout=5))
+        result = self._run(workflow, prescription_image_path='rx.jpg',
+                           pill_image_path='pill.jpg', intake_video_path='intake.mp4')
+
+        self.assertEqual(result['intake'], 'intake:intake.mp4')
+        logger.info("✓ Concurrent component execution working")
+
+    def test_matches_sequential_workflow(self):
+        """Test results equal the plain workflow's and each component runs once"""
+        paths = {'prescription_image_path': 'rx.jpg', 'pill_image_path': 'pill.jpg'}
+        expected = StubWorkflow().process_medication_verification('p1', **paths)
+
+        workflow = StubWorkflow()
+        self.assertEqual(self._run(workflow, **paths), expected)
+        self.assertEqual(workflow.prescription_digitizer.calls, ['rx.jpg'])
+        self.assertEqual(workflow.pill_classifier.calls, ['pill.jpg'])
+        self.assertEqual(workflow.intake_verifier.calls, [])
+
+    def test_component_exception_propagates(self):
+        """Test an exception in a prefetched stage reaches the caller"""
+        workflow = StubWorkflow(pill_error=ValueError("pill model failed"))
+        with self.assertRaisesRegex(ValueError, "pill model failed"):
+            self._run(workflow, prescription_image_path='rx.jpg', pill_image_path='pill.jpg')
+        self.assertEqual(workflow.pill_classifier.calls, ['pill.jpg'])
+
+    def test_workflow_left_unwrapped(self):
+        """Test the shared workflow keeps its own components"""
+        workflow = StubWorkflow()
+        self._run(workflow, prescription_image_path='rx.jpg')
+        self.assertIsInstance(workflow.prescription_digitizer, StubComponent)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,89 @@
+"""
+Conversion Manifest - Test Suite
+Checks cache keys, up-to-date detection and digest reuse for incremental conversion.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+import logging
+from unittest import mock
+
+from conversion_manifest import ConversionManifest
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class TestConversionManifest(unittest.TestCase):
+    """Test incremental conversion bookkeeping"""
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.source = os.path.join(self.tmp, 'model.pt')
+        self.output = os.path.join(self.tmp, 'model.tflite')
+        self.manifest_path = os.path.join(self.tmp, 'manifest.json')
+        for path, data in ((self.source, b'weights-v1'), (self.output, b'tflite')):
+            with open(path, 'wb') as f:
+                f.write(data)
+        self.settings = {'quantization': 'dynamic', 'input_size': (224, 224)}
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def _record(self, manifest, status='converted'):
+        digest = manifest.source_digest('job', self.source)
+        key = manifest.job_key(digest, self.settings)
+        manifest.record('job', key, self.source, digest, self.settings, [self.output], status,
+                        {'valid': True}, 1.5)
+        manifest.save()
+        return key
+
+    def test_up_to_date_after_reload(self):
+        """Test a converted job is skipped by a fresh manifest instance"""
+        key = self._record(ConversionManifest(self.manifest_path))
+
+        manifest = ConversionManifest(self.manifest_path)
+        self.assertTrue(manifest.is_up_to_date('job', key))
+        self.assertEqual(manifest.entries['job']['outputs'][0]['path'], self.output)
+        logger.info("✓ Incremental conversion skip working")
+
+    def test_changes_invalidate(self):
+        """Test new weights, new settings, failures and missing outputs all reconvert"""
+        manifest = ConversionManifest(self.manifest_path)
+        key = self._record(manifest)
+
+        self.assertNotEqual(manifest.job_key(manifest.source_digest('job', self.source),
+                                             {**self.settings, 'quantization': 'integer'}), key)
+
+        with open(self.source, 'wb') as f:
+            f.write(b'weights-v2')
+        self.assertNotEqual(manifest.job_key(manifest.source_digest('job', self.source),
+                                             self.settings), key)
+
+        failed_key = self._record(manifest, status='failed')
+        self.assertFalse(manifest.is_up_to_date('job', failed_key))
+
+        converted_key = self._record(manifest)
+        os.remove(self.output)
+        self.assertFalse(manifest.is_up_to_date('job', converted_key))
+
+    def test_unchanged_source_is_not_rehashed(self):
+        """Test the stored digest is reused while size and mtime match"""
+        manifest = ConversionManifest(self.manifest_path)
+        self._record(manifest)
+
+        with mock.patch('conversion_manifest.hash_file') as hash_file:
+            manifest.source_digest('job', self.source)
+            hash_file.assert_not_called()
+
+    def test_corrupt_manifest_starts_empty(self):
+        """Test an unreadable manifest reconverts everything instead of crashing"""
+        with open(self.manifest_path, 'w') as f:
+            f.write('{not json')
+        self.assertEqual(ConversionManifest(self.manifest_path).entries, {})
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,181 @@
+"""
+Local Drug Index - Test Suite
+Builds a small RxNorm extract and validates offline lookups.
+"""
+
+import os
+import random
+import shutil
+import tempfile
+import unittest
+import logging
+
+from drug_index import DrugIndex, LocalDrugValidator, normalize_drug_name
+from fuzzy_matcher import TrigramMatcher, similarity
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+SAMPLE_RXNCONSO = """\
+723|ENG||||||1||||RXNORM|IN|723|amoxicillin||N||
+723|ENG||||||2||||RXNORM|SY|723|amoxycillin||N||
+308191|ENG||||||3||||RXNORM|SCD|308191|amoxicillin 500 MG Oral Capsule||N||
+308192|ENG||||||4||||RXNORM|SCD|308192|amoxicillin 250 MG Oral Capsule||N||
+6809|ENG||||||5||||RXNORM|IN|6809|metformin||N||
+861007|ENG||||||6||||RXNORM|SCD|861007|24 HR metformin hydrochloride 500 MG Extended Release Oral Tablet||N||
+202|ENG||||||8||||RXNORM|BN|202|Amoxil||N||
+308189|ENG||||||9||||RXNORM|SBD|308189|amoxicillin 875 MG Oral Tablet [Amoxil]||N||
+999|ENG||||||7||||MTHSPL|SY|999|not from rxnorm||N||
+"""
+
+
+class TestDrugIndex(unittest.TestCase):
+    """Test building and querying the local drug index"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        with open(os.path.join(self.tmp_dir, 'RXNCONSO.RRF'), 'w') as f:
+            f.write(SAMPLE_RXNCONSO)
+        self.index = DrugIndex(os.path.join(self.tmp_dir, 'drug_index.sqlite'))
+        self.counts = self.index.build_from_rxnorm(self.tmp_dir)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def test_build_counts(self):
+        """Test only English RxNorm rows are loaded"""
+        self.assertEqual(self.counts['names'], 8)
+        self.assertTrue(self.index.exists)
+        logger.info("✓ Index built from RXNCONSO.RRF")
+
+    def test_lookup_synonym(self):
+        """Test synonyms resolve to the ingredient concept"""
+        match = self.index.lookup('Amoxycillin')
+        self.assertIsNotNone(match)
+        self.assertEqual(match['rxcui'], '723')
+        self.assertIsNone(self.index.lookup('not from rxnorm'))
+        logger.info("✓ Synonym lookup working")
+
+    def test_strengths(self):
+        """Test strengths are parsed from clinical drug names"""
+        self.assertEqual(self.index.get_strengths('amoxicillin'), ['250 mg', '500 mg', '875 mg'])
+        self.assertEqual(self.index.get_strengths('Amoxil'), ['875 mg'])
+        self.assertEqual(self.index.get_strengths('metformin hydrochloride'), ['500 mg'])
+        logger.info("✓ Strength extraction working")
+
+    def test_normalize(self):
+        """Test name normalization"""
+        self.assertEqual(normalize_drug_name('  Amoxicillin-Clavulanate '), 'amoxicillin clavulanate')
+
+
+class TestLocalDrugValidator(unittest.TestCase):
+    """Test offline prescription validation"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        with open(os.path.join(self.tmp_dir, 'RXNCONSO.RRF'), 'w') as f:
+            f.write(SAMPLE_RXNCONSO)
+        index = DrugIndex(os.path.join(self.tmp_dir, 'drug_index.sqlite'))
+        index.build_from_rxnorm(self.tmp_dir)
+        self.validator = LocalDrugValidator(index)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def test_valid_prescription(self):
+        """Test a known drug and strength validate without a fallback"""
+        result = self.validator.validate_prescription('Amoxicillin', '500mg', 'twice daily')
+        self.assertTrue(result['drug_valid'])
+        self.assertTrue(result['dosage_valid'])
+        logger.info("✓ Offline validation working")
+
+    def test_unknown_strength(self):
+        """Test an unlisted strength is rejected"""
+        result = self.validator.validate_prescription('Amoxicillin', '400 mg', 'twice daily')
+        self.assertTrue(result['drug_valid'])
+        self.assertFalse(result['dosage_valid'])
+
+    def test_unknown_drug_offline(self):
+        """Test unknown drugs are invalid when no fallback is configured"""
+        is_valid, _ = self.validator.validate_drug_name('Notarealdrug')
+        self.assertFalse(is_valid)
+
+    def test_brand_name_strengths(self):
+        """Test brand names validate against their branded drugs' strengths"""
+        result = self.validator.validate_prescription('Amoxil', '875 mg', 'twice daily')
+        self.assertTrue(result['drug_valid'])
+        self.assertTrue(result['dosage_valid'])
+        self.assertEqual(result['known_strengths'], ['875 mg'])
+
+        result = self.validator.validate_prescription('Amoxil', '5000 mg', 'twice daily')
+        self.assertFalse(result['dosage_valid'])
+
+    def test_missing_strength_data_unverified(self):
+        """Test a drug without strength data does not validate any dosage"""
+        result = self.validator.validate_prescription('metformin', '500 mg', 'daily')
+        self.assertTrue(result['drug_valid'])
+        self.assertFalse(result['dosage_valid'])
+        self.assertEqual(result['known_strengths'], [])
+
+    def test_ocr_misspelling(self):
+        """Test OCR-garbled names resolve through the fuzzy matcher"""
+        is_valid, name = self.validator.validate_drug_name('Amoxicilin')
+        self.assertTrue(is_valid)
+        self.assertEqual(name, 'amoxicillin')
+        logger.info("✓ Fuzzy drug matching working")
+
+
+class TestTrigramMatcher(unittest.TestCase):
+    """Test indexed approximate matching"""
+
+    def setUp(self):
+        self.matcher = TrigramMatcher([
+            'amoxicillin', 'ampicillin', 'azithromycin', 'metformin',
+            'metoprolol', 'lisinopril', 'atorvastatin'
+        ])
+
+    def test_top_k_order(self):
+        """Test closest names rank first"""
+        matches = self.matcher.top_k('amoxycillin', k=2)
+        self.assertEqual(matches[0][0], 'amoxicillin')
+        self.assertGreaterEqual(matches[0][1], matches[-1][1])
+
+    def test_threshold(self):
+        """Test unrelated queries return nothing above threshold"""
+        self.assertEqual(self.matcher.top_k('ibuprofen', threshold=0.85), [])
+        self.assertIsNotNone(self.matcher.best_match('metforman', threshold=0.85))
+
+    def test_parity_with_brute_force(self):
+        """Test the length window and trigram filter never drop a qualifying term"""
+        rng = random.Random(7)
+        letters = 'abcdefghilmnoprstuxyz'
+        vocabulary = {''.join(rng.choice(letters) for _ in range(rng.randint(3, 16)))
+                      for _ in range(400)}
+        matcher = TrigramMatcher(vocabulary, shortlist_size=len(vocabulary))
+
+        def mutate(word):
+            chars = list(word)
+            for _ in range(rng.randint(1, 3)):
+                position = rng.randint(0, len(chars))
+                edit = rng.choice(('insert', 'delete', 'substitute'))
+                if edit == 'insert' or not chars:
+                    chars.insert(position, rng.choice(letters))
+                elif edit == 'delete':
+                    del chars[min(position, len(chars) - 1)]
+                else:
+                    chars[min(position, len(chars) - 1)] = rng.choice(letters)
+            return ''.join(chars)
+
+        for word in rng.sample(sorted(vocabulary), 150):
+            query = mutate(word)
+            for threshold in (0.6, 0.75, 0.9):
+                expected = {term for term in vocabulary if similarity(query, term) >= threshold}
+                found = {term for term, _ in matcher.top_k(query, k=len(vocabulary),
+                                                            threshold=threshold)}
+                self.assertEqual(found, expected, f"{query!r} at {threshold}")
+        logger.info("✓ Trigram matcher parity working")
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
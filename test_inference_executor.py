@@ -0,0 +1,60 @@
+"""
+Inference Executor - Test Suite
+Checks load shedding and slot accounting of the bounded inference pool.
+"""
+
+import asyncio
+import threading
+import unittest
+import logging
+
+from inference_executor import InferenceExecutor, QueueFullError
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class TestInferenceExecutor(unittest.TestCase):
+    """Test the bounded inference pool"""
+
+    def setUp(self):
+        self.executor = InferenceExecutor(max_workers=1, max_queue_size=1)
+        self.release = threading.Event()
+
+    def tearDown(self):
+        self.release.set()
+        self.executor.shutdown()
+
+    def test_sheds_load_when_full(self):
+        """Test calls beyond workers plus queue are rejected"""
+        self.executor.submit(self.release.wait)
+        self.executor.submit(self.release.wait)
+        with self.assertRaises(QueueFullError):
+            self.executor.submit(self.release.wait)
+        self.assertEqual(self.executor.get_statistics()['rejected'], 1)
+        logger.info("✓ Inference load shedding working")
+
+    def test_cancelled_awaiter_keeps_slot_until_call_finishes(self):
+        """Test a cancelled request does not free a slot its thread still occupies"""
+        started = threading.Event()
+
+        def blocking_call():
+            started.set()
+            self.release.wait()
+
+        async def scenario():
+            task = asyncio.ensure_future(self.executor.run(blocking_call))
+            await asyncio.get_running_loop().run_in_executor(None, started.wait)
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+            return self.executor.get_statistics()['running']
+
+        self.assertEqual(asyncio.run(scenario()), 1)
+
+        self.release.set()
+        self.executor.shutdown()
+        self.assertEqual(self.executor.get_statistics()['running'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
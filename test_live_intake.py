@@ -0,0 +1,227 @@
+"""
+Live Intake - Test Suite
+Checks live sessions and the WebSocket endpoint with fake models.
+"""
+
+import asyncio
+import json
+import threading
+import unittest
+import logging
+from types import SimpleNamespace
+from unittest import mock
+
+import cv2
+import numpy as np
+
+import config
+import unified_api_server
+from live_intake import LiveIntakeSession
+from streaming_intake import StreamingIntakeVerifier
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def make_frame(frame_id: int, size: int = 32) -> np.ndarray:
+    """Frame whose pixel values encode its frame id"""
+    return np.full((size, size, 3), frame_id, dtype=np.uint8)
+
+
+class FakeDetector:
+    """Pill detector reporting one pill moving 20 px per frame"""
+
+    def __init__(self):
+        self.frame_ids = []
+
+    def detect(self, frame, frame_id=0):
+        self.frame_ids.append(frame_id)
+        return [SimpleNamespace(confidence=0.9, center_x=20.0 * frame_id, center_y=50.0)]
+
+
+class FakeHandEstimator:
+    """Hand pose estimator reporting one hand at the mouth"""
+
+    def __init__(self):
+        self.frame_ids = []
+
+    def estimate(self, frame, frame_id=0):
+        self.frame_ids.append(frame_id)
+        return [SimpleNamespace(is_near_mouth=True, avg_confidence=0.9)]
+
+
+class FakeActionRecognizer:
+    """3D CNN stand-in recording the frame ids of each window"""
+
+    def __init__(self, swallow_confidence=0.95):
+        self.swallow_confidence = swallow_confidence
+        self.clips = []
+
+    def predict_3dcnn(self, clip, frame_stride=1):
+        self.clips.append(clip)
+        return [SimpleNamespace(is_positive=self.swallow_confidence >= 0.5,
+                                confidence=self.swallow_confidence)]
+
+
+def make_intake_verifier(swallow_confidence=0.95, intake_config=None):
+    return SimpleNamespace(
+        pill_detector=FakeDetector(),
+        hand_estimator=FakeHandEstimator(),
+        action_recognizer=FakeActionRecognizer(swallow_confidence),
+        verification_engine=None,
+        config=intake_config or {}
+    )
+
+
+class TestLiveIntakeSession(unittest.TestCase):
+    """Test per-frame model scheduling and event emission"""
+
+    def _run(self, verifier, num_frames, **kwargs):
+        session = LiveIntakeSession(verifier, session_id='session', pose_stride=2,
+                                    action_stride=4, clip_length=4, clip_size=8, **kwargs)
+        events = [(frame_id, session.process_frame(make_frame(frame_id)))
+                  for frame_id in range(num_frames)]
+        return session, [(frame_id, event) for frame_id, event in events if event is not None]
+
+    def test_model_strides(self):
+        """Test detection runs every frame, pose every pose_stride and action every action_stride"""
+        verifier = make_intake_verifier()
+        self._run(verifier, 28)
+
+        self.assertEqual(verifier.pill_detector.frame_ids, list(range(28)))
+        self.assertEqual(verifier.hand_estimator.frame_ids, list(range(0, 28, 2)))
+        logger.info("✓ Live intake model strides working")
+
+    def test_half_overlapping_windows(self):
+        """Test 3D CNN windows advance by half a clip of sampled frames"""
+        verifier = make_intake_verifier()
+        self._run(verifier, 28)
+
+        clips = verifier.action_recognizer.clips
+        self.assertEqual([clip.shape for clip in clips], [(4, 8, 8, 3)] * 2)
+        self.assertEqual([clip[:, 0, 0, 0].tolist() for clip in clips],
+                         [[0, 4, 8, 12], [8, 12, 16, 20]])
+        logger.info("✓ Live intake action windows working")
+
+    def test_event_emitted_once(self):
+        """Test an event is emitted on the first frame with a swallow score, then held off"""
+        session, events = self._run(make_intake_verifier(), 40)
+
+        self.assertEqual([frame_id for frame_id, _ in events], [12])
+        event = events[0][1]
+        self.assertEqual(event.event_id, 'session_12')
+        self.assertEqual(event.status.value, 'confirmed')
+
+        summary = session.summary()
+        self.assertEqual(summary['frames_processed'], 40)
+        self.assertEqual(summary['events_emitted'], 1)
+        logger.info("✓ Live intake event emission working")
+
+    def test_no_event_without_swallow(self):
+        """Test pill and hand evidence alone do not emit an event"""
+        session, events = self._run(make_intake_verifier(swallow_confidence=0.1), 40)
+        self.assertEqual(events, [])
+        self.assertEqual(session.events_emitted, 0)
+
+    def test_clip_size_shared_with_offline(self):
+        """Test live sessions and offline streaming resize clips to the same size"""
+        verifier = make_intake_verifier()
+        live = LiveIntakeSession(verifier, session_id='session')
+        offline = StreamingIntakeVerifier(verifier)
+        self.assertEqual(live.clip_size, config.INTAKE_CLIP_SIZE)
+        self.assertEqual(offline.clip_size, live.clip_size)
+
+        verifier = make_intake_verifier(intake_config={'streaming': {'clip_size': 112}})
+        self.assertEqual(LiveIntakeSession(verifier, session_id='session').clip_size, 112)
+        self.assertEqual(StreamingIntakeVerifier(verifier).clip_size, 112)
+
+
+class EndMarkedQueue(asyncio.Queue):
+    """Pending-frame queue that signals once the end-of-stream marker is queued"""
+
+    ended = None
+
+    async def put(self, item):
+        if item is None:
+            self.ended.set()
+        await super().put(item)
+
+
+@unittest.skipUnless(unified_api_server.LIVE_INTAKE_AVAILABLE, "live intake not available")
+class TestLiveIntakeWebSocket(unittest.TestCase):
+    """Test the live intake WebSocket endpoint"""
+
+    def setUp(self):
+        from fastapi.testclient import TestClient
+        self.client = TestClient(unified_api_server.app)
+        self.workflow = SimpleNamespace(intake_verifier=make_intake_verifier())
+        self.processed = []
+        self.started = threading.Event()
+        self.ended = threading.Event()
+
+    def _process(self, session, data):
+        # Hold the first frame until the client has sent everything, so later
+        # frames pile up behind it
+        if not self.processed:
+            self.started.set()
+            self.ended.wait(timeout=5)
+        self.processed.append(data)
+        return session.process_frame(cv2.imdecode(np.frombuffer(data, np.uint8), cv2.IMREAD_COLOR))
+
+    def _stream(self, frames):
+        EndMarkedQueue.ended = self.ended
+        with mock.patch.object(unified_api_server, 'workflow', self.workflow), \
+                mock.patch.object(unified_api_server, '_process_live_frame', self._process), \
+                mock.patch.object(unified_api_server.asyncio, 'Queue', EndMarkedQueue), \
+                mock.patch.object(config, 'LIVE_INTAKE_MAX_PENDING_FRAMES', 2):
+            with self.client.websocket_connect('/api/v1/live-intake?patient_id=p1&medication_id=m1') as ws:
+                ws.send_bytes(frames[0])
+                self.started.wait(timeout=5)
+                for frame in frames[1:]:
+                    ws.send_bytes(frame)
+                ws.send_text(json.dumps({'type': 'end'}))
+                messages = []
+                while not messages or messages[-1]['type'] != 'summary':
+                    messages.append(ws.receive_json())
+        return messages
+
+    def test_drops_oldest_pending_frames(self):
+        """Test frames queued behind a slow one are dropped oldest first"""
+        frames = [cv2.imencode('.png', make_frame(i))[1].tobytes() for i in range(6)]
+        messages = self._stream(frames)
+
+        # Frame 0 was in flight, frames 1-3 were pushed out by 4 and 5
+        self.assertEqual(self.processed, [frames[0], frames[4], frames[5]])
+        summary = messages[-1]
+        self.assertEqual(summary['frames_processed'], 3)
+        self.assertEqual(summary['frames_dropped'], 3)
+        logger.info("✓ Live intake drop-oldest working")
+
+    def test_end_sends_summary(self):
+        """Test events are pushed during the stream and a summary closes it"""
+        frames = [cv2.imencode('.png', make_frame(i))[1].tobytes() for i in range(2)]
+        with mock.patch.object(LiveIntakeSession, '__init__', _fast_session_init):
+            messages = self._stream(frames)
+
+        self.assertEqual([message['type'] for message in messages], ['event', 'summary'])
+        event = messages[0]
+        self.assertEqual((event['patient_id'], event['medication_id']), ('p1', 'm1'))
+        self.assertTrue(event['confirmed'])
+        self.assertEqual(event['frame_id'], 1)
+        self.assertEqual(messages[1]['frames_processed'], 2)
+        self.assertEqual(messages[1]['events_emitted'], 1)
+        self.assertEqual(messages[1]['frames_dropped'], 0)
+        logger.info("✓ Live intake summary working")
+
+
+_session_init = LiveIntakeSession.__init__
+
+
+def _fast_session_init(self, intake_verifier, session_id, **kwargs):
+    # Sample every frame into two-frame windows so two frames are enough for an event
+    _session_init(self, intake_verifier, session_id, pose_stride=1, action_stride=1,
+                  clip_length=2, clip_size=8)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,187 @@
+"""
+Model Benchmark - Test Suite
+Checks latency statistics, drift comparison and a single-model benchmark run.
+"""
+
+import importlib.util
+import os
+import shutil
+import tempfile
+import unittest
+import logging
+from unittest import mock
+
+import numpy as np
+import torch
+import torch.nn as nn
+
+from model_benchmark import (
+    artifact_input_shape, benchmark_model, measure_latency, output_drift, quantize_input,
+    summarize_latencies
+)
+
+ORT_AVAILABLE = importlib.util.find_spec('onnxruntime') is not None
+TF_AVAILABLE = importlib.util.find_spec('tensorflow') is not None
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class TestLatencyStatistics(unittest.TestCase):
+    """Test latency summaries"""
+
+    def test_percentiles(self):
+        """Test p50/p95/p99 come from the whole distribution, not the mean"""
+        stats = summarize_latencies(list(range(1, 101)))
+        self.assertAlmostEqual(stats['p50_ms'], 50.5)
+        self.assertAlmostEqual(stats['p99_ms'], 99.01)
+        self.assertEqual(stats['max_ms'], 100)
+
+    def test_throughput_counts_batch_items(self):
+        """Test throughput is reported in items, not calls"""
+        stats = measure_latency(lambda: None, iterations=20, warmup=0, batch_size=8)
+        self.assertEqual(stats['iterations'], 20)
+        self.assertGreater(stats['throughput_per_s'], 8)
+
+
+class TestOutputDrift(unittest.TestCase):
+    """Test drift against the reference outputs"""
+
+    def test_pairs_outputs_by_shape(self):
+        """Test reordered heads are matched by shape and agreement is measured"""
+        shape_logits = np.array([[2.0, 1.0], [0.0, 1.0]])
+        color_logits = np.array([[1.0, 0.0, 0.0], [0.0, 0.0, 1.0]])
+        candidate = [color_logits + 0.1, np.array([[2.0, 1.0], [1.0, 0.0]])]
+
+        drift = output_drift([shape_logits, color_logits], candidate)
+        self.assertEqual(drift['output_0']['top1_agreement'], 0.5)
+        self.assertEqual(drift['output_1']['top1_agreement'], 1.0)
+        self.assertAlmostEqual(drift['output_1']['max_abs_diff'], 0.1, places=5)
+
+
+class TestQuantizeInput(unittest.TestCase):
+    """Test TFLite input quantization"""
+
+    def test_int8_input_uses_tensor_scale(self):
+        """Test float inputs are scaled, shifted and clipped into the int8 range"""
+        detail = {'quantization': (0.02, -3), 'dtype': np.int8}
+        quantized = quantize_input(np.array([0.0, 0.1, 10.0, -10.0]), detail)
+        self.assertEqual(quantized.dtype, np.int8)
+        self.assertEqual(quantized.tolist(), [-3, 2, 127, -128])
+
+    def test_float_input_passes_through(self):
+        """Test float models get float32 input unchanged"""
+        detail = {'quantization': (0.0, 0), 'dtype': np.float32}
+        batch = np.array([0.25, -1.5])
+        self.assertEqual(quantize_input(batch, detail).tolist(), batch.tolist())
+
+
+class TestArtifactInputShape(unittest.TestCase):
+    """Test the input layout is read from the model file"""
+
+    def test_channels_last_tflite(self):
+        """Test an NHWC TFLite input (Ultralytics export) overrides the NCHW default"""
+        self.assertEqual(artifact_input_shape([1, 416, 416, 3], (3, 416, 416)), (416, 416, 3))
+
+    def test_symbolic_axes_use_default(self):
+        """Test dynamic ONNX axes are filled from the configured shape in either layout"""
+        self.assertEqual(artifact_input_shape(['batch', 3, 224, 224], (3, 224, 224)), (3, 224, 224))
+        self.assertEqual(artifact_input_shape(['batch', 'h', 'w', 3], (3, 224, 224)), (224, 224, 3))
+        self.assertEqual(artifact_input_shape(None, (3, 8, 112, 112)), (3, 8, 112, 112))
+
+
+class TestBenchmarkModel(unittest.TestCase):
+    """Test one benchmark worker run"""
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def test_pytorch_sweep_and_eval_outputs(self):
+        """Test every batch/thread combination is timed and eval outputs are returned"""
+        model = nn.Sequential(nn.Conv2d(3, 4, 3), nn.AdaptiveAvgPool2d(1), nn.Flatten()).eval()
+        model_path = os.path.join(self.tmp, 'model.pt')
+        torch.jit.trace(model, torch.randn(1, 3, 16, 16)).save(model_path)
+        eval_path = os.path.join(self.tmp, 'eval.npy')
+        np.save(eval_path, np.random.randn(10, 3, 16, 16).astype(np.float32))
+
+        result = benchmark_model({
+            'name': 'tiny', 'backend': 'pytorch', 'path': model_path,
+            'input_shape': (3, 16, 16), 'batch_sizes': [1, 4], 'thread_counts': [1, 2],
+            'iterations': 5, 'warmup': 1, 'eval_path': eval_path
+        })
+
+        self.assertEqual(result['status'], 'ok')
+        self.assertEqual(len(result['sweep']), 4)
+        self.assertEqual(result['eval_outputs'][0].shape, (10, 4))
+        self.assertGreater(result['peak_rss_mb'], 0)
+        self.assertGreater(result['file_size_mb'], 0)
+        logger.info("✓ Model benchmark working")
+
+    def _export_onnx(self, dynamic: bool) -> str:
+        model = nn.Sequential(nn.Conv2d(3, 4, 3), nn.AdaptiveAvgPool2d(1), nn.Flatten()).eval()
+        model_path = os.path.join(self.tmp, 'model.onnx')
+        torch.onnx.export(
+            model, torch.randn(1, 3, 16, 16), model_path,
+            input_names=['input'], output_names=['output'], opset_version=13,
+            dynamic_axes={'input': {0: 'batch'}, 'output': {0: 'batch'}} if dynamic else None
+        )
+        return model_path
+
+    def _run(self, model_path: str) -> dict:
+        return benchmark_model({
+            'name': 'tiny', 'backend': 'onnxruntime', 'path': model_path,
+            'input_shape': (3, 16, 16), 'batch_sizes': [1, 4], 'thread_counts': [1],
+            'iterations': 3, 'warmup': 1
+        })
+
+    @unittest.skipUnless(ORT_AVAILABLE, "onnxruntime not installed")
+    def test_failed_configuration_keeps_sweep(self):
+        """Test a fixed-batch export fails only its batch>1 configurations"""
+        result = self._run(self._export_onnx(dynamic=False))
+
+        self.assertEqual(result['status'], 'partial')
+        self.assertEqual([point['status'] for point in result['sweep']], ['ok', 'failed'])
+        self.assertIn('error', result['sweep'][1])
+
+    @unittest.skipUnless(ORT_AVAILABLE, "onnxruntime not installed")
+    def test_dynamic_batch_onnx(self):
+        """Test a dynamic-batch ONNX export runs every batch size"""
+        result = self._run(self._export_onnx(dynamic=True))
+
+        self.assertEqual(result['status'], 'ok')
+        self.assertEqual(result['input_shape'], [3, 16, 16])
+        logger.info("✓ Per-configuration benchmark errors working")
+
+
+@unittest.skipUnless(TF_AVAILABLE and ORT_AVAILABLE, "tensorflow/onnxruntime not installed")
+class TestPytorchExport(unittest.TestCase):
+    """Test the intermediate ONNX written by the TFLite conversion"""
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def test_onnx_export_has_dynamic_batch(self):
+        """Test the .onnx next to the TFLite model accepts batches larger than the export's"""
+        from convert_to_tflite import TFLiteConverter
+        from onnx_backend import OnnxModel
+
+        model = nn.Sequential(nn.Conv2d(3, 4, 3), nn.AdaptiveAvgPool2d(1), nn.Flatten()).eval()
+        model_path = os.path.join(self.tmp, 'model.pt')
+        torch.save(model, model_path)
+        output_path = os.path.join(self.tmp, 'model.tflite')
+
+        with mock.patch.object(TFLiteConverter, 'onnx_to_tflite', return_value=True):
+            self.assertTrue(TFLiteConverter.pytorch_to_tflite(model_path, output_path, (16, 16)))
+
+        outputs = OnnxModel(output_path.replace('.tflite', '.onnx'))(np.zeros((4, 3, 16, 16), np.float32))
+        self.assertEqual(tuple(outputs.shape), (4, 4))
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,110 @@
+"""
+Model Registry - Test Suite
+Checks lazy loading, background warm-up and readiness reporting.
+"""
+
+import threading
+import time
+import unittest
+import logging
+
+from model_registry import ModelRegistry
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class TestModelRegistry(unittest.TestCase):
+    """Test lazy component loading"""
+
+    def test_lazy_until_first_use(self):
+        """Test factories run once, on first access"""
+        calls = []
+        registry = ModelRegistry()
+        registry.register('ocr', lambda: calls.append(1) or 'engine')
+
+        self.assertEqual(registry.status()['ocr']['state'], 'not_loaded')
+        self.assertEqual(registry.get('ocr'), 'engine')
+        self.assertEqual(registry.get('ocr'), 'engine')
+        self.assertEqual(len(calls), 1)
+        logger.info("✓ Lazy loading working")
+
+    def test_warm_up_shares_load_with_callers(self):
+        """Test callers during warm-up wait for the same load"""
+        calls = []
+        loaded = []
+        registry = ModelRegistry()
+
+        def slow_factory():
+            calls.append(threading.current_thread().name)
+            time.sleep(0.1)
+            return 'model'
+
+        registry.register('ner', slow_factory, on_load=loaded.append)
+        thread = registry.warm_up()
+        time.sleep(0.02)
+        self.assertFalse(registry.is_ready())
+        self.assertEqual(registry.get('ner'), 'model')
+        thread.join()
+
+        self.assertEqual(calls, ['model-warmup'])
+        self.assertEqual(loaded, ['model'])
+        self.assertTrue(registry.is_ready())
+
+    def test_failures_reported(self):
+        """Test a failing component is reported and raises on use"""
+        registry = ModelRegistry()
+        registry.register('validator', lambda: 1 / 0)
+        registry.load_all()
+
+        self.assertEqual(registry.status()['validator']['state'], 'failed')
+        with self.assertRaises(RuntimeError):
+            registry.get('validator')
+
+    def test_failed_load_is_retried_with_backoff(self):
+        """Test a transient failure recovers without restarting the process"""
+        attempts = []
+
+        def flaky_factory():
+            attempts.append(time.monotonic())
+            if len(attempts) < 3:
+                raise OSError("model file not mounted yet")
+            return 'model'
+
+        registry = ModelRegistry(max_retries=3, retry_backoff=0.1)
+        registry.register('ocr', flaky_factory)
+        registry.load_all()
+        self.assertTrue(registry.has_failures())
+        self.assertEqual(registry.status()['ocr']['failed_attempts'], 1)
+
+        deadline = time.monotonic() + 2.0
+        while not registry.is_ready() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(registry.get('ocr'), 'model')
+        self.assertEqual(len(attempts), 3)
+        # Second retry waits twice as long as the first
+        self.assertGreater(attempts[2] - attempts[1], attempts[1] - attempts[0])
+        self.assertFalse(registry.has_failures())
+        logger.info("✓ Model load retry working")
+
+    def test_explicit_reload(self):
+        """Test reload() rebuilds a component once retries are exhausted"""
+        broken = [True]
+
+        def factory():
+            if broken[0]:
+                raise OSError("weights missing")
+            return 'model'
+
+        registry = ModelRegistry(max_retries=0)
+        registry.register('ner', factory)
+        registry.load_all()
+        self.assertIsNone(registry.status()['ner']['retry_in_seconds'])
+
+        broken[0] = False
+        self.assertEqual(registry.reload('ner'), 'model')
+        self.assertTrue(registry.is_ready('ner'))
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
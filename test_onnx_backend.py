@@ -0,0 +1,135 @@
+"""
+ONNX Runtime Backend - Test Suite
+Checks that exported models keep their predict API and match PyTorch outputs.
+"""
+
+import shutil
+import tempfile
+import unittest
+import logging
+from pathlib import Path
+
+import torch
+import torch.nn as nn
+
+import config
+import onnx_backend
+from onnx_backend import (
+    ORT_AVAILABLE, accelerate_action_recognizer, accelerate_pill_classifier, apply_backend
+)
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class TinyPillClassifier(nn.Module):
+    """Stand-in PillClassifier with dict outputs and a predict() on top of forward"""
+
+    input_size = 32
+
+    def __init__(self):
+        super().__init__()
+        self.backbone = nn.Sequential(nn.Conv2d(3, 8, 3), nn.BatchNorm2d(8), nn.ReLU(),
+                                      nn.AdaptiveAvgPool2d(1), nn.Flatten())
+        self.shape_head = nn.Linear(8, 4)
+        self.color_head = nn.Linear(8, 6)
+
+    def forward(self, x):
+        features = self.backbone(x)
+        return {'shape': self.shape_head(features), 'color': self.color_head(features)}
+
+    def predict(self, x, return_probabilities=False):
+        with torch.no_grad():
+            logits = self(x)
+        return {f'{head}_probs': torch.softmax(value, dim=1) for head, value in logits.items()}
+
+
+class Action3DCNN(nn.Module):
+    """Stand-in 3D CNN taking (N, 3, T, H, W) clips"""
+
+    def __init__(self):
+        super().__init__()
+        self.conv = nn.Conv3d(3, 4, 3, padding=1)
+        self.pool = nn.AdaptiveAvgPool3d(1)
+        self.fc = nn.Linear(4, 4)
+
+    def forward(self, x):
+        return self.fc(self.pool(torch.relu(self.conv(x))).flatten(1))
+
+
+class FakeActionRecognizer:
+    def __init__(self):
+        self.model = Action3DCNN().eval()
+        self.confidence_threshold = 0.6
+
+
+@unittest.skipUnless(ORT_AVAILABLE, "onnxruntime not installed")
+class TestOnnxBackend(unittest.TestCase):
+    """Test the ONNX Runtime backend"""
+
+    def setUp(self):
+        self.model_dir = tempfile.mkdtemp()
+        self._original_dir = config.ONNX_MODEL_DIR
+        config.ONNX_MODEL_DIR = self.model_dir
+        torch.manual_seed(0)
+
+    def tearDown(self):
+        config.ONNX_MODEL_DIR = self._original_dir
+        shutil.rmtree(self.model_dir, ignore_errors=True)
+
+    def test_pill_classifier_predict_unchanged(self):
+        """Test predict() runs through ONNX Runtime and matches PyTorch"""
+        classifier = TinyPillClassifier().eval()
+        batch = torch.randn(5, 3, 32, 32)
+        expected = classifier.predict(batch)
+
+        accelerate_pill_classifier(classifier)
+        self.assertIsInstance(classifier.forward, onnx_backend.OnnxModel)
+        self.assertTrue(onnx_backend.onnx_path_for('pill_classifier', classifier).exists())
+
+        actual = classifier.predict(batch)
+        self.assertEqual(set(actual), {'shape_probs', 'color_probs'})
+        for key, value in expected.items():
+            self.assertTrue(torch.allclose(actual[key], value, atol=1e-4))
+        logger.info("✓ ONNX Runtime pill classifier working")
+
+    def test_export_keyed_on_weights(self):
+        """Test retrained weights get a fresh export and no temp files are left"""
+        classifier = TinyPillClassifier().eval()
+        accelerate_pill_classifier(classifier)
+        first_path = onnx_backend.onnx_path_for('pill_classifier', classifier)
+
+        retrained = TinyPillClassifier().eval()
+        batch = torch.randn(2, 3, 32, 32)
+        expected = retrained.predict(batch)
+        accelerate_pill_classifier(retrained)
+        second_path = onnx_backend.onnx_path_for('pill_classifier', retrained)
+
+        self.assertNotEqual(first_path, second_path)
+        self.assertTrue(first_path.exists() and second_path.exists())
+        for key, value in expected.items():
+            self.assertTrue(torch.allclose(retrained.predict(batch)[key], value, atol=1e-4))
+        self.assertEqual(list(Path(self.model_dir).glob('*.tmp')), [])
+        logger.info("✓ ONNX exports keyed on model weights")
+
+    def test_action_clip_size_is_dynamic(self):
+        """Test the 3D CNN accepts clip lengths and sizes other than the export's"""
+        recognizer = FakeActionRecognizer()
+        clip = torch.randn(2, 3, 8, 64, 64)
+        expected = recognizer.model(clip).detach()
+
+        self.assertEqual(len(accelerate_action_recognizer(recognizer)), 1)
+        self.assertTrue(torch.allclose(recognizer.model(clip), expected, atol=1e-4))
+
+    def test_pytorch_backend_leaves_model_alone(self):
+        """Test the default backend and failed exports keep PyTorch"""
+        classifier = TinyPillClassifier()
+        self.assertFalse(apply_backend('pill_classifier', 'pytorch',
+                                       accelerate_pill_classifier, classifier))
+        self.assertFalse(apply_backend('pill_classifier', 'onnxruntime',
+                                       lambda target: 1 / 0, classifier))
+        self.assertNotIsInstance(classifier.forward, onnx_backend.OnnxModel)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,88 @@
+"""
+Perceptual Hash - Test Suite
+Checks near-duplicate detection for re-photographed prescriptions.
+"""
+
+import unittest
+import logging
+
+import numpy as np
+
+from perceptual_hash import PerceptualHashIndex, dhash, phash, hamming_distance
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def make_prescription(seed: int) -> np.ndarray:
+    """Synthetic page: light background with dark text-like blocks"""
+    rng = np.random.default_rng(seed)
+    image = np.full((600, 800), 230, dtype=np.uint8)
+    for _ in range(25):
+        y, x = rng.integers(0, 560), rng.integers(0, 700)
+        image[y:y + rng.integers(8, 40), x:x + rng.integers(40, 100)] = 30
+    return image
+
+
+class TestPerceptualHash(unittest.TestCase):
+    """Test hash stability and index lookup"""
+
+    def setUp(self):
+        self.original = make_prescription(1)
+        # Re-photographed: shifted a few pixels and slightly brighter
+        shifted = np.roll(self.original, (4, 6), axis=(0, 1)).astype(np.int16) + 12
+        self.rephotographed = np.clip(shifted, 0, 255).astype(np.uint8)
+        self.other = make_prescription(2)
+
+    def test_near_duplicates_are_close(self):
+        """Test re-photographed pages hash close, different pages far"""
+        for hash_fn in (dhash, phash):
+            near = hamming_distance(hash_fn(self.original), hash_fn(self.rephotographed))
+            far = hamming_distance(hash_fn(self.original), hash_fn(self.other))
+            self.assertLessEqual(near, 6)
+            self.assertGreater(far, near)
+        logger.info("✓ Perceptual hashing working")
+
+    def test_index_lookup(self):
+        """Test the index returns the closest stored payload"""
+        index = PerceptualHashIndex(max_entries=2)
+        index.add(dhash(self.original), 'rx-1')
+        index.add(dhash(self.other), 'rx-2')
+
+        payload, distance = index.nearest(dhash(self.rephotographed), max_distance=6)
+        self.assertEqual(payload, 'rx-1')
+        self.assertIsNone(index.nearest(dhash(self.rephotographed) ^ (2 ** 64 - 1), max_distance=6))
+
+    def test_index_bounded(self):
+        """Test oldest hashes are evicted"""
+        index = PerceptualHashIndex(max_entries=2)
+        for value in (1, 2, 3):
+            index.add(value, value)
+        self.assertEqual(len(index), 2)
+        self.assertIsNone(index.nearest(1, max_distance=0))
+
+    def test_index_matches_brute_force(self):
+        """Test lookups stay exact as the index grows, evicts and replaces entries"""
+        rng = np.random.default_rng(0)
+        hashes = [int(h) for h in rng.integers(0, 2 ** 63, size=300, dtype=np.int64)]
+        index = PerceptualHashIndex(max_entries=200)
+        stored = {}
+        for i, value in enumerate(hashes + hashes[250:270]):
+            index.add(value, i)
+            stored.pop(value, None)
+            stored[value] = i
+            while len(stored) > 200:
+                stored.pop(next(iter(stored)))
+        self.assertEqual(len(index), len(stored))
+
+        for query in hashes[:20] + hashes[-20:]:
+            best = min(stored, key=lambda value: hamming_distance(value, query))
+            payload, distance = index.nearest(query, max_distance=64)
+            self.assertEqual(distance, hamming_distance(best, query))
+            if distance == 0:
+                self.assertEqual(payload, stored[query])
+        logger.info("✓ Perceptual hash index growth and eviction working")
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,81 @@
+"""
+Pill Association - Test Suite
+Checks Hungarian association and motion prediction of the vectorized tracker.
+"""
+
+import unittest
+import logging
+from types import SimpleNamespace
+
+import numpy as np
+
+from pill_association import VectorizedPillTracker, iou_matrix
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def make_detection(frame_id, cx, cy, size=20.0, confidence=0.9):
+    half = size / 2
+    return SimpleNamespace(
+        frame_id=frame_id, x1=cx - half, y1=cy - half, x2=cx + half, y2=cy + half,
+        confidence=confidence, class_id=0, class_name='pill',
+        center_x=cx, center_y=cy, width=size, height=size
+    )
+
+
+class TestIoUMatrix(unittest.TestCase):
+    """Test pairwise IoU"""
+
+    def test_iou_values(self):
+        """Test identical, disjoint and half-overlapping boxes"""
+        a = np.array([[0, 0, 10, 10]], dtype=float)
+        b = np.array([[0, 0, 10, 10], [20, 20, 30, 30], [5, 0, 15, 10]], dtype=float)
+        np.testing.assert_allclose(iou_matrix(a, b), [[1.0, 0.0, 1 / 3]])
+        logger.info("✓ IoU matrix working")
+
+
+class TestVectorizedPillTracker(unittest.TestCase):
+    """Test multi-pill association"""
+
+    def test_parallel_pills_keep_identity(self):
+        """Test several pills moving side by side stay on their own tracks"""
+        tracker = VectorizedPillTracker()
+        for frame_id in range(30):
+            # Shuffled order so association cannot rely on detection order
+            detections = [make_detection(frame_id, 50 + 40 * i, 100 + 3 * frame_id) for i in range(5)]
+            tracker.update(detections[::-1] if frame_id % 2 else detections, frame_id=frame_id)
+
+        tracks = tracker.finish()
+        self.assertEqual(len(tracks), 5)
+        for track in tracks:
+            self.assertEqual(track.total_frames, 30)
+            xs = {d.center_x for d in track.detections}
+            self.assertEqual(len(xs), 1)
+            self.assertAlmostEqual(track.movement_distance, 29 * 3)
+        logger.info("✓ Parallel pills tracked")
+
+    def test_fast_motion_followed_by_prediction(self):
+        """Test a pill moving more than its own size per frame is not split"""
+        tracker = VectorizedPillTracker()
+        for frame_id in range(20):
+            tracker.update([make_detection(frame_id, 10 + 25 * frame_id, 50)], frame_id=frame_id)
+
+        tracks = tracker.finish()
+        self.assertEqual(len(tracks), 1)
+        self.assertEqual(tracks[0].total_frames, 20)
+
+    def test_gap_closes_track(self):
+        """Test short occlusions are bridged and long ones start a new track"""
+        tracker = VectorizedPillTracker(max_gap=3)
+        for frame_id in [0, 1, 2, 5, 6, 15, 16]:
+            tracker.update([make_detection(frame_id, 100, 100)], frame_id=frame_id)
+        tracker.update([], frame_id=17)
+
+        tracks = tracker.finish()
+        self.assertEqual([t.total_frames for t in tracks], [5, 2])
+        self.assertEqual(tracks[0].to_dict()['end_frame'], 6)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,254 @@
+"""
+Prescription Pipeline - Test Suite
+Checks ordering, error propagation and shutdown of the stage pipeline.
+"""
+
+import os
+import random
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+import logging
+from unittest import mock
+
+import prescription_digitizer
+from prescription_digitizer import PrescriptionDigitizer
+from prescription_pipeline import PipelinedDigitizer
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class FakeDigitizer:
+    """Digitizer with the stage API and random per-stage delays"""
+
+    mark_failed = staticmethod(PrescriptionDigitizer.mark_failed)
+    confirm_near_duplicate = staticmethod(PrescriptionDigitizer.confirm_near_duplicate)
+    reuse_extraction = staticmethod(PrescriptionDigitizer.reuse_extraction)
+
+    def __init__(self):
+        self.config = {'pipeline': {'workers': {'preprocess': 2, 'ocr': 1, 'ner': 4, 'validate': 4}}}
+        self.ner_extractor = object()
+        self.validator = object()
+        self.duplicate_index = None
+        self.stored = {}
+        self.near_duplicates = {}
+        self.active = {'ner': 0, 'validate': 0}
+        self.max_active = {'ner': 0, 'validate': 0}
+        self._lock = threading.Lock()
+
+    def _enter(self, stage):
+        with self._lock:
+            self.active[stage] += 1
+            self.max_active[stage] = max(self.max_active[stage], self.active[stage])
+        time.sleep(random.uniform(0, 0.005))
+        with self._lock:
+            self.active[stage] -= 1
+
+    def new_results(self, image_path):
+        return {'extraction_id': image_path, 'image_path': image_path}
+
+    def lookup_cached(self, image_path):
+        cached = self.stored.get(image_path)
+        return image_path, (dict(cached, cache_hit=True) if cached else None)
+
+    def store_cached(self, content_hash, results):
+        if results.get('status') != 'failed':
+            self.stored[content_hash] = results
+
+    def run_preprocessing(self, results, image_path):
+        if image_path == 'bad':
+            raise ValueError("Image preprocessing failed")
+        time.sleep(random.uniform(0, 0.005))
+        return image_path
+
+    def find_near_duplicate(self, results, processed_image):
+        return None, self.near_duplicates.get(processed_image)
+
+    def run_ocr(self, results, processed_image):
+        text = processed_image.split('#')[0]
+        results['ocr'] = {'full_text': text}
+        return text, 0.9
+
+    def run_ner(self, results, extracted_text):
+        self._enter('ner')
+        return [extracted_text], 0.9
+
+    def run_pattern_matching(self, results, extracted_text):
+        pass
+
+    def run_validation(self, results, medications):
+        self._enter('validate')
+        return 0.9
+
+    def run_scoring(self, results, ocr_confidence, ner_confidence,
+                    validation_confidence, medications):
+        results['medications'] = medications
+
+
+def pipeline_threads():
+    return [t for t in threading.enumerate() if t.name.startswith('pipeline-')]
+
+
+class TestPipelinedDigitizer(unittest.TestCase):
+    """Test the stage pipeline"""
+
+    def setUp(self):
+        self.digitizer = FakeDigitizer()
+        self.pipeline = PipelinedDigitizer(self.digitizer)
+
+    def wait_for_shutdown(self, timeout=2.0):
+        deadline = time.monotonic() + timeout
+        while pipeline_threads() and time.monotonic() < deadline:
+            time.sleep(0.05)
+        return pipeline_threads()
+
+    def test_ordered_output(self):
+        """Test ordered=True yields results in input order"""
+        paths = [f"rx_{i}" for i in range(40)]
+        results = list(self.pipeline.process_stream(paths, ordered=True))
+        self.assertEqual([r['image_path'] for r in results], paths)
+        self.assertEqual(results[7]['medications'], ['rx_7'])
+        logger.info("✓ Pipeline ordering working")
+
+    def test_failed_item_still_reaches_output(self):
+        """Test a failing stage marks the item failed without stopping the stream"""
+        results = list(self.pipeline.process_stream(['a', 'bad', 'b'], ordered=True))
+        self.assertEqual([r.get('status') for r in results], [None, 'failed', None])
+
+    def test_input_error_propagates(self):
+        """Test an exception from the input iterator reaches the caller"""
+        def paths():
+            yield 'a'
+            yield 'b'
+            raise OSError("directory vanished")
+
+        seen = []
+        with self.assertRaises(OSError):
+            for result in self.pipeline.process_stream(paths()):
+                seen.append(result['image_path'])
+        self.assertEqual(sorted(seen), ['a', 'b'])
+        self.assertEqual(self.wait_for_shutdown(), [])
+        logger.info("✓ Pipeline error propagation working")
+
+    def test_abandoned_stream_shuts_down(self):
+        """Test closing the generator early stops every pipeline thread"""
+        stream = self.pipeline.process_stream(f"rx_{i}" for i in range(1000))
+        next(stream)
+        stream.close()
+        self.assertEqual(self.wait_for_shutdown(), [])
+
+    def test_shared_components_are_serialized(self):
+        """Test NER and validation never run concurrently on non thread-safe components"""
+        list(self.pipeline.process_stream([f"rx_{i}" for i in range(40)]))
+        self.assertEqual(self.digitizer.max_active, {'ner': 1, 'validate': 1})
+
+    def test_results_are_cached(self):
+        """Test finished results are stored and served from the cache on the next run"""
+        list(self.pipeline.process_stream(['a', 'bad']))
+        self.assertEqual(set(self.digitizer.stored), {'a'})
+
+        rerun = list(self.pipeline.process_stream(['a']))
+        self.assertTrue(rerun[0]['cache_hit'])
+        self.assertEqual(rerun[0]['medications'], ['a'])
+
+    def test_near_duplicate_needs_same_text(self):
+        """Test a perceptual match is reused only when the OCR text is identical"""
+        prior = {'extraction_id': 'prior', 'ocr': {'full_text': 'amoxicillin  500mg'},
+                 'ner': {'medications': ['prior']}, 'requires_review': False}
+        self.digitizer.near_duplicates = {
+            'amoxicillin 500mg#retake': (prior, 2),
+            'amoxicillin 250mg': (prior, 3),
+        }
+        results = list(self.pipeline.process_stream(
+            ['amoxicillin 500mg#retake', 'amoxicillin 250mg'], ordered=True
+        ))
+
+        self.assertEqual(results[0]['near_duplicate_of'], 'prior')
+        self.assertEqual(results[0]['ner'], prior['ner'])
+        self.assertNotIn('near_duplicate_of', results[1])
+        self.assertEqual(results[1]['medications'], ['amoxicillin 250mg'])
+        logger.info("✓ Near-duplicate confirmation working")
+
+
+def _fake_worker_init(config_path):
+    pass
+
+
+def _fake_worker_process(image_path):
+    name = os.path.basename(image_path)
+    if name.startswith('bad'):
+        raise ValueError("worker exception")
+    if name.startswith('crash'):
+        os._exit(1)
+    return {'image_path': image_path, 'status': 'success'}
+
+
+class TestBatchParallel(unittest.TestCase):
+    """Test worker failures in the process-pool batch mode"""
+
+    def setUp(self):
+        self.image_dir = tempfile.mkdtemp()
+        # The pool workers are forked, so they see the patched module functions
+        patches = [
+            mock.patch.object(prescription_digitizer, '_init_batch_worker', _fake_worker_init),
+            mock.patch.object(prescription_digitizer, '_process_in_worker', _fake_worker_process)
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+        self.digitizer = PrescriptionDigitizer.__new__(PrescriptionDigitizer)
+        self.digitizer.config = {}
+        self.digitizer.config_path = 'unused.yaml'
+
+    def tearDown(self):
+        shutil.rmtree(self.image_dir)
+
+    def _run(self, names):
+        for name in names:
+            open(os.path.join(self.image_dir, name), 'wb').close()
+        extractions = list(self.digitizer.process_batch_parallel(
+            self.image_dir, num_workers=2, show_progress=False
+        ))
+        return {os.path.basename(e['image_path']): e for e in extractions}
+
+    def test_worker_exception_fails_one_image(self):
+        """Test an exception in one worker yields a failed record and the rest complete"""
+        results = self._run(['a.jpg', 'bad.jpg', 'c.jpg', 'd.jpg'])
+
+        self.assertEqual(len(results), 4)
+        self.assertEqual(results['bad.jpg']['status'], 'failed')
+        self.assertIn('worker exception', results['bad.jpg']['error'])
+        for name in ('a.jpg', 'c.jpg', 'd.jpg'):
+            self.assertEqual(results[name]['status'], 'success')
+
+    def test_broken_pool_reports_every_image(self):
+        """Test a crashed worker still yields one record per image"""
+        results = self._run(['a.jpg', 'crash.jpg', 'c.jpg'])
+
+        self.assertEqual(set(results), {'a.jpg', 'crash.jpg', 'c.jpg'})
+        self.assertEqual(results['crash.jpg']['status'], 'failed')
+        logger.info("✓ Batch worker failures reported per image")
+
+
+class TestProcessPrescription(unittest.TestCase):
+    """Test single-image error handling"""
+
+    def test_unreadable_image_returns_failed_result(self):
+        """Test a cache-lookup read error becomes a failed result, not an exception"""
+        digitizer = PrescriptionDigitizer.__new__(PrescriptionDigitizer)
+        digitizer.result_cache = mock.Mock()
+        with tempfile.NamedTemporaryFile(suffix='.jpg') as image, \
+                mock.patch.object(prescription_digitizer, 'hash_file',
+                                  side_effect=PermissionError("permission denied")):
+            results = digitizer.process_prescription(image.name)
+
+        self.assertEqual(results['status'], 'failed')
+        self.assertIn('permission denied', results['error'])
+        digitizer.result_cache.put.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
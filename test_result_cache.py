@@ -0,0 +1,79 @@
+"""
+Result Cache - Test Suite
+Checks content-addressed caching of extraction results.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+import logging
+
+from result_cache import ResultCache, hash_bytes
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class TestResultCache(unittest.TestCase):
+    """Test memory and disk cache layers"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.cache = ResultCache(self.tmp_dir, max_items=2, version='test-1')
+        self.result = {'extraction_id': 'abc12345', 'ner': {'num_medications': 1}}
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def test_roundtrip(self):
+        """Test a stored result is returned for the same bytes"""
+        content_hash = hash_bytes(b'prescription image')
+        self.assertIsNone(self.cache.get(content_hash))
+        self.cache.put(content_hash, self.result)
+        self.assertEqual(self.cache.get(content_hash), self.result)
+        self.assertEqual(self.cache.stats['memory_hits'], 1)
+        logger.info("✓ Result cache working")
+
+    def test_disk_layer_survives_restart(self):
+        """Test results persist across cache instances"""
+        content_hash = hash_bytes(b'prescription image')
+        self.cache.put(content_hash, self.result)
+
+        reopened = ResultCache(self.tmp_dir, max_items=2, version='test-1')
+        self.assertEqual(reopened.get(content_hash), self.result)
+        self.assertEqual(reopened.stats['disk_hits'], 1)
+
+    def test_version_invalidates(self):
+        """Test a new pipeline version does not see old results"""
+        content_hash = hash_bytes(b'prescription image')
+        self.cache.put(content_hash, self.result)
+
+        upgraded = ResultCache(self.tmp_dir, version='test-2')
+        self.assertIsNone(upgraded.get(content_hash))
+
+    def test_lru_eviction(self):
+        """Test the memory layer is bounded"""
+        for i in range(3):
+            self.cache.put(hash_bytes(bytes([i])), {'i': i})
+        self.assertEqual(self.cache.get_statistics()['memory_items'], 2)
+        # Evicted from memory but still on disk
+        self.assertEqual(self.cache.get(hash_bytes(bytes([0]))), {'i': 0})
+
+    def test_disk_store_is_bounded(self):
+        """Test the least recently used files are pruned once the disk bound is passed"""
+        cache = ResultCache(self.tmp_dir, max_items=1, version='test-1', max_disk_items=10)
+        hashes = [hash_bytes(bytes([i])) for i in range(11)]
+        for i, content_hash in enumerate(hashes[:10]):
+            cache.put(content_hash, {'i': i})
+            os.utime(cache._path(cache.key(content_hash)), (i, i))
+        cache.put(hashes[10], {'i': 10})
+
+        self.assertEqual(cache.get_statistics()['disk_items'], 9)
+        reopened = ResultCache(self.tmp_dir, version='test-1', max_disk_items=10)
+        self.assertIsNone(reopened.get(hashes[0]))
+        self.assertEqual(reopened.get(hashes[10]), {'i': 10})
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,42 @@
+"""
+Unified API Server - Test Suite
+Checks optional-feature imports without loading the component models.
+"""
+
+import importlib.util
+import sys
+import unittest
+import logging
+from unittest import mock
+
+import unified_api_server
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def load_server_copy(name: str):
+    """Import a fresh copy of unified_api_server under another module name."""
+    spec = importlib.util.spec_from_file_location(name, unified_api_server.__file__)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class TestOptionalFeatures(unittest.TestCase):
+    """Test a missing optional module disables only its own feature"""
+
+    def test_missing_feature_module_keeps_integration(self):
+        """Test a failed live_intake import leaves the workflow and other features alone"""
+        with mock.patch.dict(sys.modules, {'live_intake': None}):
+            server = load_server_copy('unified_api_server_without_live_intake')
+
+        self.assertFalse(server.LIVE_INTAKE_AVAILABLE)
+        self.assertEqual(server.INTEGRATION_AVAILABLE, unified_api_server.INTEGRATION_AVAILABLE)
+        self.assertEqual(server.STREAMING_INTAKE_AVAILABLE, unified_api_server.STREAMING_INTAKE_AVAILABLE)
+        self.assertEqual(server.PILL_BATCHING_AVAILABLE, unified_api_server.PILL_BATCHING_AVAILABLE)
+        logger.info("✓ Optional feature imports isolated")
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
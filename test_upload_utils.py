@@ -0,0 +1,58 @@
+"""
+Upload Handling - Test Suite
+Checks chunked, size-capped upload streaming.
+"""
+
+import asyncio
+import hashlib
+import io
+import os
+import shutil
+import tempfile
+import unittest
+import logging
+
+from fastapi import HTTPException, UploadFile
+
+from upload_utils import save_upload
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class TestSaveUpload(unittest.TestCase):
+    """Test streaming uploads to disk"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.content = os.urandom(10000)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def _upload(self):
+        return UploadFile(file=io.BytesIO(self.content), filename='intake.mp4')
+
+    def test_streams_and_hashes(self):
+        """Test the file is written in chunks with its SHA-256"""
+        dest = os.path.join(self.tmp_dir, 'intake.mp4')
+        saved = asyncio.run(save_upload(self._upload(), dest, max_bytes=20000, chunk_size=1024))
+
+        self.assertEqual(saved.size, len(self.content))
+        self.assertEqual(saved.sha256, hashlib.sha256(self.content).hexdigest())
+        with open(dest, 'rb') as f:
+            self.assertEqual(f.read(), self.content)
+        logger.info("✓ Streaming upload working")
+
+    def test_size_limit(self):
+        """Test oversized uploads raise 413 and leave no partial file"""
+        dest = os.path.join(self.tmp_dir, 'intake.mp4')
+        with self.assertRaises(HTTPException) as ctx:
+            asyncio.run(save_upload(self._upload(), dest, max_bytes=4096, chunk_size=1024))
+
+        self.assertEqual(ctx.exception.status_code, 413)
+        self.assertFalse(os.path.exists(dest))
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
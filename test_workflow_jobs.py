@@ -0,0 +1,83 @@
+"""
+Workflow Jobs - Test Suite
+Checks capacity reservation and status tracking of background workflow jobs.
+"""
+
+import threading
+import time
+import unittest
+import logging
+
+from inference_executor import InferenceExecutor, QueueFullError
+from workflow_jobs import JobStatus, WorkflowJobStore
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class TestWorkflowJobStore(unittest.TestCase):
+    """Test job submission against a bounded executor"""
+
+    def setUp(self):
+        self.executor = InferenceExecutor(max_workers=1, max_queue_size=1)
+        self.store = WorkflowJobStore(self.executor)
+        self.release = threading.Event()
+
+    def tearDown(self):
+        self.release.set()
+        self.executor.shutdown()
+
+    def wait_finished(self, job_id, timeout=2.0):
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            job = self.store.get(job_id)
+            if JobStatus(job['status']).is_finished:
+                return job
+            time.sleep(0.01)
+        self.fail(f"{job_id} did not finish")
+
+    def test_job_completes(self):
+        """Test a submitted job reports its result"""
+        record = self.store.submit('wf-1', lambda: {'verified': True}, patient_id='p1')
+        self.assertEqual(record['status'], JobStatus.QUEUED.value)
+
+        job = self.wait_finished('wf-1')
+        self.assertEqual(job['status'], JobStatus.COMPLETED.value)
+        self.assertEqual(job['result'], {'verified': True})
+        self.assertEqual(job['patient_id'], 'p1')
+        logger.info("✓ Workflow job tracking working")
+
+    def test_burst_cannot_overshoot_capacity(self):
+        """Test back-to-back submissions reserve slots before any job starts"""
+        accepted, rejected = [], []
+        for i in range(5):
+            try:
+                accepted.append(self.store.submit(f"wf-{i}", self.release.wait))
+            except QueueFullError:
+                rejected.append(i)
+
+        self.assertEqual(len(accepted), self.executor.capacity)
+        self.assertEqual(len(rejected), 3)
+        # Rejected jobs leave no record behind
+        self.assertIsNone(self.store.get('wf-4'))
+
+        self.release.set()
+        for record in accepted:
+            self.wait_finished(record['workflow_id'])
+        self.assertEqual(self.executor.get_statistics()['running'], 0)
+        self.store.submit('wf-next', lambda: {})
+        logger.info("✓ Workflow capacity reservation working")
+
+    def test_failed_job(self):
+        """Test an exception in the job is recorded as a failure"""
+        def broken():
+            raise RuntimeError("camera unavailable")
+
+        self.store.submit('wf-err', broken)
+        job = self.wait_finished('wf-err')
+        self.assertEqual(job['status'], JobStatus.FAILED.value)
+        self.assertEqual(job['error'], "camera unavailable")
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -1,506 +1,791 @@
-"""
-Unified REST API for Complete Medication Verification System
-Exposes all 3 components through FastAPI endpoints.
-"""
-
-from fastapi import FastAPI, UploadFile, File, HTTPException, BackgroundTasks
-from fastapi.responses import JSONResponse, FileResponse
-from pydantic import BaseModel
-from typing import Optional, List, Dict
-import logging
-import os
-import uuid
-from datetime import datetime
-import json
-from pathlib import Path
-import shutil
-
-try:
-    from src.integration_engine import MedicationVerificationWorkflow
-    INTEGRATION_AVAILABLE = True
-except ImportError:
-    INTEGRATION_AVAILABLE = False
-    class MedicationVerificationWorkflow:
-        """Fallback mock workflow when components unavailable"""
-        def __init__(self):
-            self.components_loaded = {
-                'prescription_digitizer': False,
-                'pill_authenticator': False,
-                'intake_verifier': False
-            }
-        def get_component_status(self):
-            return self.components_loaded
-
-logging.basicConfig(level=logging.INFO)
-logger = logging.getLogger(__name__)
-
-# Initialize FastAPI
-app = FastAPI(
-    title="Zero-Error Medication Management System",
-    description="Unified API for prescription analysis, pill verification, and intake verification",
-    version="1.0.0"
-)
-
-# Initialize workflow engine (will be loaded once at startup)
-workflow = None
-
-# Storage paths
-UPLOAD_DIR = Path("data/uploads")
-RESULTS_DIR = Path("data/results")
-UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
-RESULTS_DIR.mkdir(parents=True, exist_ok=True)
-
-
-# ============================================================================
-# DATA MODELS
-# ============================================================================
-
-class AnalysisPrescriptionRequest(BaseModel):
-    """Request model for prescription analysis"""
-    patient_id: str
-    notes: Optional[str] = None
-
-
-class VerifyPillRequest(BaseModel):
-    """Request model for pill verification"""
-    patient_id: str
-    medication_id: str
-
-
-class VerifyIntakeRequest(BaseModel):
-    """Request model for intake verification"""
-    patient_id: str
-    medication_id: str
-
-
-class BatchProcessRequest(BaseModel):
-    """Request model for batch processing"""
-    patient_id: str
-    medication_id: str
-    notes: Optional[str] = None
-
-
-class WorkflowResponse(BaseModel):
-    """Response model for workflow results"""
-    workflow_id: str
-    patient_id: str
-    medication_id: str
-    status: str
-    confidence: float
-    valid: bool
-    message: str
-
-
-# ============================================================================
-# STARTUP/SHUTDOWN
-# ============================================================================
-
-@app.on_event("startup")
-async def startup_event():
-    """Initialize components on startup"""
-    global workflow
-    logger.info("=" * 70)
-    logger.info("ZERO-ERROR MEDICATION MANAGEMENT SYSTEM - API SERVER")
-    logger.info("=" * 70)
-    logger.info("🚀 Starting API server on http://0.0.0.0:8000")
-    logger.info("📚 API documentation: http://localhost:8000/docs")
-    
-    try:
-        logger.info("📦 Initializing medication verification workflow...")
-        workflow = MedicationVerificationWorkflow()
-        status = workflow.get_component_status()
-        
-        logger.info("✓ Component Status:")
-        logger.info(f"  - Prescription Digitizer: {'✅ Available' if status.get('prescription_digitizer') else '⚠️  Unavailable'}")
-        logger.info(f"  - Pill Authenticator: {'✅ Available' if status.get('pill_authenticator') else '⚠️  Unavailable'}")
-        logger.info(f"  - Intake Verifier: {'✅ Available' if status.get('intake_verifier') else '⚠️  Unavailable'}")
-        logger.info("=" * 70)
-    except Exception as e:
-        logger.warning(f"⚠️  Could not load all components: {e}")
-        logger.info("Continuing with available components...")
-        workflow = MedicationVerificationWorkflow()
-
-
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Cleanup on shutdown"""
-    logger.info("🛑 Shutting down API server...")
-    logger.info("Goodbye! 👋")
-
-
-# ============================================================================
-# COMPONENT 1: PRESCRIPTION ANALYSIS
-# ============================================================================
-
-@app.post("/api/v1/analyze-prescription")
-async def analyze_prescription(
-    patient_id: str,
-    file: UploadFile = File(...),
-    notes: Optional[str] = None
-) -> JSONResponse:
-    """
-    Analyze prescription image (Component 1)
-    
-    Args:
-        patient_id: Patient identifier
-        file: Prescription image file (JPG/PNG)
-        notes: Additional notes
-        
-    Returns:
-        Analysis results with extracted medications
-    """
-    if not workflow or not workflow.prescription_digitizer:
-        raise HTTPException(
-            status_code=503,
-            detail="Prescription digitizer not available"
-        )
-    
-    try:
-        # Save uploaded file
-        file_id = str(uuid.uuid4())
-        file_path = UPLOAD_DIR / f"prescription_{file_id}.jpg"
-        
-        with open(file_path, "wb") as f:
-            content = await file.read()
-            f.write(content)
-        
-        logger.info(f"Analyzing prescription for patient {patient_id}")
-        
-        # Process prescription
-        result = workflow.prescription_digitizer.process_prescription(str(file_path))
-        
-        return JSONResponse({
-            "status": "success",
-            "patient_id": patient_id,
-            "file_id": file_id,
-            "analysis": result,
-            "timestamp": datetime.now().isoformat()
-        })
-    
-    except Exception as e:
-        logger.error(f"Prescription analysis error: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
-
-
-# ============================================================================
-# COMPONENT 2: PILL VERIFICATION
-# ============================================================================
-
-@app.post("/api/v1/verify-pill")
-async def verify_pill(
-    patient_id: str,
-    medication_id: str,
-    file: UploadFile = File(...),
-    prescription_file_id: Optional[str] = None
-) -> JSONResponse:
-    """
-    Verify pill image against prescription (Component 2)
-    
-    Args:
-        patient_id: Patient identifier
-        medication_id: Medication identifier
-        file: Pill image file (JPG/PNG)
-        prescription_file_id: ID of prescription file for cross-reference
-        
-    Returns:
-        Verification results with shape/color/imprint analysis
-    """
-    if not workflow or not workflow.pill_classifier:
-        raise HTTPException(
-            status_code=503,
-            detail="Pill authenticator not available"
-        )
-    
-    try:
-        # Save uploaded file
-        file_id = str(uuid.uuid4())
-        file_path = UPLOAD_DIR / f"pill_{file_id}.jpg"
-        
-        with open(file_path, "wb") as f:
-            content = await file.read()
-            f.write(content)
-        
-        logger.info(f"Verifying pill for patient {patient_id}, medication {medication_id}")
-        
-        # Verify pill
-        result = workflow.pill_classifier.predict(str(file_path))
-        
-        # Check if authenticated
-        shape_conf = result.get('shape', {}).get('confidence', 0)
-        color_conf = result.get('color', {}).get('confidence', 0)
-        imprint_conf = result.get('imprint', {}).get('confidence', 0)
-        overall_conf = (shape_conf + color_conf + imprint_conf) / 3
-        
-        authenticated = overall_conf > 0.85
-        
-        return JSONResponse({
-            "status": "success",
-            "patient_id": patient_id,
-            "medication_id": medication_id,
-            "file_id": file_id,
-            "verification": result,
-            "authenticated": authenticated,
-            "confidence": float(overall_conf),
-            "timestamp": datetime.now().isoformat()
-        })
-    
-    except Exception as e:
-        logger.error(f"Pill verification error: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
-
-
-# ============================================================================
-# COMPONENT 3: INTAKE VERIFICATION
-# ============================================================================
-
-@app.post("/api/v1/verify-intake")
-async def verify_intake(
-    patient_id: str,
-    medication_id: str,
-    file: UploadFile = File(...),
-    prescription_file_id: Optional[str] = None,
-    pill_file_id: Optional[str] = None
-) -> JSONResponse:
-    """
-    Verify medication intake from video (Component 3)
-    
-    Args:
-        patient_id: Patient identifier
-        medication_id: Medication identifier
-        file: Video file (MP4/MOV/AVI)
-        prescription_file_id: ID of prescription file
-        pill_file_id: ID of pill image file
-        
-    Returns:
-        Verification results with pill/hand/swallowing detection
-    """
-    if not workflow or not workflow.intake_verifier:
-        raise HTTPException(
-            status_code=503,
-            detail="Intake verifier not available"
-        )
-    
-    try:
-        # Save uploaded file
-        file_id = str(uuid.uuid4())
-        file_ext = Path(file.filename).suffix
-        file_path = UPLOAD_DIR / f"intake_{file_id}{file_ext}"
-        
-        with open(file_path, "wb") as f:
-            content = await file.read()
-            f.write(content)
-        
-        logger.info(f"Verifying intake for patient {patient_id}, medication {medication_id}")
-        
-        # Verify intake
-        result = workflow.intake_verifier.verify_video(str(file_path))
-        
-        return JSONResponse({
-            "status": "success",
-            "patient_id": patient_id,
-            "medication_id": medication_id,
-            "file_id": file_id,
-            "verification": result.to_dict(),
-            "confirmed": result.final_status.value in ['confirmed', 'likely'],
-            "confidence": float(result.final_confidence),
-            "timestamp": datetime.now().isoformat()
-        })
-    
-    except Exception as e:
-        logger.error(f"Intake verification error: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
-
-
-# ============================================================================
-# UNIFIED WORKFLOW
-# ============================================================================
-
-@app.post("/api/v1/complete-verification")
-async def complete_verification(
-    patient_id: str,
-    background_tasks: BackgroundTasks,
-    prescription_file: UploadFile = File(...),
-    pill_file: Optional[UploadFile] = File(None),
-    intake_file: Optional[UploadFile] = File(None),
-    notes: Optional[str] = None
-) -> JSONResponse:
-    """
-    Complete unified medication verification workflow
-    
-    All 3 components in one request:
-    1. Prescription analysis
-    2. Pill verification
-    3. Intake verification
-    
-    Args:
-        patient_id: Patient identifier
-        prescription_file: Prescription image
-        pill_file: Pill image (optional)
-        intake_file: Intake video (optional)
-        notes: Additional notes
-        
-    Returns:
-        Complete workflow results
-    """
-    if not workflow:
-        raise HTTPException(
-            status_code=503,
-            detail="Workflow not available"
-        )
-    
-    try:
-        workflow_id = str(uuid.uuid4())
-        
-        # Save files
-        prescription_path = UPLOAD_DIR / f"prescription_{workflow_id}.jpg"
-        with open(prescription_path, "wb") as f:
-            f.write(await prescription_file.read())
-        
-        pill_path = None
-        if pill_file:
-            pill_path = UPLOAD_DIR / f"pill_{workflow_id}.jpg"
-            with open(pill_path, "wb") as f:
-                f.write(await pill_file.read())
-        
-        intake_path = None
-        if intake_file:
-            intake_ext = Path(intake_file.filename).suffix
-            intake_path = UPLOAD_DIR / f"intake_{workflow_id}{intake_ext}"
-            with open(intake_path, "wb") as f:
-                f.write(await intake_file.read())
-        
-        # Extract medication ID from prescription (use first extracted drug as fallback)
-        medication_id = "unknown"
-        
-        # Process workflow
-        logger.info(f"Processing complete workflow {workflow_id} for patient {patient_id}")
-        
-        result = workflow.process_medication_verification(
-            patient_id=patient_id,
-            prescription_image_path=str(prescription_path),
-            pill_image_path=str(pill_path) if pill_path else None,
-            intake_video_path=str(intake_path) if intake_path else None
-        )
-        
-        # Save result
-        result_path = RESULTS_DIR / f"workflow_{workflow_id}.json"
-        with open(result_path, "w") as f:
-            json.dump(result.to_dict(), f, indent=2)
-        
-        # Generate report
-        report = workflow.generate_report(result)
-        report_path = RESULTS_DIR / f"report_{workflow_id}.txt"
-        with open(report_path, "w") as f:
-            f.write(report)
-        
-        return JSONResponse({
-            "status": "success",
-            "workflow_id": workflow_id,
-            "patient_id": patient_id,
-            "result": {
-                "final_status": result.final_status,
-                "confidence": float(result.overall_confidence),
-                "valid": result.is_valid,
-                "reasoning": result.reasoning
-            },
-            "result_file": str(result_path),
-            "report_file": str(report_path),
-            "timestamp": datetime.now().isoformat()
-        })
-    
-    except Exception as e:
-        logger.error(f"Workflow error: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
-
-
-# ============================================================================
-# RETRIEVAL ENDPOINTS
-# ============================================================================
-
-@app.get("/api/v1/result/{workflow_id}")
-async def get_result(workflow_id: str) -> JSONResponse:
-    """Retrieve workflow result"""
-    result_path = RESULTS_DIR / f"workflow_{workflow_id}.json"
-    
-    if not result_path.exists():
-        raise HTTPException(status_code=404, detail="Result not found")
-    
-    try:
-        with open(result_path) as f:
-            result = json.load(f)
-        
-        return JSONResponse(result)
-    
-    except Exception as e:
-        logger.error(f"Error retrieving result: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
-
-
-@app.get("/api/v1/report/{workflow_id}")
-async def get_report(workflow_id: str) -> FileResponse:
-    """Download workflow report"""
-    report_path = RESULTS_DIR / f"report_{workflow_id}.txt"
-    
-    if not report_path.exists():
-        raise HTTPException(status_code=404, detail="Report not found")
-    
-    return FileResponse(report_path, media_type="text/plain")
-
-
-# ============================================================================
-# HEALTH CHECK
-# ============================================================================
-
-@app.get("/api/v1/health")
-async def health_check() -> JSONResponse:
-    """Check API and component health"""
-    try:
-        if not workflow:
-            return JSONResponse({
-                "status": "degraded",
-                "message": "Workflow not initialized"
-            }, status_code=503)
-        
-        # Get component status from workflow
-        component_status = workflow.get_component_status()
-        
-        all_available = all(component_status.values())
-        
-        return JSONResponse({
-            "status": "healthy" if all_available else "degraded",
-            "message": "All systems operational" if all_available else "Some components unavailable",
-            "components": component_status,
-            "timestamp": datetime.now().isoformat()
-        })
-    except Exception as e:
-        logger.error(f"Health check error: {e}")
-        return JSONResponse({
-            "status": "error",
-            "message": f"Health check failed: {str(e)}"
-        }, status_code=500)
-
-
-# ============================================================================
-# ROOT ENDPOINT
-# ============================================================================
-
-@app.get("/")
-async def root() -> JSONResponse:
-    """API documentation"""
-    return JSONResponse({
-        "name": "Zero-Error Medication Management System",
-        "version": "1.0.0",
-        "description": "Complete medication verification pipeline",
-        "endpoints": {
-            "prescription": "/api/v1/analyze-prescription",
-            "pill": "/api/v1/verify-pill",
-            "intake": "/api/v1/verify-intake",
-            "complete": "/api/v1/complete-verification",
-            "health": "/api/v1/health"
-        }
-    })
-
-
-if __name__ == "__main__":
-    import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+"""
+Unified REST API for Complete Medication Verification System
+Exposes all 3 components through FastAPI endpoints.
+"""
+
+from fastapi import FastAPI, UploadFile, File, HTTPException, BackgroundTasks, WebSocket, WebSocketDisconnect
+from fastapi.responses import JSONResponse, FileResponse, StreamingResponse
+from pydantic import BaseModel
+from typing import Optional, List, Dict
+import asyncio
+import logging
+import os
+import time
+import uuid
+from datetime import datetime
+import json
+from pathlib import Path
+import shutil
+import gc
+
+import config
+from concurrent_workflow import ConcurrentVerificationRunner
+from inference_executor import InferenceExecutor, QueueFullError
+from workflow_jobs import WorkflowJobStore, JobStatus
+from upload_utils import save_upload
+from model_registry import ModelRegistry
+
+try:
+    from src.integration_engine import MedicationVerificationWorkflow
+    INTEGRATION_AVAILABLE = True
+except ImportError:
+    INTEGRATION_AVAILABLE = False
+    class MedicationVerificationWorkflow:
+        """Fallback mock workflow when components unavailable"""
+        def __init__(self):
+            self.components_loaded = {
+                'prescription_digitizer': False,
+                'pill_authenticator': False,
+                'intake_verifier': False
+            }
+        def get_component_status(self):
+            return self.components_loaded
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Optional features: a missing dependency disables only the feature that needs it
+try:
+    from streaming_intake import StreamingIntakeVerifier
+    STREAMING_INTAKE_AVAILABLE = True
+except ImportError as e:
+    STREAMING_INTAKE_AVAILABLE = False
+    logger.warning(f"⚠️  Streaming intake decode unavailable: {e}")
+
+try:
+    from live_intake import LiveIntakeSession, decode_frame
+    LIVE_INTAKE_AVAILABLE = True
+except ImportError as e:
+    LIVE_INTAKE_AVAILABLE = False
+    logger.warning(f"⚠️  Live intake WebSocket unavailable: {e}")
+
+try:
+    from batched_pill_classifier import BatchedPillClassifier, summarize_heads
+    PILL_BATCHING_AVAILABLE = True
+except ImportError as e:
+    PILL_BATCHING_AVAILABLE = False
+    logger.warning(f"⚠️  Pill micro-batching unavailable: {e}")
+
+try:
+    from onnx_backend import (
+        apply_backend, accelerate_pill_classifier, accelerate_action_recognizer
+    )
+    ONNX_BACKEND_AVAILABLE = True
+except ImportError as e:
+    ONNX_BACKEND_AVAILABLE = False
+    logger.warning(f"⚠️  ONNX Runtime backend unavailable: {e}")
+
+# Initialize FastAPI
+app = FastAPI(
+    title="Zero-Error Medication Management System",
+    description="Unified API for prescription analysis, pill verification, and intake verification",
+    version="1.0.0"
+)
+
+# Initialize workflow engine (will be loaded once at startup)
+workflow = None
+
+# Runs the three components in parallel (None when disabled in config)
+concurrent_runner = None
+
+# Micro-batching front-end of workflow.pill_classifier for /verify-pill (None when
+# disabled in config); the workflow itself keeps the unwrapped classifier
+pill_batcher = None
+
+# Worker pool and job tracking for complete-verification workflows
+workflow_executor = InferenceExecutor(thread_name_prefix="workflow")
+workflow_jobs = WorkflowJobStore(workflow_executor)
+
+# Frame processing for live intake sessions (each session has at most one frame in flight)
+live_intake_executor = InferenceExecutor(
+    max_workers=config.LIVE_INTAKE_WORKERS,
+    max_queue_size=config.LIVE_INTAKE_MAX_SESSIONS,
+    thread_name_prefix="live-intake"
+)
+
+# Storage paths
+UPLOAD_DIR = Path("data/uploads")
+RESULTS_DIR = Path("data/results")
+UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
+RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+
+
+# ============================================================================
+# DATA MODELS
+# ============================================================================
+
+class AnalysisPrescriptionRequest(BaseModel):
+    """Request model for prescription analysis"""
+    patient_id: str
+    notes: Optional[str] = None
+
+
+class VerifyPillRequest(BaseModel):
+    """Request model for pill verification"""
+    patient_id: str
+    medication_id: str
+
+
+class VerifyIntakeRequest(BaseModel):
+    """Request model for intake verification"""
+    patient_id: str
+    medication_id: str
+
+
+class BatchProcessRequest(BaseModel):
+    """Request model for batch processing"""
+    patient_id: str
+    medication_id: str
+    notes: Optional[str] = None
+
+
+class WorkflowResponse(BaseModel):
+    """Response model for workflow results"""
+    workflow_id: str
+    patient_id: str
+    medication_id: str
+    status: str
+    confidence: float
+    valid: bool
+    message: str
+
+
+# ============================================================================
+# STARTUP/SHUTDOWN
+# ============================================================================
+
+def _on_workflow_loaded(loaded_workflow):
+    """Publish the workflow to request handlers once its models are loaded."""
+    global workflow, concurrent_runner, pill_batcher
+    status = loaded_workflow.get_component_status()
+    
+    logger.info("✓ Component Status:")
+    logger.info(f"  - Prescription Digitizer: {'✅ Available' if status.get('prescription_digitizer') else '⚠️  Unavailable'}")
+    logger.info(f"  - Pill Authenticator: {'✅ Available' if status.get('pill_authenticator') else '⚠️  Unavailable'}")
+    logger.info(f"  - Intake Verifier: {'✅ Available' if status.get('intake_verifier') else '⚠️  Unavailable'}")
+    logger.info("=" * 70)
+    
+    if INTEGRATION_AVAILABLE and ONNX_BACKEND_AVAILABLE:
+        apply_backend('pill_classifier', config.PILL_CLASSIFIER_BACKEND,
+                      accelerate_pill_classifier, loaded_workflow.pill_classifier)
+        apply_backend('action_recognizer', config.ACTION_RECOGNIZER_BACKEND,
+                      accelerate_action_recognizer,
+                      getattr(loaded_workflow.intake_verifier, 'action_recognizer', None))
+    
+    if (config.INTAKE_STREAMING_DECODE and INTEGRATION_AVAILABLE and STREAMING_INTAKE_AVAILABLE
+            and loaded_workflow.intake_verifier):
+        loaded_workflow.intake_verifier = StreamingIntakeVerifier(
+            loaded_workflow.intake_verifier, roi_cascade=config.INTAKE_ROI_CASCADE
+        )
+        logger.info("🎞️  Streaming video decode enabled for intake verification")
+    
+    if (config.PILL_MICRO_BATCHING and INTEGRATION_AVAILABLE and PILL_BATCHING_AVAILABLE
+            and loaded_workflow.pill_classifier):
+        pill_batcher = BatchedPillClassifier(
+            loaded_workflow.pill_classifier,
+            batch_size=config.PILL_BATCH_SIZE,
+            max_wait_ms=config.PILL_BATCH_WAIT_MS
+        )
+        logger.info("📦 Micro-batching enabled for pill classification")
+    
+    if config.WORKFLOW_CONCURRENT_COMPONENTS and INTEGRATION_AVAILABLE:
+        concurrent_runner = ConcurrentVerificationRunner(
+            loaded_workflow, max_workers=3 * workflow_executor.max_workers
+        )
+        logger.info("⚡ Concurrent component execution enabled")
+    
+    workflow = loaded_workflow
+
+
+# Component models load off the request path (see config.MODEL_LOADING)
+models = ModelRegistry()
+models.register('workflow', MedicationVerificationWorkflow, on_load=_on_workflow_loaded)
+
+if config.MODEL_LOADING == 'preload':
+    # Load before gunicorn --preload forks so workers share the weights copy-on-write
+    models.load_all()
+    gc.freeze()
+
+
+@app.on_event("startup")
+async def startup_event():
+    """Start component warm-up without blocking the server from binding"""
+    logger.info("=" * 70)
+    logger.info("ZERO-ERROR MEDICATION MANAGEMENT SYSTEM - API SERVER")
+    logger.info("=" * 70)
+    logger.info("🚀 Starting API server on http://0.0.0.0:8000")
+    logger.info("📚 API documentation: http://localhost:8000/docs")
+    
+    if not models.is_ready():
+        logger.info("📦 Warming up medication verification workflow in the background...")
+        models.warm_up()
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Cleanup on shutdown"""
+    logger.info("🛑 Shutting down API server...")
+    workflow_executor.shutdown(wait=False)
+    live_intake_executor.shutdown(wait=False)
+    if concurrent_runner:
+        concurrent_runner.shutdown(wait=False)
+    if pill_batcher:
+        pill_batcher.shutdown()
+    logger.info("Goodbye! 👋")
+
+
+# ============================================================================
+# COMPONENT 1: PRESCRIPTION ANALYSIS
+# ============================================================================
+
+@app.post("/api/v1/analyze-prescription")
+async def analyze_prescription(
+    patient_id: str,
+    file: UploadFile = File(...),
+    notes: Optional[str] = None
+) -> JSONResponse:
+    """
+    Analyze prescription image (Component 1)
+    
+    Args:
+        patient_id: Patient identifier
+        file: Prescription image file (JPG/PNG)
+        notes: Additional notes
+        
+    Returns:
+        Analysis results with extracted medications
+    """
+    if not workflow or not workflow.prescription_digitizer:
+        raise HTTPException(
+            status_code=503,
+            detail="Prescription digitizer not available"
+        )
+    
+    try:
+        # Save uploaded file
+        file_id = str(uuid.uuid4())
+        file_path = UPLOAD_DIR / f"prescription_{file_id}.jpg"
+        saved = await save_upload(file, file_path, config.MAX_IMAGE_UPLOAD_BYTES)
+        
+        logger.info(f"Analyzing prescription for patient {patient_id}")
+        
+        # Process prescription (the digitizer's result cache answers re-uploads,
+        # keyed by image content and its full pipeline configuration)
+        result = workflow.prescription_digitizer.process_prescription(
+            str(file_path), content_hash=saved.sha256
+        )
+        
+        return JSONResponse({
+            "status": "success",
+            "patient_id": patient_id,
+            "file_id": file_id,
+            "analysis": result,
+            "cache_hit": bool(result.get("cache_hit")),
+            "timestamp": datetime.now().isoformat()
+        })
+    
+    except HTTPException:
+        raise
+    
+    except Exception as e:
+        logger.error(f"Prescription analysis error: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+# ============================================================================
+# COMPONENT 2: PILL VERIFICATION
+# ============================================================================
+
+@app.post("/api/v1/verify-pill")
+async def verify_pill(
+    patient_id: str,
+    medication_id: str,
+    file: UploadFile = File(...),
+    prescription_file_id: Optional[str] = None
+) -> JSONResponse:
+    """
+    Verify pill image against prescription (Component 2)
+    
+    Args:
+        patient_id: Patient identifier
+        medication_id: Medication identifier
+        file: Pill image file (JPG/PNG)
+        prescription_file_id: ID of prescription file for cross-reference
+        
+    Returns:
+        Verification results with shape/color/imprint analysis
+    """
+    if not workflow or not workflow.pill_classifier:
+        raise HTTPException(
+            status_code=503,
+            detail="Pill authenticator not available"
+        )
+    
+    try:
+        # Save uploaded file
+        file_id = str(uuid.uuid4())
+        file_path = UPLOAD_DIR / f"pill_{file_id}.jpg"
+        await save_upload(file, file_path, config.MAX_IMAGE_UPLOAD_BYTES)
+        
+        logger.info(f"Verifying pill for patient {patient_id}, medication {medication_id}")
+        
+        # Verify pill (batched with concurrent requests when micro-batching is enabled)
+        if pill_batcher:
+            result = await pill_batcher.predict_async(str(file_path))
+        else:
+            result = workflow.pill_classifier.predict(str(file_path))
+        # Both paths return PillClassifier.predict output; report the top class per head
+        if PILL_BATCHING_AVAILABLE and any(key.endswith('_probs') for key in result):
+            result = summarize_heads(result)
+        
+        # Check if authenticated
+        shape_conf = result.get('shape', {}).get('confidence', 0)
+        color_conf = result.get('color', {}).get('confidence', 0)
+        imprint_conf = result.get('imprint', {}).get('confidence', 0)
+        overall_conf = (shape_conf + color_conf + imprint_conf) / 3
+        
+        authenticated = overall_conf > 0.85
+        
+        return JSONResponse({
+            "status": "success",
+            "patient_id": patient_id,
+            "medication_id": medication_id,
+            "file_id": file_id,
+            "verification": result,
+            "authenticated": authenticated,
+            "confidence": float(overall_conf),
+            "timestamp": datetime.now().isoformat()
+        })
+    
+    except HTTPException:
+        raise
+    
+    except Exception as e:
+        logger.error(f"Pill verification error: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+# ============================================================================
+# COMPONENT 3: INTAKE VERIFICATION
+# ============================================================================
+
+@app.post("/api/v1/verify-intake")
+async def verify_intake(
+    patient_id: str,
+    medication_id: str,
+    file: UploadFile = File(...),
+    prescription_file_id: Optional[str] = None,
+    pill_file_id: Optional[str] = None
+) -> JSONResponse:
+    """
+    Verify medication intake from video (Component 3)
+    
+    Args:
+        patient_id: Patient identifier
+        medication_id: Medication identifier
+        file: Video file (MP4/MOV/AVI)
+        prescription_file_id: ID of prescription file
+        pill_file_id: ID of pill image file
+        
+    Returns:
+        Verification results with pill/hand/swallowing detection
+    """
+    if not workflow or not workflow.intake_verifier:
+        raise HTTPException(
+            status_code=503,
+            detail="Intake verifier not available"
+        )
+    
+    try:
+        # Save uploaded file
+        file_id = str(uuid.uuid4())
+        file_ext = Path(file.filename).suffix
+        file_path = UPLOAD_DIR / f"intake_{file_id}{file_ext}"
+        await save_upload(file, file_path, config.MAX_VIDEO_UPLOAD_BYTES)
+        
+        logger.info(f"Verifying intake for patient {patient_id}, medication {medication_id}")
+        
+        # Verify intake
+        result = workflow.intake_verifier.verify_video(str(file_path))
+        
+        return JSONResponse({
+            "status": "success",
+            "patient_id": patient_id,
+            "medication_id": medication_id,
+            "file_id": file_id,
+            "verification": result.to_dict(),
+            "confirmed": result.final_status.value in ['confirmed', 'likely'],
+            "confidence": float(result.final_confidence),
+            "timestamp": datetime.now().isoformat()
+        })
+    
+    except HTTPException:
+        raise
+    
+    except Exception as e:
+        logger.error(f"Intake verification error: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+def _process_live_frame(session, data: bytes):
+    """Decode one encoded frame and add it to a live session."""
+    return session.process_frame(decode_frame(data))
+
+
+@app.websocket("/api/v1/live-intake")
+async def live_intake(websocket: WebSocket, patient_id: str, medication_id: str):
+    """
+    Verify medication intake from a live camera stream (Component 3)
+    
+    The client sends each frame as a binary message (JPEG/PNG) and a text
+    message {"type": "end"} when done. The server pushes {"type": "event"}
+    as soon as an intake is recognized and {"type": "summary"} before
+    closing. If frames arrive faster than they are processed, the oldest
+    pending frames are dropped so feedback stays current.
+    
+    Args:
+        websocket: Client connection
+        patient_id: Patient identifier
+        medication_id: Medication identifier
+    """
+    await websocket.accept()
+    if not LIVE_INTAKE_AVAILABLE:
+        await websocket.close(code=1013, reason="Live intake not available")
+        return
+    if not workflow or not workflow.intake_verifier:
+        await websocket.close(code=1013, reason="Intake verifier not available")
+        return
+    
+    session = LiveIntakeSession(workflow.intake_verifier, session_id=str(uuid.uuid4()))
+    pending = asyncio.Queue(maxsize=config.LIVE_INTAKE_MAX_PENDING_FRAMES)
+    dropped = 0
+    disconnected = False
+    logger.info(f"Live intake session {session.session_id} for patient {patient_id}, medication {medication_id}")
+    
+    async def receive_frames():
+        nonlocal dropped, disconnected
+        while True:
+            message = await websocket.receive()
+            if message['type'] == 'websocket.disconnect':
+                disconnected = True
+                break
+            if message.get('bytes') is not None:
+                if pending.full():
+                    pending.get_nowait()
+                    dropped += 1
+                pending.put_nowait((message['bytes'], time.time()))
+            elif message.get('text'):
+                try:
+                    if json.loads(message['text']).get('type') == 'end':
+                        break
+                except (ValueError, AttributeError):
+                    pass
+        await pending.put(None)
+    
+    receiver = asyncio.create_task(receive_frames())
+    try:
+        while True:
+            item = await pending.get()
+            if item is None:
+                break
+            data, received_at = item
+            
+            try:
+                event = await live_intake_executor.run(_process_live_frame, session, data)
+            except QueueFullError:
+                dropped += 1
+                continue
+            except ValueError as e:
+                await websocket.send_json({"type": "error", "message": str(e)})
+                continue
+            
+            if event is not None:
+                await websocket.send_json({
+                    "type": "event",
+                    "patient_id": patient_id,
+                    "medication_id": medication_id,
+                    "frame_id": session.frames_processed - 1,
+                    "event": event.to_dict(),
+                    "confirmed": event.status.value in ['confirmed', 'likely'],
+                    "confidence": float(event.final_confidence),
+                    "latency_ms": (time.time() - received_at) * 1000,
+                    "timestamp": datetime.now().isoformat()
+                })
+        
+        if not disconnected:
+            await websocket.send_json({"type": "summary", **session.summary(), "frames_dropped": dropped})
+            await websocket.close()
+    
+    except WebSocketDisconnect:
+        logger.info(f"Live intake session {session.session_id} disconnected")
+    
+    finally:
+        receiver.cancel()
+
+
+# ============================================================================
+# UNIFIED WORKFLOW
+# ============================================================================
+
+def _run_complete_workflow(
+    workflow_id: str,
+    patient_id: str,
+    prescription_path: Path,
+    pill_path: Optional[Path],
+    intake_path: Optional[Path]
+) -> Dict:
+    """Run the unified workflow and persist its result and report (blocking)."""
+    logger.info(f"Processing complete workflow {workflow_id} for patient {patient_id}")
+    
+    runner = concurrent_runner or workflow
+    result = runner.process_medication_verification(
+        patient_id=patient_id,
+        prescription_image_path=str(prescription_path),
+        pill_image_path=str(pill_path) if pill_path else None,
+        intake_video_path=str(intake_path) if intake_path else None
+    )
+    
+    # Save result
+    result_path = RESULTS_DIR / f"workflow_{workflow_id}.json"
+    with open(result_path, "w") as f:
+        json.dump(result.to_dict(), f, indent=2)
+    
+    # Generate report
+    report = workflow.generate_report(result)
+    report_path = RESULTS_DIR / f"report_{workflow_id}.txt"
+    with open(report_path, "w") as f:
+        f.write(report)
+    
+    return {
+        "result": {
+            "final_status": result.final_status,
+            "confidence": float(result.overall_confidence),
+            "valid": result.is_valid,
+            "reasoning": result.reasoning
+        },
+        "result_file": str(result_path),
+        "report_file": str(report_path)
+    }
+
+
+@app.post("/api/v1/complete-verification")
+async def complete_verification(
+    patient_id: str,
+    background_tasks: BackgroundTasks,
+    prescription_file: UploadFile = File(...),
+    pill_file: Optional[UploadFile] = File(None),
+    intake_file: Optional[UploadFile] = File(None),
+    notes: Optional[str] = None,
+    async_mode: bool = False
+) -> JSONResponse:
+    """
+    Complete unified medication verification workflow
+    
+    All 3 components in one request:
+    1. Prescription analysis
+    2. Pill verification
+    3. Intake verification
+    
+    Args:
+        patient_id: Patient identifier
+        prescription_file: Prescription image
+        pill_file: Pill image (optional)
+        intake_file: Intake video (optional)
+        notes: Additional notes
+        async_mode: Return a workflow_id immediately and run in the background;
+            poll /api/v1/result/{workflow_id} or stream
+            /api/v1/result/{workflow_id}/events for progress
+        
+    Returns:
+        Complete workflow results, or the accepted job when async_mode is set
+    """
+    if not workflow:
+        raise HTTPException(
+            status_code=503,
+            detail="Workflow not available"
+        )
+    
+    try:
+        workflow_id = str(uuid.uuid4())
+        
+        # Save files
+        prescription_path = UPLOAD_DIR / f"prescription_{workflow_id}.jpg"
+        await save_upload(prescription_file, prescription_path, config.MAX_IMAGE_UPLOAD_BYTES)
+        
+        pill_path = None
+        if pill_file:
+            pill_path = UPLOAD_DIR / f"pill_{workflow_id}.jpg"
+            await save_upload(pill_file, pill_path, config.MAX_IMAGE_UPLOAD_BYTES)
+        
+        intake_path = None
+        if intake_file:
+            intake_ext = Path(intake_file.filename).suffix
+            intake_path = UPLOAD_DIR / f"intake_{workflow_id}{intake_ext}"
+            await save_upload(intake_file, intake_path, config.MAX_VIDEO_UPLOAD_BYTES)
+        
+        if async_mode:
+            job = workflow_jobs.submit(
+                workflow_id,
+                lambda: _run_complete_workflow(
+                    workflow_id, patient_id, prescription_path, pill_path, intake_path
+                ),
+                patient_id=patient_id
+            )
+            
+            return JSONResponse({
+                "status": "accepted",
+                "workflow_id": workflow_id,
+                "patient_id": patient_id,
+                "job_status": job['status'],
+                "result_url": f"/api/v1/result/{workflow_id}",
+                "events_url": f"/api/v1/result/{workflow_id}/events",
+                "timestamp": datetime.now().isoformat()
+            }, status_code=202)
+        
+        # Process workflow off the event loop
+        outcome = await workflow_executor.run(
+            _run_complete_workflow,
+            workflow_id, patient_id, prescription_path, pill_path, intake_path
+        )
+        
+        return JSONResponse({
+            "status": "success",
+            "workflow_id": workflow_id,
+            "patient_id": patient_id,
+            **outcome,
+            "timestamp": datetime.now().isoformat()
+        })
+    
+    except QueueFullError as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "5"})
+    
+    except HTTPException:
+        raise
+    
+    except Exception as e:
+        logger.error(f"Workflow error: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+# ============================================================================
+# RETRIEVAL ENDPOINTS
+# ============================================================================
+
+@app.get("/api/v1/result/{workflow_id}")
+async def get_result(workflow_id: str) -> JSONResponse:
+    """Retrieve workflow result (202 with job status while still running)"""
+    result_path = RESULTS_DIR / f"workflow_{workflow_id}.json"
+    
+    if not result_path.exists():
+        job = workflow_jobs.get(workflow_id)
+        if job is None:
+            raise HTTPException(status_code=404, detail="Result not found")
+        
+        if job['status'] == JobStatus.FAILED.value:
+            return JSONResponse(job, status_code=500)
+        
+        # Queued or running (or finished but result not yet visible on disk)
+        return JSONResponse(job, status_code=202)
+    
+    try:
+        with open(result_path) as f:
+            result = json.load(f)
+        
+        return JSONResponse(result)
+    
+    except Exception as e:
+        logger.error(f"Error retrieving result: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.get("/api/v1/result/{workflow_id}/events")
+async def stream_result_events(workflow_id: str) -> StreamingResponse:
+    """Stream workflow job status changes as server-sent events"""
+    if workflow_jobs.get(workflow_id) is None:
+        raise HTTPException(status_code=404, detail="Workflow not found")
+    
+    return StreamingResponse(
+        workflow_jobs.stream_events(workflow_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"}
+    )
+
+
+@app.get("/api/v1/report/{workflow_id}")
+async def get_report(workflow_id: str) -> FileResponse:
+    """Download workflow report"""
+    report_path = RESULTS_DIR / f"report_{workflow_id}.txt"
+    
+    if not report_path.exists():
+        raise HTTPException(status_code=404, detail="Report not found")
+    
+    return FileResponse(report_path, media_type="text/plain")
+
+
+# ============================================================================
+# HEALTH CHECK
+# ============================================================================
+
+@app.get("/api/v1/health")
+async def health_check() -> JSONResponse:
+    """Check API and component health"""
+    try:
+        if not workflow:
+            failed = models.has_failures()
+            return JSONResponse({
+                "status": "failed" if failed else "warming_up",
+                "message": "Workflow failed to load" if failed else "Workflow not initialized",
+                "models": models.status()
+            }, status_code=503)
+        
+        # Get component status from workflow
+        component_status = workflow.get_component_status()
+        
+        all_available = all(component_status.values())
+        prescription_cache = getattr(workflow.prescription_digitizer, 'result_cache', None)
+        
+        return JSONResponse({
+            "status": "healthy" if all_available else "degraded",
+            "message": "All systems operational" if all_available else "Some components unavailable",
+            "components": component_status,
+            "models": models.status(),
+            "workflow_pool": workflow_executor.get_statistics(),
+            "workflow_jobs": workflow_jobs.get_statistics(),
+            "live_intake_pool": live_intake_executor.get_statistics(),
+            "pill_batching": pill_batcher.get_statistics() if pill_batcher else None,
+            "prescription_cache": prescription_cache.get_statistics() if prescription_cache else None,
+            "timestamp": datetime.now().isoformat()
+        })
+    except Exception as e:
+        logger.error(f"Health check error: {e}")
+        return JSONResponse({
+            "status": "error",
+            "message": f"Health check failed: {str(e)}"
+        }, status_code=500)
+
+
+# ============================================================================
+# ROOT ENDPOINT
+# ============================================================================
+
+@app.get("/")
+async def root() -> JSONResponse:
+    """API documentation"""
+    return JSONResponse({
+        "name": "Zero-Error Medication Management System",
+        "version": "1.0.0",
+        "description": "Complete medication verification pipeline",
+        "endpoints": {
+            "prescription": "/api/v1/analyze-prescription",
+            "pill": "/api/v1/verify-pill",
+            "intake": "/api/v1/verify-intake",
+            "live_intake": "/api/v1/live-intake (WebSocket)",
+            "complete": "/api/v1/complete-verification",
+            "health": "/api/v1/health"
+        }
+    })
+
+
+if __name__ == "__main__":
+    import uvicorn
+    uvicorn.run(app, host="0.0.0.0", port=8000)
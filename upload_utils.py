@@ -0,0 +1,79 @@
+"""
+Streaming upload handling for the API servers.
+Uploads are copied to disk in fixed-size chunks with the SHA-256 computed
+on the fly and rejected with 413 once they pass the endpoint's limit, so
+large intake videos never sit in worker memory.
+"""
+
+import hashlib
+import os
+from dataclasses import dataclass
+from typing import Optional
+
+from fastapi import HTTPException, UploadFile
+
+import config
+
+
+@dataclass
+class SavedUpload:
+    """An upload written to disk."""
+    path: str
+    sha256: str
+    size: int
+
+
+async def save_upload(upload: UploadFile, dest_path: str, max_bytes: int,
+                      chunk_size: Optional[int] = None) -> SavedUpload:
+    """
+    Stream an UploadFile to disk.
+
+    Starlette has already spooled the request body (to memory below 1 MB,
+    to a temporary file above) by the time a handler runs, so the limit
+    bounds what is copied and kept, not what the client may send; cap the
+    request size itself at the proxy. Callers pass the returned ``sha256``
+    on (e.g. to PrescriptionDigitizer.process_prescription) instead of
+    hashing the file again.
+
+    Args:
+        upload: Incoming multipart file
+        dest_path: Where to write the file
+        max_bytes: Size limit for this endpoint
+        chunk_size: Bytes read per chunk (defaults to config.UPLOAD_CHUNK_SIZE)
+
+    Returns:
+        SavedUpload with the path, content hash and size
+
+    Raises:
+        HTTPException: 413 if the upload exceeds max_bytes
+    """
+    chunk_size = chunk_size or config.UPLOAD_CHUNK_SIZE
+    too_large = HTTPException(
+        status_code=413,
+        detail=f"Upload exceeds the {max_bytes // (1024 * 1024)} MB limit for this endpoint"
+    )
+
+    # Reject before copying when the part's size is known
+    declared = getattr(upload, 'size', None)
+    if declared is not None and declared > max_bytes:
+        raise too_large
+
+    digest = hashlib.sha256()
+    size = 0
+    try:
+        with open(dest_path, 'wb') as f:
+            while True:
+                chunk = await upload.read(chunk_size)
+                if not chunk:
+                    break
+                size += len(chunk)
+                if size > max_bytes:
+                    raise too_large
+                digest.update(chunk)
+                f.write(chunk)
+    except BaseException:
+        if os.path.exists(dest_path):
+            os.unlink(dest_path)
+        raise
+
+    return SavedUpload(path=str(dest_path), sha256=digest.hexdigest(), size=size)
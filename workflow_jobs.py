@@ -0,0 +1,170 @@
+"""
+Background job tracking for long-running verification workflows.
+Lets the API accept a workflow, return its ID immediately and report
+progress through polling or server-sent events.
+"""
+
+import asyncio
+import json
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from enum import Enum
+from concurrent.futures import Future
+from typing import Any, AsyncIterator, Callable, Dict, Optional
+
+from inference_executor import InferenceExecutor
+
+
+class JobStatus(Enum):
+    """Lifecycle states of a submitted workflow job."""
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+    @property
+    def is_finished(self) -> bool:
+        return self in (JobStatus.COMPLETED, JobStatus.FAILED)
+
+
+class WorkflowJobStore:
+    """
+    Runs workflow jobs on an InferenceExecutor and tracks their status.
+
+    Job records are kept in memory; the largest ones (results and reports)
+    are written to disk by the job itself, so only bookkeeping lives here.
+    The oldest finished jobs are evicted once ``max_jobs`` is exceeded.
+    """
+
+    def __init__(self, executor: InferenceExecutor, max_jobs: int = 1000):
+        """
+        Initialize the job store.
+
+        Args:
+            executor: Bounded pool the jobs run on (sheds load when full)
+            max_jobs: Maximum job records retained in memory
+        """
+        self.executor = executor
+        self.max_jobs = max_jobs
+        self._jobs: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def submit(self, job_id: str, func: Callable[[], Dict], **metadata) -> Dict:
+        """
+        Schedule a blocking job and return its initial record.
+
+        The executor slot is reserved before this returns, so concurrent
+        submissions cannot overshoot its capacity. Raises QueueFullError if
+        the executor is saturated.
+
+        Args:
+            job_id: Identifier clients will poll with
+            func: Blocking callable returning the job's result payload
+            metadata: Extra fields stored on the job record
+        """
+        record = {
+            'workflow_id': job_id,
+            'status': JobStatus.QUEUED.value,
+            'submitted_at': datetime.now().isoformat(),
+            'started_at': None,
+            'finished_at': None,
+            'result': None,
+            'error': None,
+            **metadata
+        }
+        # Registered first so the worker's status updates always find the record
+        with self._lock:
+            self._jobs[job_id] = record
+            snapshot = dict(record)
+
+        try:
+            future = self.executor.submit(self._run_job, job_id, func)
+        except Exception:
+            with self._lock:
+                self._jobs.pop(job_id, None)
+            raise
+        future.add_done_callback(lambda f: self._on_done(job_id, f))
+
+        with self._lock:
+            self._evict_finished()
+        return snapshot
+
+    def _on_done(self, job_id: str, future: Future):
+        # Covers jobs cancelled by an executor shutdown before they started
+        if future.cancelled():
+            self._update(job_id, status=JobStatus.FAILED.value, error="Job cancelled",
+                         finished_at=datetime.now().isoformat())
+
+    def _run_job(self, job_id: str, func: Callable[[], Dict]):
+        self._update(job_id, status=JobStatus.RUNNING.value,
+                     started_at=datetime.now().isoformat())
+        try:
+            result = func()
+            self._update(job_id, status=JobStatus.COMPLETED.value, result=result,
+                         finished_at=datetime.now().isoformat())
+        except Exception as e:
+            self._update(job_id, status=JobStatus.FAILED.value, error=str(e),
+                         finished_at=datetime.now().isoformat())
+
+    def _update(self, job_id: str, **fields):
+        with self._lock:
+            if job_id in self._jobs:
+                self._jobs[job_id].update(fields)
+
+    def _evict_finished(self):
+        excess = len(self._jobs) - self.max_jobs
+        if excess <= 0:
+            return
+        for job_id in [jid for jid, job in self._jobs.items()
+                       if JobStatus(job['status']).is_finished][:excess]:
+            del self._jobs[job_id]
+
+    def get(self, job_id: str) -> Optional[Dict]:
+        """Return a snapshot of a job record, or None if unknown."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return dict(job) if job else None
+
+    async def stream_events(self, job_id: str, poll_interval: float = 0.5,
+                            keepalive_interval: float = 15.0) -> AsyncIterator[str]:
+        """
+        Yield server-sent events for a job until it finishes.
+
+        An event is sent whenever the status changes; comment lines keep
+        idle connections open through proxies.
+        """
+        last_status = None
+        idle = 0.0
+
+        while True:
+            job = self.get(job_id)
+            if job is None:
+                yield _sse('error', {'workflow_id': job_id, 'error': 'Unknown workflow'})
+                return
+
+            if job['status'] != last_status:
+                last_status = job['status']
+                idle = 0.0
+                yield _sse('status', job)
+                if JobStatus(last_status).is_finished:
+                    return
+            elif idle >= keepalive_interval:
+                idle = 0.0
+                yield ": keepalive\n\n"
+
+            await asyncio.sleep(poll_interval)
+            idle += poll_interval
+
+    def get_statistics(self) -> Dict[str, int]:
+        """Count jobs by status."""
+        with self._lock:
+            counts = {status.value: 0 for status in JobStatus}
+            for job in self._jobs.values():
+                counts[job['status']] += 1
+        return counts
+
+
+def _sse(event: str, data: Dict) -> str:
+    """Format a server-sent event."""
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"